@@ -1,5 +1,7 @@
 import json
 import uuid
+from pathlib import Path
+
 import httpx
 import typer
 from rich import print
@@ -8,6 +10,32 @@ APP = typer.Typer(help="A2A JSON-RPC client")
 BASE_URL = "http://localhost:8000"
 
 
+def build_message(text: str, agent_id: str) -> dict:
+    """Build a JSON-RPC message/send request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": "message/send",
+        "params": {
+            "message": {
+                "role": "user",
+                "kind": "message",
+                "messageId": str(uuid.uuid4()),
+                "parts": [{"kind": "text", "text": text}],
+                "metadata": {"agent_id": agent_id},
+            }
+        }
+    }
+
+
+def response_text(response: dict) -> str:
+    """Join the text parts of a task's artifacts (or return the error message)."""
+    if "error" in response:
+        return f"error {response['error'].get('code')}: {response['error'].get('message')}"
+    artifacts = response.get("result", {}).get("artifacts", [])
+    return "".join(part.get("text", "") for artifact in artifacts for part in artifact.get("parts", []))
+
+
 @APP.command()
 def card():
     """Fetch agent card from /.well-known/agent.json"""
@@ -20,17 +48,7 @@ def card():
 def send(text: str = typer.Option(..., help="text content"),
          agent_id: str = typer.Option("dynamic", help="subagent id")):
     """Send a JSON-RPC message to /a2a."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": "message",
-        "params": {
-            "message": {
-                "content": {"type": "text", "text": text}
-            },
-            "metadata": {"agent_id": agent_id}
-        }
-    }
+    payload = build_message(text, agent_id)
     url = f"{BASE_URL}/a2a"
     r = httpx.post(url, json=payload)
     try:
@@ -39,5 +57,33 @@ def send(text: str = typer.Option(..., help="text content"),
         print(r.text)
 
 
+@APP.command("send-batch")
+def send_batch(file: Path = typer.Argument(..., exists=True, dir_okay=False, help="file with one prompt per line"),
+               agent_id: str = typer.Option("dynamic", help="subagent id"),
+               batch_size: int = typer.Option(50, min=1, help="messages per JSON-RPC batch request"),
+               timeout: float = typer.Option(120.0, help="HTTP timeout in seconds")):
+    """Send every prompt in FILE to /a2a as JSON-RPC batches (one HTTP request per batch)."""
+    prompts = [line.strip() for line in file.read_text(encoding="utf-8").splitlines() if line.strip()]
+    url = f"{BASE_URL}/a2a"
+    with httpx.Client(timeout=timeout) as client:
+        for start in range(0, len(prompts), batch_size):
+            chunk = prompts[start:start + batch_size]
+            payload = [build_message(text, agent_id) for text in chunk]
+            r = client.post(url, json=payload)
+            try:
+                body = r.json()
+            except Exception:
+                print(r.text)
+                raise typer.Exit(1)
+            if isinstance(body, dict):
+                # Batch rejected as a whole (e.g. larger than the server allows)
+                print(body)
+                raise typer.Exit(1)
+            by_id = {response.get("id"): response for response in body}
+            for text, request in zip(chunk, payload):
+                response = by_id.get(request["id"], {"error": {"message": "no response"}})
+                typer.echo(json.dumps({"prompt": text, "response": response_text(response)}, ensure_ascii=False))
+
+
 if __name__ == "__main__":
     APP()
@@ -1,39 +1,62 @@
 import asyncio
 import json
+import sys
+from pathlib import Path
 import typer
 from rich import print
 import httpx
 
+# Usa o cache de geocodificação do projeto quando src/ estiver disponível
+# (com GEOCODING_CACHE_REDIS_ENABLED=true ele persiste entre execuções)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+try:
+    from infrastructure.adapters.outbound.http_client import close_http_client, get_http_client
+    from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+    GEOCODING_CACHE_AVAILABLE = True
+except ImportError:
+    GEOCODING_CACHE_AVAILABLE = False
+
 APP = typer.Typer(help="fastMCP client (calling HTTP endpoints of Weather MCP server)")
 BASE_URL = "https://api.open-meteo.com/v1/forecast"
 GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
 
 
-async def geocode(location: str):
-    async with httpx.AsyncClient() as client:
-        r = await client.get(GEOCODE_URL, params={"name": location, "count": 1, "language": "pt"})
-        r.raise_for_status()
-        data = r.json()
-        if not data.get("results"):
+async def geocode(location: str, client: httpx.AsyncClient):
+    if GEOCODING_CACHE_AVAILABLE:
+        res = await OpenMeteoWeatherAdapter(client=client).resolve_location(location)
+        if res is None:
             raise RuntimeError("Localização não encontrada")
-        res = data["results"][0]
-        return res["latitude"], res["longitude"], res.get("name"), res.get("country", "")
+        return res.latitude, res.longitude, res.name, res.country
+    r = await client.get(GEOCODE_URL, params={"name": location, "count": 1, "language": "pt"})
+    r.raise_for_status()
+    data = r.json()
+    if not data.get("results"):
+        raise RuntimeError("Localização não encontrada")
+    res = data["results"][0]
+    return res["latitude"], res["longitude"], res.get("name"), res.get("country", "")
 
 
 @APP.command()
 def weather(location: str = typer.Option(...), days: int = typer.Option(1)):
     async def _run():
-        lat, lon, name, country = await geocode(location)
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "temperature_2m,wind_speed_10m,weather_code",
-            "forecast_days": days,
-            "timezone": "auto"
-        }
-        async with httpx.AsyncClient() as client:
+        # Um cliente por execução: geocodificação e previsão reutilizam a conexão
+        client = get_http_client() if GEOCODING_CACHE_AVAILABLE else httpx.AsyncClient()
+        try:
+            lat, lon, name, country = await geocode(location, client)
+            params = {
+                "latitude": lat,
+                "longitude": lon,
+                "current": "temperature_2m,wind_speed_10m,weather_code",
+                "forecast_days": days,
+                "timezone": "auto"
+            }
             r = await client.get(BASE_URL, params=params)
             print({"location": f"{name}, {country}", "data": r.json()})
+        finally:
+            if GEOCODING_CACHE_AVAILABLE:
+                await close_http_client()
+            else:
+                await client.aclose()
     asyncio.run(_run())
 
 
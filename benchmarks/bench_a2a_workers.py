@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark de vazão do servidor A2A: 1 worker contra N workers.
+
+Sobe `python src/a2a_main.py` com A2A_WORKERS=1 e depois com N, e dispara
+requisições JSON-RPC message/send a partir de vários processos clientes
+(cada um com um event loop e várias conexões concorrentes). O ganho com N
+workers só aparece em máquinas com vários núcleos.
+
+Uso:
+    python benchmarks/bench_a2a_workers.py
+    python benchmarks/bench_a2a_workers.py --workers 4 --duration 10 --clients 4 --concurrency 32
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+
+PAYLOAD = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "message/send",
+    "params": {"message": {
+        "role": "user", "messageId": "bench", "kind": "message",
+        "parts": [{"kind": "text", "text": "calcule 12 * 7"}],
+    }},
+}
+
+
+async def load(url: str, duration: float, concurrency: int) -> int:
+    deadline = time.perf_counter() + duration
+    completed = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker() -> None:
+            nonlocal completed
+            while time.perf_counter() < deadline:
+                response = await client.post(url, json=PAYLOAD)
+                response.raise_for_status()
+                completed += 1
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return completed
+
+
+def client_process(url: str, duration: float, concurrency: int, results) -> None:
+    results.put(asyncio.run(load(url, duration, concurrency)))
+
+
+def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Servidor não respondeu em {timeout}s: {url}")
+
+
+def run_server(workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT / "src"),
+        "A2A_SERVER_HOST": "127.0.0.1",
+        "A2A_SERVER_PORT": str(port),
+        "A2A_WORKERS": str(workers),
+        "LOG_LEVEL": "WARNING",
+    }
+    return subprocess.Popen(
+        [sys.executable, str(ROOT / "src" / "a2a_main.py")],
+        env=env, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def measure(workers: int, port: int, duration: float, clients: int, concurrency: int) -> float:
+    server = run_server(workers, port)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(f"{base}/.well-known/agent-card.json")
+        # Aquecimento: todos os workers atendem antes da medição
+        asyncio.run(load(f"{base}/a2a", 1.0, concurrency))
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=client_process, args=(f"{base}/a2a", duration, concurrency, results))
+            for _ in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        completed = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        return completed / duration
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=2, help="processos geradores de carga")
+    parser.add_argument("--concurrency", type=int, default=16, help="conexões por processo cliente")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"cpus={os.cpu_count()} clients={args.clients}x{args.concurrency} duration={args.duration}s")
+    print(f"{'workers':>8} {'req/s':>10}")
+    print("-" * 19)
+    baseline = None
+    for workers in sorted({1, args.workers}):
+        throughput = measure(workers, args.port, args.duration, args.clients, args.concurrency)
+        baseline = baseline or throughput
+        print(f"{workers:>8} {throughput:>10.0f}  ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
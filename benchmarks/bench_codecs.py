@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos codecs de serialização (JSON vs. msgpack) para modelos de domínio.
+
+Compara tempo de encode/decode e tamanho em bytes para mensagens, tarefas e
+conversações de tamanhos realistas.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_codecs.py
+    PYTHONPATH=src python benchmarks/bench_codecs.py --sizes 10 100 --repeat 200
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import BaseModel
+
+from core.domain.models import AgentType, ConversationContext, Message, MessageType, Task
+from infrastructure.adapters.outbound.codecs import CODECS, MSGPACK_AVAILABLE, get_codec
+
+SAMPLE_TEXT = (
+    "Clima em São Paulo, Brasil: temperatura de 23.4°C, vento de 12.1 km/h, "
+    "parcialmente nublado. Previsão de pancadas de chuva no fim da tarde."
+)
+
+
+def build_message(index: int) -> Message:
+    return Message(
+        id=f"msg-{index:06d}",
+        content=SAMPLE_TEXT,
+        message_type=MessageType.TOOL_RESPONSE if index % 3 else MessageType.TEXT,
+        sender="weather-agent" if index % 2 else "user",
+        receiver="supervisor",
+        metadata={"conversation_id": "conv-bench", "turn": index, "tool": "get_weather", "latency_ms": 182.5},
+        timestamp=datetime(2024, 1, 1) + timedelta(seconds=index),
+    )
+
+
+def build_conversation(size: int) -> ConversationContext:
+    return ConversationContext(
+        id="conv-bench",
+        messages=[build_message(i) for i in range(size)],
+        current_agent="weather-agent",
+        metadata={"user": "bench", "locale": "pt-BR"},
+    )
+
+
+def measure(codec_name: str, model: BaseModel, repeat: int):
+    codec = get_codec(codec_name)
+    model_cls = type(model)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = codec.encode(model)
+    encode_us = (time.perf_counter() - start) * 1e6 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decoded = codec.decode(encoded, model_cls)
+    decode_us = (time.perf_counter() - start) * 1e6 / repeat
+
+    assert decoded == model
+    return encode_us, decode_us, len(encoded)
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    codecs = [name for name in CODECS if name != "msgpack" or MSGPACK_AVAILABLE]
+    cases = [
+        ("Message", build_message(0)),
+        ("Task", Task(id="task-bench", content=SAMPLE_TEXT, agent_type=AgentType.ACTION,
+                      metadata={"agent_id": "weather-1"})),
+    ] + [(f"Conversation[{size}]", build_conversation(size)) for size in sizes]
+
+    print(f"{'model':<20} {'codec':<8} {'bytes':>9} {'encode µs':>11} {'decode µs':>11}")
+    print("-" * 63)
+    for label, model in cases:
+        # Conversações grandes usam menos repetições para manter o tempo total razoável
+        case_repeat = max(1, repeat // max(1, len(getattr(model, "messages", [])) // 10))
+        baseline = None
+        for name in codecs:
+            encode_us, decode_us, size = measure(name, model, case_repeat)
+            ratio = f"({size / baseline:.0%})" if baseline else ""
+            baseline = baseline or size
+            print(f"{label:<20} {name:<8} {size:>9} {encode_us:>11.1f} {decode_us:>11.1f} {ratio}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
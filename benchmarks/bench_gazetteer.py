@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark do geocodificador offline (gazetteer mapeado em memória).
+
+Gera um gazetteer sintético do tamanho do cities1000 do GeoNames e mede o
+tempo por busca exata (lookup, com acerto e sem), por busca aproximada
+(closest, trigramas; só usada se a API remota falhar) e de abertura do
+arquivo.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_gazetteer.py
+    PYTHONPATH=src python benchmarks/bench_gazetteer.py --cities 20000 --lookups 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from infrastructure.adapters.outbound.gazetteer import Gazetteer, build_gazetteer
+
+SYLLABLES = ["sa", "o", "pau", "lo", "ri", "de", "ja", "nei", "ro", "be", "lo", "ho", "ri", "zon", "te",
+             "cu", "ri", "ti", "ba", "for", "ta", "le", "za", "ma", "na", "us", "re", "ci", "fe", "san"]
+
+
+def synthetic_name(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))).capitalize()
+
+
+def typo(name: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(name))
+    return name[:position] + rng.choice("aeiou") + name[position + 1:]
+
+
+def measure(search, queries, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - start) * 1e6 / (len(queries) * repeat)
+
+
+def run(cities: int, lookups: int) -> None:
+    rng = random.Random(42)
+    entries = [
+        (synthetic_name(rng), "País", "XX", rng.uniform(-60, 60), rng.uniform(-180, 180), rng.randint(1000, 10 ** 7))
+        for _ in range(cities)
+    ]
+    sample = [rng.choice(entries)[0] for _ in range(lookups)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gazetteer.bin")
+        start = time.perf_counter()
+        build_gazetteer(entries, path)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        gazetteer = Gazetteer(path, min_similarity=0.75)
+        open_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"cities={cities} file={os.path.getsize(path) / 1e6:.1f} MB "
+              f"build={build_seconds:.1f}s open={open_ms:.2f} ms")
+        print(f"{'lookup':<10} {'µs/op':>10}")
+        print("-" * 21)
+        typos = [typo(name, rng) + "x" for name in sample]
+        print(f"{'exact':<10} {measure(gazetteer.lookup, sample):>10.1f}")
+        print(f"{'miss':<10} {measure(gazetteer.lookup, typos):>10.1f}")
+        print(f"{'closest':<10} {measure(gazetteer.closest, typos):>10.1f}")
+        gazetteer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cities", type=int, default=150000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    run(args.cities, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
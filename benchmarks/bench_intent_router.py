@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark do roteamento de intenções do DynamicAgent.
+
+Compara o IntentRouter compilado com a cadeia de verificações
+(startswith / in / re.search) do DynamicAgent original, para um número
+crescente de intenções registradas.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_intent_router.py
+    PYTHONPATH=src python benchmarks/bench_intent_router.py --messages 2000 --sizes 10,100
+"""
+import argparse
+import random
+import re
+import time
+from typing import List, Optional
+
+from infrastructure.adapters.inbound.intent_router import ARITHMETIC_PATTERN, Intent, IntentRouter, fold
+
+WORDS = ["clima", "tempo", "agenda", "reuniao", "relatorio", "vendas", "estoque", "cliente", "pedido",
+         "fatura", "suporte", "senha", "acesso", "contrato", "projeto", "prazo", "equipe", "custo"]
+
+
+def synthetic_intents(size: int, rng: random.Random) -> List[Intent]:
+    intents = []
+    for i in range(size):
+        keywords = [f"{rng.choice(WORDS)}{i}", f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}"]
+        # Poucos padrões regex, como no uso real
+        patterns = [ARITHMETIC_PATTERN] if i == 0 else []
+        intents.append(Intent(name=f"intent-{i}", prefixes=[f"cmd{i}"], keywords=keywords,
+                              patterns=patterns, priority=rng.randint(0, 50)))
+    return intents
+
+
+class ChainRouter:
+    """Cadeia de verificações em ordem de prioridade, como no DynamicAgent original."""
+
+    def __init__(self, intents: List[Intent]) -> None:
+        self.intents = sorted(intents, key=lambda intent: -intent.priority)
+        self.patterns = {intent.name: [re.compile(p) for p in intent.patterns] for intent in intents}
+
+    def route(self, text: str) -> Optional[str]:
+        t = fold(text)
+        for intent in self.intents:
+            if any(t.startswith(prefix) for prefix in intent.prefixes):
+                return intent.name
+            if any(keyword in t for keyword in intent.keywords):
+                return intent.name
+            if any(pattern.search(t) for pattern in self.patterns[intent.name]):
+                return intent.name
+        return None
+
+
+def synthetic_messages(intents: List[Intent], count: int, rng: random.Random) -> List[str]:
+    messages = []
+    for _ in range(count):
+        filler = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 15)))
+        kind = rng.random()
+        if kind < 0.6:
+            messages.append(f"{filler} {rng.choice(rng.choice(intents).keywords)} {filler}")
+        elif kind < 0.8:
+            messages.append(f"quanto é {rng.randint(1, 99)} + {rng.randint(1, 99)}? {filler}")
+        else:
+            messages.append(filler)
+    return messages
+
+
+def measure(router, messages: List[str]) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        router.route(message)
+    return (time.perf_counter() - start) * 1e6 / len(messages)
+
+
+def run(messages: int, sizes: List[int]) -> None:
+    rng = random.Random(42)
+    print(f"{'intents':>8} {'compile ms':>11} {'compiled µs/msg':>16} {'chain µs/msg':>13}")
+    print("-" * 51)
+    for size in sizes:
+        intents = synthetic_intents(size, rng)
+        texts = synthetic_messages(intents, messages, rng)
+
+        start = time.perf_counter()
+        compiled = IntentRouter(intents)
+        compile_ms = (time.perf_counter() - start) * 1e3
+        chain = ChainRouter(intents)
+        print(f"{size:>8} {compile_ms:>11.1f} {measure(compiled, texts):>16.1f} {measure(chain, texts):>13.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--sizes", default="3,30,300,3000")
+    args = parser.parse_args()
+    run(args.messages, [int(size) for size in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
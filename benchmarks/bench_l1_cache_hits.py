@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark do custo de um acerto no cache L1 (CachedPersistenceAdapter).
+
+Compara, por acerto, as formas de devolver um objeto isolado do cache:
+deep copy do modelo, parse de um snapshot JSON e a cópia rasa com
+containers de primeiro nível próprios (a usada pelo adaptador).
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_l1_cache_hits.py
+    PYTHONPATH=src python benchmarks/bench_l1_cache_hits.py --ops 20000 --messages 100
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from core.domain.models import AgentType, ConversationContext, Message, Task
+from infrastructure.adapters.outbound.cached_persistence import CachedPersistenceAdapter
+from infrastructure.adapters.outbound.memory_adapter import InMemoryAdapter
+
+
+def time_per_op(ops: int, operation) -> float:
+    start = time.perf_counter()
+    for _ in range(ops):
+        operation()
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+async def time_hits(ops: int, operation) -> float:
+    start = time.perf_counter()
+    for _ in range(ops):
+        await operation()
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+async def run(ops: int, messages: int) -> None:
+    conversation = ConversationContext(id="bench-conv", metadata={"canal": "bench"}, messages=[
+        Message(id=f"c-{i}", content="x" * 200, sender="bench", metadata={"conversation_id": "bench-conv"})
+        for i in range(messages)
+    ])
+    task = Task(id="bench-task", content="x" * 200, agent_type=AgentType.ACTION, metadata={"origem": "bench"})
+
+    adapter = CachedPersistenceAdapter(InMemoryAdapter())
+    await adapter.save_conversation(conversation)
+    await adapter.save_task(task)
+
+    print(f"{'per hit (us)':<28} {'conversation(' + str(messages) + ')':>18} {'task':>10}")
+    print("-" * 58)
+    rows = {
+        "model_copy(deep=True)": lambda value: lambda: value.model_copy(deep=True),
+        "model_validate_json": lambda value: (
+            lambda snapshot: lambda: type(value).model_validate_json(snapshot)
+        )(value.model_dump_json()),
+        "detached (adapter)": lambda value: lambda: CachedPersistenceAdapter._detached(value),
+    }
+    for name, build in rows.items():
+        print(
+            f"{name:<28} {time_per_op(ops // 10, build(conversation)):>18.2f} "
+            f"{time_per_op(ops, build(task)):>10.2f}"
+        )
+    conversation_hit = await time_hits(ops // 10, lambda: adapter.get_conversation("bench-conv"))
+    task_hit = await time_hits(ops, lambda: adapter.get_task("bench-task"))
+    print(f"{'get_* hit (end to end)':<28} {conversation_hit:>18.2f} {task_hit:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    asyncio.run(run(args.ops, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração de localizações (autômato Aho-Corasick).
+
+Compara o LocationExtractor com uma busca ingênua (uma regex por nome
+conhecido) para dicionários de tamanhos crescentes. O custo do autômato
+depende do tamanho do texto, não do número de nomes.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_location_extractor.py
+    PYTHONPATH=src python benchmarks/bench_location_extractor.py --queries 2000 --sizes 100,1000
+"""
+import argparse
+import random
+import re
+import time
+from typing import Dict, List
+
+from agents.location_extractor import KNOWN_LOCATIONS, LocationExtractor, fold
+
+TEMPLATES = [
+    "Qual o clima em {0} hoje?",
+    "weather in {0} and {1} tomorrow",
+    "Vai chover no fim de semana em {0}? E em {1}?",
+    "previsão para {0}, {1} e {2} nesta semana",
+    "como está o tempo? estou viajando e quero saber se preciso de guarda-chuva",
+]
+
+
+def synthetic_locations(size: int, rng: random.Random) -> Dict[str, tuple]:
+    locations = dict(KNOWN_LOCATIONS)
+    while len(locations) < size:
+        name = "".join(rng.choice("bcdfglmnprstv") + rng.choice("aeiou") for _ in range(rng.randint(2, 4)))
+        locations[name.capitalize()] = ()
+    return locations
+
+
+class NaiveExtractor:
+    """Uma regex de palavra inteira por nome: custo proporcional ao dicionário."""
+
+    def __init__(self, locations: Dict[str, tuple]) -> None:
+        self.patterns = [
+            (re.compile(rf"\b{re.escape(fold(name)[0])}\b"), canonical)
+            for canonical, aliases in locations.items() for name in (canonical, *aliases)
+        ]
+
+    def extract(self, text: str) -> List[str]:
+        folded = fold(text)[0]
+        return [canonical for pattern, canonical in self.patterns if pattern.search(folded)]
+
+
+def measure(extractor, queries: List[str]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        extractor.extract(query)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def run(queries: int, sizes: List[int]) -> None:
+    rng = random.Random(42)
+    print(f"{'names':>8} {'build ms':>10} {'automaton q/s':>15} {'naive q/s':>12}")
+    print("-" * 48)
+    for size in sizes:
+        locations = synthetic_locations(size, rng)
+        names = list(locations)
+        texts = [rng.choice(TEMPLATES).format(*rng.sample(names, 3)) for _ in range(queries)]
+
+        start = time.perf_counter()
+        automaton = LocationExtractor(locations)
+        build_ms = (time.perf_counter() - start) * 1e3
+        naive = NaiveExtractor(locations)
+        naive_texts = texts[:max(1, queries // 10)]
+        print(f"{size:>8} {build_ms:>10.1f} {measure(automaton, texts):>15.0f} {measure(naive, naive_texts):>12.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--sizes", default="100,1000,10000")
+    args = parser.parse_args()
+    run(args.queries, [int(size) for size in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
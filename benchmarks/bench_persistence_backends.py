@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos backends de persistência: InMemoryAdapter vs. RedisAdapter.
+
+Mede operações por segundo nos caminhos quentes (mensagens, páginas,
+tarefas e conversações) em uso de processo único.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_persistence_backends.py
+    PYTHONPATH=src python benchmarks/bench_persistence_backends.py --fake --ops 2000
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from core.domain.models import AgentType, ConversationContext, Message, Task
+from infrastructure.adapters.outbound.memory_adapter import InMemoryAdapter
+from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+
+
+async def time_ops(label: str, ops: int, operation) -> float:
+    start = time.perf_counter()
+    for i in range(ops):
+        await operation(i)
+    elapsed = time.perf_counter() - start
+    return ops / elapsed
+
+
+async def bench_backend(adapter, ops: int):
+    results = {}
+    results["save_message"] = await time_ops("save_message", ops, lambda i: adapter.save_message(Message(
+        id=f"bench-msg-{i}", content="x" * 200, sender="bench", metadata={"conversation_id": "bench-conv"},
+    )))
+    results["get_messages_page(20)"] = await time_ops(
+        "page", ops, lambda i: adapter.get_messages_page("bench-conv", limit=20)
+    )
+    results["save_task"] = await time_ops("save_task", ops, lambda i: adapter.save_task(Task(
+        id=f"bench-task-{i}", content="x", agent_type=AgentType.ACTION,
+    )))
+    results["get_task"] = await time_ops("get_task", ops, lambda i: adapter.get_task(f"bench-task-{i}"))
+    results["get_pending_tasks(10)"] = await time_ops(
+        "pending", ops, lambda i: adapter.get_pending_tasks(limit=10)
+    )
+    conversation = ConversationContext(id="bench-conv", messages=[
+        Message(id=f"c-{i}", content="x" * 200, sender="bench") for i in range(50)
+    ])
+    await adapter.save_conversation(conversation)
+    results["get_conversation(50)"] = await time_ops(
+        "conversation", ops, lambda i: adapter.get_conversation("bench-conv")
+    )
+    return results
+
+
+async def run(ops: int, fake: bool) -> None:
+    if fake:
+        import fakeredis
+        redis_adapter = RedisAdapter(client=fakeredis.FakeAsyncRedis())
+        redis_label = "fakeredis"
+    else:
+        redis_adapter = RedisAdapter()
+        redis_label = "redis"
+
+    memory = await bench_backend(InMemoryAdapter(), ops)
+    redis_results = await bench_backend(redis_adapter, ops)
+    await redis_adapter.close()
+
+    print(f"{'operation':<24} {'memory ops/s':>14} {redis_label + ' ops/s':>16} {'speedup':>9}")
+    print("-" * 66)
+    for name, memory_rate in memory.items():
+        redis_rate = redis_results[name]
+        print(f"{name:<24} {memory_rate:>14.0f} {redis_rate:>16.0f} {memory_rate / redis_rate:>8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--fake", action="store_true", help="usa fakeredis em vez de um Redis real")
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    asyncio.run(run(args.ops, args.fake))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark de RedisAdapter.get_messages: leitura em lote vs. um GET por mensagem.
+
+Mede round trips e latência em função do tamanho da conversação.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_redis_get_messages.py
+    PYTHONPATH=src python benchmarks/bench_redis_get_messages.py --fake --sizes 10 100 1000
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import List
+
+import redis.asyncio as redis
+from loguru import logger
+
+from config.settings import settings
+from core.domain.models import Message
+from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+
+
+class RoundTripCounter:
+    """Conta round trips de um cliente Redis (comandos avulsos e pipelines)."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.count = 0
+        execute_command = client.execute_command
+        pipeline = client.pipeline
+
+        async def counted_execute_command(*args, **kwargs):
+            self.count += 1
+            return await execute_command(*args, **kwargs)
+
+        def counted_pipeline(*args, **kwargs):
+            pipe = pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            async def counted_execute(*e_args, **e_kwargs):
+                self.count += 1
+                return await execute(*e_args, **e_kwargs)
+
+            pipe.execute = counted_execute
+            return pipe
+
+        client.execute_command = counted_execute_command
+        client.pipeline = counted_pipeline
+
+
+async def legacy_get_messages(client: redis.Redis, conversation_id: str) -> List[Message]:
+    """Implementação anterior: LRANGE seguido de um GET por mensagem."""
+    message_ids = await client.lrange(f"conversation_messages:{conversation_id}", 0, -1)
+    messages = []
+    for message_id in message_ids:
+        message_data = await client.get(f"message:{message_id}")
+        if message_data:
+            messages.append(Message.model_validate_json(message_data))
+    return list(reversed(messages))
+
+
+def build_client(fake: bool) -> redis.Redis:
+    if fake:
+        import fakeredis
+        return fakeredis.FakeAsyncRedis(decode_responses=True)
+    return redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password,
+        decode_responses=True,
+    )
+
+
+async def run(sizes: List[int], repeat: int, fake: bool) -> None:
+    client = build_client(fake)
+    adapter = RedisAdapter(client=client)
+
+    print(f"{'msgs':>6} | {'legacy RT':>9} {'legacy ms':>10} | {'bulk RT':>7} {'bulk ms':>8} | speedup")
+    print("-" * 64)
+    for size in sizes:
+        conversation_id = f"bench-{size}"
+        for i in range(size):
+            await adapter.save_message(Message(
+                id=f"bench-{size}-{i}",
+                content="x" * 200,
+                sender="bench",
+                metadata={"conversation_id": conversation_id},
+            ))
+
+        counter = RoundTripCounter(client)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            legacy = await legacy_get_messages(client, conversation_id)
+        legacy_ms = (time.perf_counter() - start) * 1000 / repeat
+        legacy_rt = counter.count // repeat
+
+        counter.count = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            bulk = await adapter.get_messages(conversation_id)
+        bulk_ms = (time.perf_counter() - start) * 1000 / repeat
+        bulk_rt = counter.count // repeat
+
+        assert [m.id for m in legacy] == [m.id for m in bulk]
+        print(
+            f"{size:>6} | {legacy_rt:>9} {legacy_ms:>10.2f} | {bulk_rt:>7} {bulk_ms:>8.2f} | "
+            f"{legacy_ms / bulk_ms:>6.1f}x"
+        )
+
+        await client.delete(f"conversation_messages:{conversation_id}",
+                            *[f"message:bench-{size}-{i}" for i in range(size)])
+
+    await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 500, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fake", action="store_true", help="usa fakeredis em vez de um Redis real")
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    asyncio.run(run(args.sizes, args.repeat, args.fake))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Gera o gazetteer binário usado pelo geocodificador offline.
+
+Entrada: um dump de cidades do GeoNames (https://download.geonames.org/export/dump/,
+ex.: cities15000.txt, TSV) e, opcionalmente, countryInfo.txt para exibir o
+nome do país em vez do código ISO.
+
+Uso:
+    PYTHONPATH=src python scripts/build_gazetteer.py cities15000.txt data/gazetteer.bin
+    PYTHONPATH=src python scripts/build_gazetteer.py cities15000.txt data/gazetteer.bin \\
+        --country-info countryInfo.txt --min-population 1000 --alternate-names
+"""
+import argparse
+import csv
+import sys
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from infrastructure.adapters.outbound.gazetteer import build_gazetteer
+
+# Colunas do formato "geoname" do GeoNames
+NAME, ASCII_NAME, ALTERNATE_NAMES, LATITUDE, LONGITUDE = 1, 2, 3, 4, 5
+COUNTRY_CODE, POPULATION = 8, 14
+
+
+def read_country_names(path: str) -> Dict[str, str]:
+    names = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("#"):
+                continue
+            columns = line.rstrip("\n").split("\t")
+            if len(columns) > 4:
+                names[columns[0]] = columns[4]
+    return names
+
+
+def read_cities(path: str, countries: Dict[str, str], min_population: int, alternate_names: bool):
+    entries: List[Tuple[str, str, str, float, float, int]] = []
+    extra_names: Dict[int, List[str]] = {}
+    with open(path, encoding="utf-8", newline="") as file:
+        for columns in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+            population = int(columns[POPULATION] or 0)
+            if population < min_population:
+                continue
+            code = columns[COUNTRY_CODE]
+            extra = [columns[ASCII_NAME]]
+            if alternate_names and columns[ALTERNATE_NAMES]:
+                extra.extend(columns[ALTERNATE_NAMES].split(","))
+            extra_names[len(entries)] = extra
+            entries.append((
+                columns[NAME], countries.get(code, code), code,
+                float(columns[LATITUDE]), float(columns[LONGITUDE]), population,
+            ))
+    return entries, extra_names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cities", help="arquivo de cidades do GeoNames (TSV)")
+    parser.add_argument("output", help="arquivo binário de saída")
+    parser.add_argument("--country-info", help="countryInfo.txt do GeoNames")
+    parser.add_argument("--min-population", type=int, default=0)
+    parser.add_argument("--alternate-names", action="store_true", help="indexa também os nomes alternativos")
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    countries = read_country_names(args.country_info) if args.country_info else {}
+    entries, extra_names = read_cities(args.cities, countries, args.min_population, args.alternate_names)
+    build_gazetteer(entries, args.output, extra_names)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,28 @@
 Entry-point para iniciar o servidor A2A (dinâmico) junto com a API principal.
 """
 import os
-import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict
 import uvicorn
 from loguru import logger
 from fastapi import FastAPI
+from starlette.applications import Starlette
 
-from config.settings import settings
+from config.settings import PersistenceBackend, settings
 from infrastructure.adapters.inbound.a2a_server import build_asgi_app as build_a2a
+from infrastructure.adapters.outbound.http_client import http_client_lifespan
+from infrastructure.adapters.outbound.redis_pool import redis_pool_lifespan
+
+
+@asynccontextmanager
+async def main_lifespan(app: FastAPI):
+    """Abre o cliente HTTP e, no desligamento, fecha também os pools Redis."""
+    async with redis_pool_lifespan(app), http_client_lifespan(app):
+        yield
 
 
 def build_main_app() -> FastAPI:
-    app = FastAPI(title="Multi-Agent System", version="1.1.0")
+    app = FastAPI(title="Multi-Agent System", version="1.1.0", lifespan=main_lifespan)
 
     @app.get("/")
     async def root():
@@ -30,21 +41,75 @@ def build_main_app() -> FastAPI:
     return app
 
 
-async def main():
+def create_app() -> Starlette:
+    """
+    Fábrica do app A2A, chamada uma vez por worker.
+
+    Cada processo monta seu próprio DynamicAgentFactory e, no lifespan, seu
+    cliente HTTP; nada é herdado do processo supervisor.
+    """
+    return build_a2a(settings.a2a_server_host, settings.a2a_server_port)
+
+
+def server_options() -> Dict[str, Any]:
+    """Opções do uvicorn vindas das settings, iguais com um ou vários workers."""
+    return {
+        "host": settings.a2a_server_host,
+        "port": settings.a2a_server_port,
+        "loop": settings.a2a_loop,
+        "http": settings.a2a_http,
+        "backlog": settings.a2a_backlog,
+        "timeout_graceful_shutdown": settings.a2a_graceful_timeout,
+        "log_level": settings.log_level.lower(),
+    }
+
+
+def serve() -> None:
+    """
+    Sobe o servidor A2A com A2A_WORKERS processos.
+
+    Com mais de um worker, o uvicorn pré-cria os processos e os supervisiona:
+    SIGTERM/SIGINT encerram com drenagem de até A2A_GRACEFUL_TIMEOUT segundos,
+    SIGHUP reinicia os workers um a um e SIGTTIN/SIGTTOU adicionam/removem
+    um worker. uvloop e httptools são usados quando instalados (modo "auto").
+    """
+    workers = max(1, settings.a2a_workers)
+
+    if workers > 1 and settings.a2a_store_backend == PersistenceBackend.MEMORY:
+        logger.warning(
+            "A2A_WORKERS > 1 with in-memory A2A stores: tasks are only visible to the worker "
+            "that created them. Set A2A_STORE_BACKEND=redis."
+        )
+
+    logger.info(
+        f"Starting A2A server on {settings.a2a_server_host}:{settings.a2a_server_port} "
+        f"with {workers} worker(s)"
+    )
+    uvicorn.run("a2a_main:create_app", factory=True, workers=workers, **server_options())
+
+
+def main() -> None:
     logger.add("logs/multi-agent.log", rotation="1 day", retention="7 days")
 
     host = settings.a2a_server_host
     port = settings.a2a_server_port
 
-    # Constrói A2A app (Starlette) e monta via Uvicorn separadamente
+    # Constrói A2A app (Starlette) e monta via Uvicorn separadamente; o lifespan
+    # do app abre e fecha o cliente HTTP compartilhado do processo
     a2a_app = build_a2a(host, port)
 
-    config = uvicorn.Config(app=a2a_app, host=host, port=port, log_level=settings.log_level.lower())
+    config = uvicorn.Config(app=a2a_app, **server_options())
     server = uvicorn.Server(config)
 
     logger.info(f"Starting A2A server on {host}:{port}")
-    await server.serve()
+    # Server.run cria o event loop de A2A_LOOP (uvloop/asyncio)
+    server.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if settings.a2a_workers > 1:
+        logger.add("logs/multi-agent.log", rotation="1 day", retention="7 days")
+        serve()
+    else:
+        # Um processo: servidor montado aqui, com as mesmas opções do uvicorn
+        main()
@@ -4,51 +4,65 @@ Este agente é instanciado sob demanda com agent_id="weather-<n>" e integra Open
 """
 from __future__ import annotations
 
-import httpx
-from typing import Any
+import asyncio
+from typing import Any, AsyncIterator, Optional
 from loguru import logger
 
+from agents.location_extractor import LocationExtractor, get_location_extractor
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+
+
+# Limite de localizações consultadas por mensagem
+MAX_LOCATIONS_PER_QUERY = 5
+
+NO_LOCATION_REPLY = "Não identifiquei a localização. Informe a cidade, ex.: \"clima em São Paulo\"."
+
 
 class WeatherAgent:
-    def __init__(self, name: str = "weather-agent") -> None:
+    def __init__(
+        self,
+        name: str = "weather-agent",
+        weather: Optional[OpenMeteoWeatherAdapter] = None,
+        extractor: Optional[LocationExtractor] = None,
+    ) -> None:
         self.name = name
-        self.base_url = "https://api.open-meteo.com/v1/forecast"
-        self.geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
+        # Geocodificação via cache compartilhado do processo
+        self.weather = weather or OpenMeteoWeatherAdapter()
+        self.extractor = extractor or get_location_extractor()
 
     async def get_weather_text(self, location: str) -> str:
         try:
-            async with httpx.AsyncClient() as client:
-                geo = await client.get(self.geocoding_url, params={"name": location, "count": 1, "language": "pt"})
-                geo.raise_for_status()
-                data = geo.json()
-                if not data.get("results"):
-                    return f"Localização não encontrada: {location}"
-                res = data["results"][0]
-                lat, lon = res["latitude"], res["longitude"]
-                w = await client.get(self.base_url, params={
-                    "latitude": lat,
-                    "longitude": lon,
-                    "current": "temperature_2m,wind_speed_10m,weather_code",
-                    "timezone": "auto"
-                })
-                w.raise_for_status()
-                wd = w.json()
-                cur = wd.get("current", {})
-                t = cur.get("temperature_2m")
-                wind = cur.get("wind_speed_10m")
-                code = cur.get("weather_code")
-                return f"Clima em {res.get('name')}, {res.get('country', '')}: temp={t}°C, vento={wind} km/h, código={code}"
+            res = await self.weather.resolve_location(location)
+            if res is None:
+                return f"Localização não encontrada: {location}"
+            wd = await self.weather.fetch_forecast(
+                res.latitude, res.longitude, current="temperature_2m,wind_speed_10m,weather_code"
+            )
+            cur = wd.get("current", {})
+            t = cur.get("temperature_2m")
+            wind = cur.get("wind_speed_10m")
+            code = cur.get("weather_code")
+            return f"Clima em {res.name}, {res.country}: temp={t}°C, vento={wind} km/h, código={code}"
         except Exception as e:
             logger.error(f"Erro WeatherAgent: {e}")
             return f"Erro obtendo clima: {e}"
 
     async def handle(self, text: str) -> str:
-        # Extrai uma localização simples do texto
-        # Exemplos: "clima em São Paulo" / "weather Rio de Janeiro"
-        tokens = text.split()
-        if "em" in tokens:
-            idx = tokens.index("em")
-            location = " ".join(tokens[idx+1:]) or "São Paulo"
-        else:
-            location = "São Paulo"
-        return await self.get_weather_text(location)
+        # Extrai as localizações em qualquer ponto do texto
+        # Exemplos: "clima em São Paulo" / "weather in Recife and Natal"
+        locations = self.extractor.extract(text)[:MAX_LOCATIONS_PER_QUERY]
+        if not locations:
+            return NO_LOCATION_REPLY
+        replies = await asyncio.gather(*[self.get_weather_text(location) for location in locations])
+        return "\n".join(replies)
+
+    async def stream(self, text: str) -> AsyncIterator[str]:
+        # Entrega cada localização assim que sua consulta termina
+        locations = self.extractor.extract(text)[:MAX_LOCATIONS_PER_QUERY]
+        if not locations:
+            yield NO_LOCATION_REPLY
+            return
+        for position, reply in enumerate(asyncio.as_completed(
+            [self.get_weather_text(location) for location in locations]
+        )):
+            yield ("\n" if position else "") + await reply
@@ -0,0 +1,281 @@
+"""
+Extração de localizações em perguntas livres (PT/EN) para os agentes de clima.
+
+Um autômato Aho-Corasick sobre nomes conhecidos de cidades (e suas grafias
+em português e inglês) encontra todas as ocorrências em uma única passada
+pelo texto normalizado, em tempo linear. Padrões pré-compilados completam a
+busca com nomes próprios desconhecidos após preposições de lugar ("em
+Petrolina", "in Reykjavik") e, em último caso, com o trecho após "em"/"in".
+"""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Nome canônico (enviado ao geocodificador) -> grafias alternativas
+KNOWN_LOCATIONS: Dict[str, Tuple[str, ...]] = {
+    # Capitais e grandes cidades brasileiras
+    "São Paulo": ("Sampa",),
+    "Rio de Janeiro": ("Rio",),
+    "Belo Horizonte": ("BH",),
+    "Brasília": (),
+    "Salvador": (),
+    "Fortaleza": (),
+    "Recife": (),
+    "Porto Alegre": ("POA",),
+    "Curitiba": (),
+    "Manaus": (),
+    "Belém": (),
+    "Goiânia": (),
+    "São Luís": (),
+    "Maceió": (),
+    "Natal": (),
+    "Teresina": (),
+    "João Pessoa": (),
+    "Aracaju": (),
+    "Cuiabá": (),
+    "Campo Grande": (),
+    "Florianópolis": ("Floripa",),
+    "Vitória": (),
+    "Palmas": (),
+    "Porto Velho": (),
+    "Rio Branco": (),
+    "Macapá": (),
+    "Boa Vista": (),
+    "Campinas": (),
+    "Santos": (),
+    "Guarulhos": (),
+    "Niterói": (),
+    "Ribeirão Preto": (),
+    "Uberlândia": (),
+    "Joinville": (),
+    "Londrina": (),
+    # Cidades estrangeiras com grafias diferentes em PT e EN
+    "Lisboa": ("Lisbon",),
+    "Porto": ("Oporto",),
+    "New York": ("Nova York", "Nova Iorque", "NYC"),
+    "London": ("Londres",),
+    "Paris": (),
+    "Madrid": ("Madri",),
+    "Barcelona": (),
+    "Roma": ("Rome",),
+    "Milano": ("Milão", "Milan"),
+    "Berlin": ("Berlim",),
+    "München": ("Munique", "Munich"),
+    "Amsterdam": ("Amsterdã", "Amsterdao"),
+    "Genève": ("Genebra", "Geneva"),
+    "Moscow": ("Moscou",),
+    "Tokyo": ("Tóquio",),
+    "Beijing": ("Pequim",),
+    "Seoul": ("Seul",),
+    "New Delhi": ("Nova Délhi", "Nova Deli"),
+    "Cairo": (),
+    "Cape Town": ("Cidade do Cabo",),
+    "Dubai": (),
+    "Sydney": (),
+    "Toronto": (),
+    "Los Angeles": (),
+    "Chicago": (),
+    "Miami": (),
+    "Mexico City": ("Cidade do México", "Ciudad de México"),
+    "Buenos Aires": (),
+    "Santiago": (),
+    "Montevideo": ("Montevidéu",),
+    "Lima": (),
+    "Bogotá": (),
+}
+
+# Nomes que também são palavras comuns: só contam com inicial maiúscula
+AMBIGUOUS_NAMES = frozenset({
+    "natal", "vitoria", "palmas", "santos", "salvador", "belem", "porto", "rio", "lima", "santiago", "boa vista",
+})
+
+MAX_PHRASE_WORDS = 5
+
+# Nome próprio (com conectivos "de", "do", "of"...) após uma preposição de lugar,
+# seguido opcionalmente de outros nomes próprios em lista ("em Recife e Olinda").
+# "para"/"de"/"for"/"to" ficam de fora: introduzem tempo e assunto ("previsão do
+# Tempo", "for Tomorrow") com a mesma frequência que lugares.
+_PROPER = r"[A-ZÀ-Ý][\w'’-]*(?:\s+(?:(?:de|do|da|dos|das|del|of|the)\s+)?[A-ZÀ-Ý][\w'’-]*)*"
+_PROPER_AFTER_PREPOSITION = re.compile(
+    rf"\b(?:em|no|na|nos|nas|in|at)\s+({_PROPER}(?:\s*(?:,|\be\b|\band\b)\s*{_PROPER})*)"
+)
+_LIST_SEPARATOR = re.compile(r"\s*(,|\be\b|\band\b)\s*")
+# Palavras de tempo e clima que aparecem capitalizadas em títulos ("Previsão de Chuva
+# para Amanhã") e nunca são lugares; comparadas já normalizadas por fold()
+STOPWORDS = frozenset({
+    "tempo", "clima", "previsao", "chuva", "sol", "vento", "frio", "calor", "temperatura", "umidade",
+    "hoje", "amanha", "agora", "semana", "fim", "manha", "tarde", "noite",
+    "weather", "forecast", "rain", "sun", "wind", "temperature", "humidity",
+    "today", "tomorrow", "tonight", "now", "week", "weekend", "morning", "afternoon", "evening",
+})
+# Último recurso: o trecho após a última preposição "em"/"in", sem palavras de tempo
+_TRAILING_PLACE = re.compile(r"\b(?:em|in)\s+([^?!.;]+)", re.IGNORECASE)
+_TIME_WORDS = re.compile(
+    r"\s+(?:hoje|amanh[ãa]|agora|depois|esta semana|nesta semana|today|tomorrow|now|this week)\b.*$",
+    re.IGNORECASE,
+)
+
+
+def fold(text: str) -> Tuple[str, List[int]]:
+    """
+    Normaliza o texto como normalize_location (sem acentos, casefold,
+    pontuação e espaços colapsados) e devolve também, para cada caractere
+    do resultado, sua posição no texto original.
+    """
+    chars: List[str] = []
+    positions: List[int] = []
+    for index, char in enumerate(text):
+        folded = "".join(c for c in unicodedata.normalize("NFKD", char.casefold()) if not unicodedata.combining(c))
+        for c in folded:
+            if not (c.isalnum() or c == "_"):
+                if not chars or chars[-1] == " ":
+                    continue
+                c = " "
+            chars.append(c)
+            positions.append(index)
+    if chars and chars[-1] == " ":
+        chars.pop()
+        positions.pop()
+    return "".join(chars), positions
+
+
+class LocationExtractor:
+    """Extrai nomes de localizações de um texto, na ordem em que aparecem."""
+
+    def __init__(
+        self,
+        locations: Optional[Dict[str, Iterable[str]]] = None,
+        ambiguous: Iterable[str] = AMBIGUOUS_NAMES,
+    ) -> None:
+        self.ambiguous = frozenset(ambiguous)
+        # Autômato: transições, links de falha e saídas (tamanho, chave, nome canônico)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str, str]]] = [[]]
+        for canonical, aliases in (KNOWN_LOCATIONS if locations is None else locations).items():
+            for name in (canonical, *aliases):
+                self._add(fold(name)[0], canonical)
+        self._link()
+
+    def _add(self, key: str, canonical: str) -> None:
+        if not key:
+            return
+        state = 0
+        for char in key:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._out[state].append((len(key), key, canonical))
+
+    def _link(self) -> None:
+        """Calcula os links de falha em largura e herda as saídas dos sufixos."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, target in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[target] = link if link != target else 0
+                self._out[target] = self._out[target] + self._out[self._fail[target]]
+                queue.append(target)
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Retorna as localizações encontradas no texto, sem repetição.
+
+        Nomes conhecidos voltam na forma canônica; nomes próprios após
+        preposições de lugar, como escritos. Um ", X" no fim de uma lista,
+        quando X não é um lugar conhecido, qualifica o lugar anterior e volta
+        junto com ele ("Paris, Texas"); "Recife, Natal" continua sendo uma
+        lista. Sem nenhum dos dois, usa o trecho após o último "em"/"in"
+        (comportamento original do WeatherAgent).
+        """
+        places, qualifiers = self._proper_nouns(text)
+        known = self._known(text)
+        qualifiers = [q for q in qualifiers if not any(span[:2] == q[:2] for span in known)]
+        spans = [span for span in known if not any(_overlaps(span, q) for q in qualifiers)]
+        spans.extend(span for span in places if not any(_overlaps(span, s) for s in spans))
+        if not spans:
+            trailing = _TRAILING_PLACE.findall(text)
+            place = _TIME_WORDS.sub("", trailing[-1]).strip(" ,") if trailing else ""
+            return [place] if place else []
+
+        spans.sort()
+        for start, end, qualifier in qualifiers:
+            previous = [i for i, span in enumerate(spans) if span[1] <= start]
+            if previous and text[spans[previous[-1]][1]:start].strip() == ",":
+                first, _, name = spans[previous[-1]]
+                spans[previous[-1]] = (first, end, f"{name}, {qualifier}")
+
+        results, seen = [], set()
+        for _, _, name in sorted(spans):
+            key = fold(name)[0]
+            if key not in seen:
+                seen.add(key)
+                results.append(name)
+        return results
+
+    def _known(self, text: str) -> List[Tuple[int, int, str]]:
+        """Ocorrências de nomes conhecidos: mais à esquerda e mais longas, sem sobreposição."""
+        folded, positions = fold(text)
+        matches = []
+        state = 0
+        for end, char in enumerate(folded, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, key, canonical in self._out[state]:
+                start = end - length
+                # Só palavras inteiras: "rio" não casa dentro de "diario"
+                if (start and folded[start - 1] != " ") or (end < len(folded) and folded[end] != " "):
+                    continue
+                if key in self.ambiguous and not text[positions[start]].isupper():
+                    continue
+                matches.append((positions[start], positions[end - 1] + 1, canonical))
+
+        selected: List[Tuple[int, int, str]] = []
+        for match in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+            if not selected or match[0] >= selected[-1][1]:
+                selected.append(match)
+        return selected
+
+    @staticmethod
+    def _proper_nouns(text: str) -> Tuple[List[Tuple[int, int, str]], List[Tuple[int, int, str]]]:
+        """Nomes próprios após preposições de lugar, separados em lugares e possíveis qualificadores."""
+        places: List[Tuple[int, int, str]] = []
+        qualifiers: List[Tuple[int, int, str]] = []
+        for match in _PROPER_AFTER_PREPOSITION.finditer(text):
+            offset = match.start(1)
+            parts = _LIST_SEPARATOR.split(match.group(1))
+            items, separators = parts[::2], [None] + parts[1::2]
+            for index, (item, separator) in enumerate(zip(items, separators)):
+                start = text.index(item, offset)
+                offset = start + len(item)
+                # ", X" sem "e"/"and" depois pode qualificar o lugar anterior ("Paris, Texas", "Natal, RN")
+                if separator == "," and not any(sep != "," for sep in separators[index + 1:]):
+                    qualifiers.append((start, offset, item))
+                    continue
+                words = item.split()
+                if fold(words[0])[0] in STOPWORDS or len(words) > MAX_PHRASE_WORDS:
+                    continue
+                places.append((start, offset, item))
+        return places, qualifiers
+
+
+def _overlaps(a: Tuple[int, int, str], b: Tuple[int, int, str]) -> bool:
+    return a[0] < b[1] and b[0] < a[1]
+
+
+_shared_extractor: Optional[LocationExtractor] = None
+
+
+def get_location_extractor() -> LocationExtractor:
+    """Obtém o extrator do processo (o autômato é montado uma única vez)."""
+    global _shared_extractor
+    if _shared_extractor is None:
+        _shared_extractor = LocationExtractor()
+    return _shared_extractor
@@ -12,6 +12,21 @@ class ModelProvider(str, Enum):
     GOOGLE = "google"
 
 
+class ConversationStorageMode(str, Enum):
+    BLOB = "blob"
+    APPEND = "append"
+
+
+class PersistenceBackend(str, Enum):
+    REDIS = "redis"
+    MEMORY = "memory"
+
+
+class SerializationCodec(str, Enum):
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
 class Settings(BaseSettings):
     """Configurações da aplicação."""
     
@@ -30,15 +45,102 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_db: int = 0
     redis_password: Optional[str] = None
+    redis_conversation_storage: ConversationStorageMode = ConversationStorageMode.APPEND
+    redis_codec: SerializationCodec = SerializationCodec.JSON
+    redis_pool_max_connections: int = 50
+    redis_pool_timeout: float = 5.0
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 2.0
+    redis_socket_keepalive: bool = True
+    redis_health_check_interval: int = 30
+    
+    # Persistence Configuration
+    persistence_backend: PersistenceBackend = PersistenceBackend.REDIS
+    memory_store_max_entries: int = 100000
+    memory_store_max_bytes: int = 268435456
+    
+    # Persistence L1 Cache Configuration
+    persistence_cache_enabled: bool = False
+    persistence_cache_max_entries: int = 1000
+    persistence_cache_max_bytes: int = 0
+    persistence_cache_ttl: float = 30.0
+    persistence_cache_channel: str = "persistence:invalidate"
     
     # A2A Configuration
     a2a_server_host: str = "0.0.0.0"
     a2a_server_port: int = 8000
     a2a_agent_name: str = "multi-agent-system"
     a2a_agent_version: str = "1.0.0"
+    a2a_store_backend: PersistenceBackend = PersistenceBackend.MEMORY
+    a2a_task_ttl: int = 86400
+    
+    # A2A Serving Configuration (uvicorn pre-fork workers)
+    a2a_workers: int = 1
+    a2a_graceful_timeout: float = 30.0
+    a2a_backlog: int = 2048
+    a2a_loop: str = "auto"
+    a2a_http: str = "auto"
+    
+    # A2A Admission Control Configuration (0 = unlimited)
+    a2a_max_concurrency: int = 64
+    a2a_max_queue: int = 256
+    a2a_agent_max_concurrency: int = 16
+    a2a_agent_max_queue: int = 64
+    a2a_queue_timeout: float = 2.0
+    a2a_retry_after: float = 1.0
+    
+    # A2A Push Notification Delivery Configuration
+    a2a_push_queue_size: int = 1000
+    a2a_push_workers: int = 4
+    a2a_push_max_per_endpoint: int = 4
+    a2a_push_max_attempts: int = 5
+    a2a_push_backoff_base: float = 0.5
+    a2a_push_backoff_max: float = 30.0
+    a2a_push_timeout: float = 5.0
+    a2a_push_dead_letter_size: int = 100
+    a2a_push_drain_timeout: float = 5.0
+    
+    # A2A JSON-RPC Batch Configuration (0 = unlimited)
+    a2a_batch_max_concurrency: int = 8
+    a2a_batch_max_size: int = 100
+    
+    # Dynamic Agent Pool Configuration
+    agent_pool_max_size: int = 1000
+    agent_pool_idle_ttl: float = 900.0
+    agent_pool_warm_agents: str = ""
     
     # Weather API Configuration
     weather_api_base_url: str = "https://api.open-meteo.com/v1/forecast"
+    geocoding_api_url: str = "https://geocoding-api.open-meteo.com/v1/search"
+    
+    # HTTP Client Configuration (shared per process)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 10.0
+    http_connect_timeout: float = 5.0
+    http2_enabled: bool = False
+    
+    # Weather Batch Configuration
+    weather_batch_max_locations: int = 50
+    weather_batch_concurrency: int = 8
+    
+    # Offline Gazetteer Configuration (built with scripts/build_gazetteer.py)
+    gazetteer_path: Optional[str] = None
+    gazetteer_min_similarity: float = 0.75
+    
+    # Geocoding Cache Configuration
+    geocoding_cache_max_entries: int = 10000
+    geocoding_cache_ttl: float = 2592000.0
+    geocoding_negative_ttl: float = 3600.0
+    geocoding_cache_redis_enabled: bool = False
+    
+    # Forecast Cache Configuration
+    forecast_cache_enabled: bool = True
+    forecast_cache_max_entries: int = 5000
+    forecast_cache_grid_degrees: float = 0.1
+    forecast_cache_update_interval: float = 3600.0
+    forecast_cache_max_stale: float = 3600.0
     
     # Application Configuration
     log_level: str = "INFO"
@@ -2,8 +2,9 @@
 Porta para persistência de dados.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
-from ....domain.models import Message, Task, ConversationContext
+from datetime import datetime
+from typing import Optional, List, Dict, Any, AsyncIterator
+from ....domain.models import Message, MessagePage, PageDirection, Task, ConversationContext
 
 
 class PersistencePort(ABC):
@@ -29,6 +30,44 @@ class PersistencePort(ABC):
         """Recupera mensagens de uma conversação."""
         pass
     
+    @abstractmethod
+    async def get_messages_page(
+        self,
+        conversation_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        direction: PageDirection = PageDirection.BACKWARD,
+        since: Optional[datetime] = None,
+    ) -> MessagePage:
+        """
+        Recupera uma página de mensagens de uma conversação.
+        
+        BACKWARD começa pelas mensagens mais recentes e avança para as mais
+        antigas; FORWARD faz o caminho inverso. Dentro da página as mensagens
+        estão sempre em ordem cronológica. `since` limita o resultado às
+        mensagens com timestamp igual ou posterior ao informado. Um cursor
+        que não veio de `next_cursor` (não inteiro ou negativo) levanta
+        ValueError em qualquer backend.
+        """
+        pass
+    
+    async def iter_messages(
+        self,
+        conversation_id: str,
+        page_size: int = 50,
+        direction: PageDirection = PageDirection.BACKWARD,
+        since: Optional[datetime] = None,
+    ) -> AsyncIterator[MessagePage]:
+        """Itera pelas páginas de mensagens de uma conversação."""
+        cursor = None
+        while True:
+            page = await self.get_messages_page(conversation_id, page_size, cursor, direction, since)
+            if page.messages:
+                yield page
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
+    
     @abstractmethod
     async def save_task(self, task: Task) -> None:
         """Salva uma tarefa."""
@@ -3,7 +3,7 @@ Porta para serviços meteorológicos.
 """
 from abc import ABC, abstractmethod
 from typing import Optional
-from ....domain.models import WeatherQuery, WeatherResponse
+from ....domain.models import GeoLocation, WeatherQuery, WeatherResponse
 
 
 class WeatherPort(ABC):
@@ -22,4 +22,9 @@ class WeatherPort(ABC):
     @abstractmethod
     async def geocode_location(self, location: str) -> tuple[float, float]:
         """Converte endereço em coordenadas."""
+        pass
+    
+    @abstractmethod
+    async def resolve_location(self, location: str) -> Optional[GeoLocation]:
+        """Resolve uma localização com nome e país; None se não encontrada."""
         pass
\ No newline at end of file
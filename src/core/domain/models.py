@@ -20,6 +20,11 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
+class PageDirection(str, Enum):
+    FORWARD = "forward"
+    BACKWARD = "backward"
+
+
 class Message(BaseModel):
     """Modelo de mensagem entre agentes."""
     id: str = Field(..., description="Identificador único da mensagem")
@@ -31,6 +36,25 @@ class Message(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class MessagePage(BaseModel):
+    """Página de mensagens de uma conversação, em ordem cronológica."""
+    messages: List[Message] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página; None quando não há mais")
+
+    @staticmethod
+    def parse_cursor(cursor: Optional[str]) -> Optional[int]:
+        """Posição representada pelo cursor; ValueError se não for um inteiro >= 0."""
+        if cursor is None:
+            return None
+        try:
+            position = int(cursor)
+        except (TypeError, ValueError):
+            raise ValueError(f"Cursor de página inválido: {cursor!r}") from None
+        if position < 0:
+            raise ValueError(f"Cursor de página inválido: {cursor!r}")
+        return position
+
+
 class Task(BaseModel):
     """Modelo de tarefa para ser processada pelos agentes."""
     id: str = Field(..., description="Identificador único da tarefa")
@@ -61,6 +85,14 @@ class WeatherQuery(BaseModel):
     parameters: List[str] = Field(default=["temperature_2m", "wind_speed_10m", "weather_code"])
 
 
+class GeoLocation(BaseModel):
+    """Resultado de geocodificação de uma localização."""
+    name: str
+    country: str = ""
+    latitude: float
+    longitude: float
+
+
 class WeatherResponse(BaseModel):
     """Resposta da consulta meteorológica."""
     location: str
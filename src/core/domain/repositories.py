@@ -44,8 +44,8 @@ class TaskRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_pending_tasks(self) -> List[Task]:
-        """Recupera tarefas pendentes."""
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Recupera as tarefas pendentes mais antigas (ordem de criação)."""
         pass
 
 
@@ -3,39 +3,46 @@ A2A Server: exposição de um agente A2A dinâmico (Google A2A) com criação de
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 import os
+import time
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
 
 import uvicorn
 from loguru import logger
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
 
 # Tentamos usar o SDK oficial python-a2a (ou a2a-sdk).
 # O código abaixo tenta ser compatível com as variantes vistas nos tutoriais.
 try:
     # Variante 1 (a2a-python SDK community)
+    from a2a.server.agent_execution import AgentExecutor, RequestContext
     from a2a.server.apps import A2AStarletteApplication
+    from a2a.server.events import EventQueue
     from a2a.server.request_handlers import DefaultRequestHandler
-    from a2a.server.tasks import (
-        InMemoryTaskStore,
-        InMemoryPushNotificationConfigStore,
-        BasePushNotificationSender,
-    )
-    from a2a.types import AgentCard, AgentCapabilities, AgentSkill
+    from a2a.server.tasks import TaskUpdater
+    from a2a.types import AgentCard, AgentCapabilities, AgentSkill, JSONRPCError, Part, TextPart
+    from a2a.utils import new_agent_text_message, new_task
+    from a2a.utils.errors import ServerError
     A2A_AVAILABLE = True
 except Exception:
     try:
         # Variante 2 (python-a2a - nomes podem diferir; ajuste se necessário)
+        from python_a2a.server.agent_execution import AgentExecutor, RequestContext  # type: ignore
         from python_a2a.server.apps import A2AStarletteApplication  # type: ignore
+        from python_a2a.server.events import EventQueue  # type: ignore
         from python_a2a.server.request_handlers import DefaultRequestHandler  # type: ignore
-        from python_a2a.server.tasks import (  # type: ignore
-            InMemoryTaskStore,
-            InMemoryPushNotificationConfigStore,
-            BasePushNotificationSender,
-        )
-        from python_a2a.types import AgentCard, AgentCapabilities, AgentSkill  # type: ignore
+        from python_a2a.server.tasks import TaskUpdater  # type: ignore
+        from python_a2a.types import AgentCard, AgentCapabilities, AgentSkill, JSONRPCError, Part, TextPart  # type: ignore
+        from python_a2a.utils import new_agent_text_message, new_task  # type: ignore
+        from python_a2a.utils.errors import ServerError  # type: ignore
         A2A_AVAILABLE = True
     except Exception:
         A2A_AVAILABLE = False
@@ -47,72 +54,279 @@ if not A2A_AVAILABLE:
         "ou  pip install a2a-sdk\n"
     )
 
-import httpx
+from config.settings import settings
+from infrastructure.adapters.inbound.admission import AdmissionController, OverloadedError
+from infrastructure.adapters.inbound.intent_router import ARITHMETIC_PATTERN, Intent, IntentRouter
+from infrastructure.adapters.inbound.jsonrpc_batch import JSONRPCBatchMiddleware
+from infrastructure.adapters.outbound.a2a_redis_stores import build_a2a_stores
+from infrastructure.adapters.outbound.forecast_cache import close_forecast_cache
+from infrastructure.adapters.outbound.http_client import http_client_lifespan
+from infrastructure.adapters.outbound.push_delivery import QueuedPushNotificationSender
+from infrastructure.adapters.outbound.redis_pool import get_pool_stats, redis_pool_lifespan
+from infrastructure.adapters.outbound.singleflight import SingleFlight, get_single_flight_stats
+
+
+# Erro JSON-RPC (faixa reservada a erros do servidor) para rejeição por sobrecarga;
+# data.retryable/data.retry_after indicam que o cliente pode repetir a chamada
+OVERLOADED_ERROR_CODE = -32050
+
+
+async def stream_agent(agent: Any, text: str) -> AsyncIterator[str]:
+    """
+    Itera sobre a resposta de um agente em partes.
+
+    Agentes com `stream(text)` (gerador assíncrono) entregam cada parte assim
+    que ela fica pronta; os demais entregam a resposta de `handle` inteira.
+    """
+    if hasattr(agent, "stream"):
+        async for chunk in agent.stream(text):
+            yield chunk
+    else:
+        yield await agent.handle(text)
 
 
-class DynamicAgentExecutor:
+class DynamicAgentExecutor(AgentExecutor):
     """
-    Executor simples que delega tarefas a um agente LangGraph local, MCP ou tool externa.
-    Aqui, simulamos a execução; na sua POC, conecte aos agentes reais (information/action).
+    Executor que delega tarefas a agentes dinâmicos e transmite a resposta.
+
+    Cada parte produzida pelo agente é publicada na fila de eventos como um
+    TaskArtifactUpdateEvent (append no mesmo artifact), de modo que clientes
+    de message/stream recebem o início da resposta sem esperar o fim.
     """
 
-    def __init__(self, factory: "DynamicAgentFactory") -> None:
+    def __init__(self, factory: "DynamicAgentFactory", admission: Optional[AdmissionController] = None) -> None:
         self.factory = factory
+        self.admission = admission or AdmissionController()
+        self._running: Dict[str, asyncio.Task] = {}
 
-    async def execute(self, context: Dict[str, Any], event_queue: Any) -> Dict[str, Any]:
-        # Contexto mínimo: {"task": {"message": {"content": {"text": "..."}}}}
-        task = context.get("task", {})
-        message = task.get("message", {})
-        content = message.get("content", {})
-        text = content.get("text") if isinstance(content, dict) else None
-        agent_id = task.get("agent_id") or "dynamic"
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        text = context.get_user_input()
+        message_metadata = (context.message.metadata if context.message else None) or {}
+        agent_id = context.metadata.get("agent_id") or message_metadata.get("agent_id") or "dynamic"
 
-        logger.info(f"Executando task no agente {agent_id} com entrada: {text}")
+        # Sem vaga (fila cheia ou prazo esgotado), rejeita antes de criar a tarefa
+        try:
+            async with self.admission.admit(agent_id):
+                await self._run(context, event_queue, agent_id, text)
+        except OverloadedError as e:
+            logger.warning(f"Task rejeitada para o agente {agent_id}: {e}")
+            raise ServerError(error=JSONRPCError(
+                code=OVERLOADED_ERROR_CODE,
+                message=str(e),
+                data={"retryable": True, "retry_after": e.retry_after, "scope": e.scope, "reason": e.reason},
+            ))
 
-        # Roteia para um agente dinâmico (ex: weather, info, mcp)
-        agent = await self.factory.get_or_create_agent(agent_id)
-        response_text = await agent.handle(text or "")
+    async def _run(self, context: RequestContext, event_queue: EventQueue, agent_id: str, text: str) -> None:
+        task = context.current_task
+        if task is None:
+            task = new_task(context.message)
+            await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+        await updater.start_work()
 
-        # Exemplo de retorno A2A com artifact simples de texto
-        return {
-            "artifacts": [
-                {
-                    "parts": [
-                        {"type": "text", "text": response_text},
-                    ]
-                }
-            ],
-            "status": {"state": "COMPLETED"},
-        }
+        logger.info(f"Executando task {task.id} no agente {agent_id} com entrada: {text}")
+        self._running[task.id] = asyncio.current_task()
+        artifact_id = str(uuid.uuid4())
+        chunks = 0
+        try:
+            # Roteia para um agente dinâmico (ex: weather, info, mcp)
+            agent = await self.factory.get_or_create_agent(agent_id)
+            async for chunk in stream_agent(agent, text):
+                await updater.add_artifact(
+                    [Part(root=TextPart(text=chunk))],
+                    artifact_id=artifact_id,
+                    name="response",
+                    append=chunks > 0,
+                    last_chunk=False,
+                )
+                chunks += 1
+            if chunks:
+                # Fecha o artifact sem acrescentar partes: sem olhar uma parte à frente,
+                # cada parte sai assim que fica pronta
+                await updater.add_artifact([], artifact_id=artifact_id, name="response", append=True, last_chunk=True)
+            await updater.complete()
+        except asyncio.CancelledError:
+            await updater.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Erro na task {task.id} do agente {agent_id}: {e}")
+            await updater.failed(new_agent_text_message(f"Erro: {e}", task.context_id, task.id))
+        finally:
+            self._running.pop(task.id, None)
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        running = self._running.get(context.task_id)
+        if running is not None:
+            # A própria execução publica o status "canceled" ao ser interrompida
+            running.cancel()
+            return
+        task = context.current_task
+        if task is not None:
+            await TaskUpdater(event_queue, task.id, task.context_id).cancel()
+
+
+# Intenções do DynamicAgent; novas intenções/subagentes entram aqui (ou via router.register)
+DEFAULT_INTENTS = [
+    Intent(name="weather", prefixes=["clima"], keywords=["weather", "previsão do tempo", "forecast"], priority=30),
+    Intent(name="info", prefixes=["info"], keywords=["documentação", "documentation"], priority=20),
+    Intent(name="calc", prefixes=["calc"], keywords=["calcule", "calculate"], patterns=[ARITHMETIC_PATTERN], priority=10),
+]
+
+INTENT_RESPONSES = {
+    "weather": "Consulta de clima recebida. Integre WeatherAdapter/MCP aqui para dados reais.",
+    "info": "Consulta informacional recebida. Integre InformationAgent (RAG) aqui.",
+    "calc": "Cálculo solicitado. Integre MCP.calculate aqui.",
+}
+
+_shared_router: Optional[IntentRouter] = None
+
+
+def get_intent_router() -> IntentRouter:
+    """Obtém o roteador de intenções do processo (compilado uma única vez)."""
+    global _shared_router
+    if _shared_router is None:
+        _shared_router = IntentRouter(DEFAULT_INTENTS)
+    return _shared_router
 
 
 class DynamicAgent:
-    """Agente simples de demonstração que decide comportamento pelo prefixo do texto."""
+    """Agente simples de demonstração que decide o comportamento pela intenção do texto."""
 
-    def __init__(self, agent_id: str) -> None:
+    def __init__(self, agent_id: str, router: Optional[IntentRouter] = None) -> None:
         self.agent_id = agent_id
+        self.router = router or get_intent_router()
 
     async def handle(self, text: str) -> str:
-        t = (text or "").lower()
-        if t.startswith("clima") or "weather" in t:
-            return "Consulta de clima recebida. Integre WeatherAdapter/MCP aqui para dados reais."
-        if t.startswith("info") or "documentação" in t:
-            return "Consulta informacional recebida. Integre InformationAgent (RAG) aqui."
-        if t.startswith("calc") or any(op in t for op in ["+", "-", "*", "/"]):
-            return "Cálculo solicitado. Integre MCP.calculate aqui."
-        return f"Agente {self.agent_id} respondeu: '{text}'."
+        return "".join([chunk async for chunk in self.stream(text)])
+
+    async def stream(self, text: str) -> AsyncIterator[str]:
+        route = self.router.route(text or "")
+        if route is None or route.intent not in INTENT_RESPONSES:
+            yield f"Agente {self.agent_id} respondeu: '{text}'."
+            return
+        logger.debug(f"Agente {self.agent_id} roteou para '{route.intent}' ({route.reason})")
+        yield INTENT_RESPONSES[route.intent]
 
 
 class DynamicAgentFactory:
-    """Cria e gerencia instâncias de agentes dinâmicos sob demanda."""
+    """
+    Cria e gerencia instâncias de agentes dinâmicos sob demanda.
 
-    def __init__(self) -> None:
-        self._agents: Dict[str, DynamicAgent] = {}
+    O pool é limitado: agentes sem uso há mais de `idle_ttl` segundos expiram
+    e, acima de `max_size`, o menos recentemente usado é descartado. Criações
+    concorrentes do mesmo agent_id são coalescidas em uma só. Agentes
+    pré-aquecidos (`warmup`) ficam fixos e não são descartados.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        builder: Optional[Callable[[str], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size if max_size is not None else settings.agent_pool_max_size
+        self.idle_ttl = idle_ttl if idle_ttl is not None else settings.agent_pool_idle_ttl
+        self._builder = builder or DynamicAgent
+        self._clock = clock
+        # agent_id -> (agente, último uso), em ordem de uso (LRU no início)
+        self._agents: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._pinned: Dict[str, Any] = {}
+        self._flight = SingleFlight("agent-pool")
+        self.hits = 0
+        self.misses = 0
+        self.creations = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get_or_create_agent(self, agent_id: str) -> Any:
+        agent = self._pinned.get(agent_id)
+        if agent is not None:
+            self.hits += 1
+            return agent
+        self.sweep()
+        entry = self._agents.get(agent_id)
+        if entry is not None:
+            self.hits += 1
+            self._touch(agent_id, entry[0])
+            return entry[0]
+        self.misses += 1
+        return await self._flight.do(agent_id, lambda: self._create(agent_id))
+
+    async def _create(self, agent_id: str) -> Any:
+        # Outra criação pode ter terminado entre a falta e o início desta
+        entry = self._agents.get(agent_id)
+        if entry is not None:
+            return entry[0]
+        agent = self._builder(agent_id)
+        if inspect.isawaitable(agent):
+            agent = await agent
+        self.creations += 1
+        self._touch(agent_id, agent)
+        while len(self._agents) > max(self.max_size - len(self._pinned), 0):
+            evicted, _ = self._agents.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Agente {evicted} descartado do pool (LRU)")
+        return agent
+
+    def _touch(self, agent_id: str, agent: Any) -> None:
+        self._agents[agent_id] = (agent, self._clock())
+        self._agents.move_to_end(agent_id)
 
-    async def get_or_create_agent(self, agent_id: str) -> DynamicAgent:
-        if agent_id not in self._agents:
-            self._agents[agent_id] = DynamicAgent(agent_id)
-        return self._agents[agent_id]
+    def sweep(self) -> int:
+        """Remove os agentes ociosos há mais de idle_ttl; retorna quantos expiraram."""
+        if self.idle_ttl <= 0:
+            return 0
+        deadline = self._clock() - self.idle_ttl
+        expired = 0
+        # Ordem de uso: basta olhar o início até o primeiro agente ainda ativo
+        while self._agents:
+            agent_id, (_, last_used) = next(iter(self._agents.items()))
+            if last_used > deadline:
+                break
+            del self._agents[agent_id]
+            expired += 1
+        self.expirations += expired
+        return expired
+
+    async def warmup(self, agent_ids: Optional[Iterable[str]] = None) -> None:
+        """Pré-instancia (e fixa no pool) os agentes configurados."""
+        if agent_ids is None:
+            agent_ids = [a.strip() for a in settings.agent_pool_warm_agents.split(",") if a.strip()]
+        for agent_id in agent_ids:
+            if agent_id in self._pinned:
+                continue
+            entry = self._agents.pop(agent_id, None)
+            agent = entry[0] if entry is not None else self._builder(agent_id)
+            if inspect.isawaitable(agent):
+                agent = await agent
+            if entry is None:
+                self.creations += 1
+            self._pinned[agent_id] = agent
+        if self._pinned:
+            logger.info(f"Agent pool warmed up: {', '.join(self._pinned)}")
+
+    def __len__(self) -> int:
+        return len(self._agents) + len(self._pinned)
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupação do pool e contadores de acertos, criações e descartes."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "pinned": len(self._pinned),
+            "max_size": self.max_size,
+            "occupancy": len(self) / self.max_size if self.max_size else 0.0,
+            "idle_ttl": self.idle_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "creations": self.creations,
+            "coalesced": self._flight.deduplicated,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "creating": self._flight.in_flight(),
+        }
 
 
 def build_dynamic_agent_card(base_url: str) -> AgentCard:
@@ -146,13 +360,15 @@ def build_asgi_app(host: str = "0.0.0.0", port: int = 8000) -> Starlette:
     factory = DynamicAgentFactory()
     executor = DynamicAgentExecutor(factory)
 
-    httpx_client = httpx.AsyncClient()
-
+    # Em memória (um processo) ou Redis (tarefas visíveis a todos os workers)
+    task_store, push_config_store = build_a2a_stores()
+    # Entrega em segundo plano: webhooks lentos não atrasam a execução
+    push_sender = QueuedPushNotificationSender(config_store=push_config_store)
     request_handler = DefaultRequestHandler(
         agent_executor=executor,  # nosso executor customizado
-        task_store=InMemoryTaskStore(),
-        push_config_store=InMemoryPushNotificationConfigStore(),
-        push_sender=BasePushNotificationSender(httpx_client=httpx_client),
+        task_store=task_store,
+        push_config_store=push_config_store,
+        push_sender=push_sender,
     )
 
     a2a_app = A2AStarletteApplication(
@@ -160,7 +376,47 @@ def build_asgi_app(host: str = "0.0.0.0", port: int = 8000) -> Starlette:
         http_handler=request_handler,
     ).build(rpc_url="/a2a")
 
-    app = Starlette(routes=[Mount("/", app=a2a_app)])
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        # Os pools Redis fecham por último: o sender ainda lê as configurações de push
+        async with redis_pool_lifespan(app), http_client_lifespan(app):
+            await factory.warmup()
+            try:
+                yield
+            finally:
+                # Antes de fechar o cliente HTTP compartilhado
+                await close_forecast_cache()
+                await push_sender.close(settings.a2a_push_drain_timeout)
+
+    async def agent_pool_stats(_request: Request) -> JSONResponse:
+        return JSONResponse(factory.stats())
+
+    async def admission_stats(_request: Request) -> JSONResponse:
+        return JSONResponse(executor.admission.stats())
+
+    async def push_stats(_request: Request) -> JSONResponse:
+        return JSONResponse(push_sender.stats())
+
+    async def redis_pool_stats(_request: Request) -> JSONResponse:
+        return JSONResponse(get_pool_stats())
+
+    async def single_flight_stats(_request: Request) -> JSONResponse:
+        return JSONResponse(get_single_flight_stats())
+
+    app = Starlette(
+        routes=[
+            Route("/agents/pool", agent_pool_stats, methods=["GET"]),
+            Route("/agents/admission", admission_stats, methods=["GET"]),
+            Route("/push/deliveries", push_stats, methods=["GET"]),
+            Route("/redis/pool", redis_pool_stats, methods=["GET"]),
+            Route("/singleflight", single_flight_stats, methods=["GET"]),
+            # Aceita também arrays JSON-RPC (batch) em /a2a
+            Mount("/", app=JSONRPCBatchMiddleware(a2a_app, rpc_path="/a2a")),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.agent_factory = factory
+    app.state.push_sender = push_sender
     return app
 
 
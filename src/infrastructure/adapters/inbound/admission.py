@@ -0,0 +1,181 @@
+"""
+Controle de admissão (backpressure) para o DynamicAgentExecutor.
+
+Cada execução precisa de uma vaga no limite do seu agente e de uma vaga no
+limite global do processo. Sem vaga, a execução entra numa fila limitada e
+espera no máximo `queue_timeout` segundos; com a fila cheia ou o prazo
+esgotado, é rejeitada na hora com OverloadedError, que o executor traduz
+num erro JSON-RPC indicando que o cliente pode tentar de novo.
+
+Em todos os limites, 0 (ou negativo) significa "sem limite": concorrência
+livre, fila sem tamanho máximo ou espera sem prazo.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from config.settings import settings
+
+
+class OverloadedError(Exception):
+    """Execução rejeitada por sobrecarga; pode ser repetida após `retry_after`."""
+
+    def __init__(self, scope: str, reason: str, retry_after: float) -> None:
+        super().__init__(f"Servidor sobrecarregado ({scope}: {reason})")
+        self.scope = scope
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class QueueFullError(Exception):
+    """Fila de espera do limitador cheia."""
+
+
+class Limiter:
+    """Semáforo com fila FIFO limitada e prazo de espera."""
+
+    def __init__(self, limit: int, max_queue: int) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def idle(self) -> bool:
+        return self.active == 0 and not self._waiters
+
+    async def acquire(self, timeout: Optional[float]) -> bool:
+        """
+        Obtém uma vaga e informa se foi preciso esperar na fila.
+
+        Levanta QueueFullError com a fila cheia e asyncio.TimeoutError se a
+        vaga não vier em `timeout` segundos (None: sem prazo).
+        """
+        if self.limit <= 0 or (self.active < self.limit and not self._waiters):
+            self.active += 1
+            return False
+        if self.max_queue > 0 and len(self._waiters) >= self.max_queue:
+            raise QueueFullError()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            if waiter.done() and not waiter.cancelled():
+                # A vaga chegou junto com o prazo/cancelamento: devolve-a
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+        return True
+
+    def release(self) -> None:
+        """Libera uma vaga, entregando-a diretamente ao próximo da fila."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class AdmissionController:
+    """Limites de concorrência global e por agente, com filas e métricas."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        agent_max_concurrency: Optional[int] = None,
+        agent_max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.global_limiter = Limiter(
+            max_concurrency if max_concurrency is not None else settings.a2a_max_concurrency,
+            max_queue if max_queue is not None else settings.a2a_max_queue,
+        )
+        self.agent_max_concurrency = (
+            agent_max_concurrency if agent_max_concurrency is not None else settings.a2a_agent_max_concurrency
+        )
+        self.agent_max_queue = agent_max_queue if agent_max_queue is not None else settings.a2a_agent_max_queue
+        self.queue_timeout = queue_timeout if queue_timeout is not None else settings.a2a_queue_timeout
+        self.retry_after = retry_after if retry_after is not None else settings.a2a_retry_after
+        # Limitadores por agente só existem enquanto há execuções ou fila
+        self._agents: Dict[str, Limiter] = {}
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "queue_timeout": 0}
+        self.queued_total = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @asynccontextmanager
+    async def admit(self, agent_id: str) -> AsyncIterator[None]:
+        """Reserva vagas do agente e global durante o bloco; rejeita se sobrecarregado."""
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            agent = self._agents[agent_id] = Limiter(self.agent_max_concurrency, self.agent_max_queue)
+
+        start = time.perf_counter()
+        deadline = start + self.queue_timeout if self.queue_timeout > 0 else None
+        try:
+            queued = await self._acquire(agent, f"agent {agent_id}", deadline)
+            try:
+                queued |= await self._acquire(self.global_limiter, "global", deadline)
+            except BaseException:
+                agent.release()
+                raise
+        except BaseException:
+            self._forget(agent_id, agent)
+            raise
+        self._record_wait(time.perf_counter() - start, queued)
+
+        try:
+            yield
+        finally:
+            self.global_limiter.release()
+            agent.release()
+            self._forget(agent_id, agent)
+
+    async def _acquire(self, limiter: Limiter, scope: str, deadline: Optional[float]) -> bool:
+        timeout = max(deadline - time.perf_counter(), 0.0) if deadline is not None else None
+        try:
+            return await limiter.acquire(timeout)
+        except QueueFullError:
+            self.rejected["queue_full"] += 1
+            raise OverloadedError(scope, "queue_full", self.retry_after) from None
+        except asyncio.TimeoutError:
+            self.rejected["queue_timeout"] += 1
+            raise OverloadedError(scope, "queue_timeout", self.retry_after) from None
+
+    def _forget(self, agent_id: str, agent: Limiter) -> None:
+        if agent.idle() and self._agents.get(agent_id) is agent:
+            del self._agents[agent_id]
+
+    def _record_wait(self, waited: float, queued: bool) -> None:
+        self.admitted += 1
+        if queued:
+            self.queued_total += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Vagas em uso, profundidade das filas, rejeições e tempo de espera."""
+        return {
+            "active": self.global_limiter.active,
+            "max_concurrency": self.global_limiter.limit,
+            "queue_depth": self.global_limiter.queued,
+            "agent_queue_depth": sum(agent.queued for agent in self._agents.values()),
+            "busy_agents": len(self._agents),
+            "admitted": self.admitted,
+            "queued": self.queued_total,
+            "rejected": dict(self.rejected),
+            "wait_ms_avg": self.wait_seconds_total * 1000 / self.admitted if self.admitted else 0.0,
+            "wait_ms_max": self.wait_seconds_max * 1000,
+        }
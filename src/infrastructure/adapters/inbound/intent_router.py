@@ -0,0 +1,134 @@
+"""
+Roteador de intenções compilado para o DynamicAgent.
+
+As intenções são declaradas (prefixos, palavras-chave e expressões regulares,
+com prioridade) e compiladas uma única vez em três estruturas:
+
+- uma trie de caracteres para os prefixos, percorrida a partir do início do texto;
+- uma trie de tokens para as palavras-chave (inclusive expressões de várias palavras);
+- uma única regex com um grupo nomeado por padrão, em ordem de prioridade.
+
+O custo de rotear depende do tamanho do texto, não do número de intenções
+(exceto pelos padrões regex, que devem ser poucos). O texto é comparado
+sem acentos e sem distinção de maiúsculas.
+"""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+_TOKEN = re.compile(r"\w+")
+_END = ""  # chave de término nas tries (tokens e caracteres nunca são vazios)
+
+# Expressão aritmética: números dos dois lados do operador. Datas ("18/10/2026",
+# "2026-10-18") e palavras hifenizadas não contam.
+ARITHMETIC_PATTERN = r"(?<![\w./-])\d+(?:[.,]\d+)?\s*[-+*/x×÷^]\s*\(?\s*\d+(?:[.,]\d+)?(?![\w./-])"
+
+
+class Intent(BaseModel):
+    """Declaração de uma intenção roteável."""
+    name: str = Field(..., description="Identificador da intenção (e do handler)")
+    prefixes: List[str] = Field(default_factory=list, description="Início do texto")
+    keywords: List[str] = Field(default_factory=list, description="Palavras ou expressões em qualquer ponto do texto")
+    patterns: List[str] = Field(default_factory=list, description="Expressões regulares buscadas no texto")
+    priority: int = Field(default=0, description="Maior prioridade vence quando várias intenções casam")
+
+
+class Route(BaseModel):
+    """Resultado do roteamento, com o motivo da escolha."""
+    intent: str
+    reason: str
+    priority: int
+
+
+def fold(text: str) -> str:
+    """Casefold e remoção de acentos, preservando espaços e pontuação."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class IntentRouter:
+    """Registro de intenções compilado em um casador de passada única."""
+
+    def __init__(self, intents: Iterable[Intent] = ()) -> None:
+        self._intents: Dict[str, Intent] = {}
+        for intent in intents:
+            self._intents[intent.name] = intent
+        self._compile()
+
+    @property
+    def intents(self) -> List[Intent]:
+        return list(self._intents.values())
+
+    def register(self, *intents: Intent) -> None:
+        """Adiciona (ou substitui, pelo nome) intenções e recompila o roteador."""
+        for intent in intents:
+            self._intents[intent.name] = intent
+        self._compile()
+
+    def _compile(self) -> None:
+        self._prefixes: Dict[str, dict] = {}
+        self._keywords: Dict[str, dict] = {}
+        patterns: List[Tuple[int, int, Intent, str]] = []
+
+        for order, intent in enumerate(self._intents.values()):
+            for prefix in intent.prefixes:
+                node = self._prefixes
+                for char in fold(prefix):
+                    node = node.setdefault(char, {})
+                node.setdefault(_END, []).append((intent, f"prefix '{prefix}'"))
+            for keyword in intent.keywords:
+                node = self._keywords
+                for token in _TOKEN.findall(fold(keyword)):
+                    node = node.setdefault(token, {})
+                node.setdefault(_END, []).append((intent, f"keyword '{keyword}'"))
+            for pattern in intent.patterns:
+                re.compile(pattern)  # erro de sintaxe aponta o padrão, não a alternância
+                patterns.append((-intent.priority, order, intent, pattern))
+
+        # Uma alternância com grupos nomeados; em cada posição vence o de maior prioridade
+        patterns.sort(key=lambda entry: entry[:2])
+        self._groups: Dict[str, Tuple[Intent, str]] = {
+            f"p{index}": (intent, pattern) for index, (_, _, intent, pattern) in enumerate(patterns)
+        }
+        alternatives = [f"(?P<{group}>{pattern})" for group, (_, pattern) in self._groups.items()]
+        self._pattern = re.compile("|".join(alternatives)) if alternatives else None
+        self._pattern_priority = -patterns[0][0] if patterns else None
+
+    def route(self, text: str) -> Optional[Route]:
+        """Retorna a intenção de maior prioridade que casa com o texto, ou None."""
+        folded = fold(text or "")
+        best: Optional[Tuple[Intent, str]] = None
+
+        def consider(candidates: List[Tuple[Intent, str]]) -> None:
+            nonlocal best
+            for intent, reason in candidates:
+                if best is None or intent.priority > best[0].priority:
+                    best = (intent, reason)
+
+        node = self._prefixes
+        for char in folded.lstrip():
+            node = node.get(char)
+            if node is None:
+                break
+            consider(node.get(_END, ()))
+
+        tokens = _TOKEN.findall(folded)
+        for start in range(len(tokens)):
+            node = self._keywords
+            for position in range(start, len(tokens)):
+                node = node.get(tokens[position])
+                if node is None:
+                    break
+                consider(node.get(_END, ()))
+
+        # Padrões só rodam se ainda puderem superar a melhor intenção encontrada
+        if self._pattern is not None and (best is None or best[0].priority < self._pattern_priority):
+            for match in self._pattern.finditer(folded):
+                intent, _ = self._groups[match.lastgroup]
+                consider([(intent, f"pattern matched '{match.group()}'")])
+
+        if best is None:
+            return None
+        return Route(intent=best[0].name, reason=best[1], priority=best[0].priority)
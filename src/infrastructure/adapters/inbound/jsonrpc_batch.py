@@ -0,0 +1,154 @@
+"""
+Requisições JSON-RPC em lote (batch) no endpoint /a2a.
+
+O app JSON-RPC do SDK aceita uma única requisição por POST. Este
+middleware ASGI reconhece um corpo que é um array JSON, repassa cada
+elemento ao app do SDK como uma requisição própria (mesma validação,
+mesmos erros JSON-RPC) e executa os elementos em paralelo, limitados a
+`max_concurrency` por lote. As respostas voltam num único array, na
+ordem das requisições; notificações (sem "id") executam mas não geram
+resposta, como manda a especificação JSON-RPC 2.0.
+
+Métodos de streaming (SSE) não cabem numa resposta em lote e recebem
+erro -32600 no próprio elemento.
+"""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.settings import settings
+
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+STREAMING_METHODS = {"message/stream", "tasks/resubscribe"}
+
+
+def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class JSONRPCBatchMiddleware:
+    """Executa arrays JSON-RPC em paralelo sobre o app JSON-RPC do SDK."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rpc_path: str = "/a2a",
+        max_concurrency: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        self.app = app
+        self.rpc_path = rpc_path
+        self.max_concurrency = (
+            max_concurrency if max_concurrency is not None else settings.a2a_batch_max_concurrency
+        )
+        self.max_size = max_size if max_size is not None else settings.a2a_batch_max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != self.rpc_path:
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        if not body.lstrip().startswith(b"["):
+            # Requisição única: segue para o SDK com o corpo já lido
+            await self.app(scope, self._replay(body, receive), send)
+            return
+
+        try:
+            batch = json.loads(body)
+        except json.JSONDecodeError:
+            # O SDK devolve o erro de parse (-32700)
+            await self.app(scope, self._replay(body, receive), send)
+            return
+
+        response = await self._handle_batch(scope, batch)
+        await response(scope, receive, send)
+
+    async def _handle_batch(self, scope: Scope, batch: List[Any]) -> Response:
+        if not batch:
+            return JSONResponse(error_response(None, INVALID_REQUEST, "Empty batch"))
+        if self.max_size > 0 and len(batch) > self.max_size:
+            return JSONResponse(
+                error_response(None, INVALID_REQUEST, f"Batch too large (max {self.max_size} requests)")
+            )
+
+        limit = asyncio.Semaphore(self.max_concurrency if self.max_concurrency > 0 else len(batch))
+
+        async def run(item: Any) -> Optional[Dict[str, Any]]:
+            async with limit:
+                return await self._dispatch(scope, item)
+
+        results = await asyncio.gather(*(run(item) for item in batch))
+        responses = [result for result in results if result is not None]
+        logger.debug(f"JSON-RPC batch: {len(batch)} requests, {len(responses)} responses")
+        if not responses:
+            # Só notificações: nada a responder
+            return Response(status_code=204)
+        return JSONResponse(responses)
+
+    async def _dispatch(self, scope: Scope, item: Any) -> Optional[Dict[str, Any]]:
+        """Executa um elemento do lote pelo app do SDK e devolve sua resposta."""
+        if not isinstance(item, dict):
+            return error_response(None, INVALID_REQUEST, "Invalid Request")
+        request_id = item.get("id")
+        is_notification = "id" not in item
+        if item.get("method") in STREAMING_METHODS:
+            return None if is_notification else error_response(
+                request_id, INVALID_REQUEST, f"Streaming method not supported in batch: {item['method']}"
+            )
+
+        body = json.dumps(item).encode()
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-length", b"transfer-encoding")]
+        headers.append((b"content-length", str(len(body)).encode()))
+        sub_scope = {**scope, "headers": headers}
+
+        status = 500
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(sub_scope, self._replay(body), capture)
+            result = json.loads(b"".join(chunks))
+        except Exception as e:
+            logger.error(f"JSON-RPC batch item {request_id} failed (HTTP {status}): {e}")
+            result = error_response(request_id, INTERNAL_ERROR, "Internal error")
+        return None if is_notification else result
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay(body: bytes, receive: Optional[Receive] = None) -> Receive:
+        """`receive` que entrega o corpo já lido e depois delega (ou espera)."""
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            if receive is not None:
+                return await receive()
+            # Sub-requisições do lote não têm desconexão própria
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        return replay
@@ -0,0 +1,148 @@
+"""
+TaskStore e PushNotificationConfigStore do A2A sobre Redis.
+
+Com os stores em memória do SDK, cada processo enxerga só as próprias
+tarefas: um tasks/get atendido por outro worker ou réplica não encontra a
+tarefa. Estes stores usam o pool Redis compartilhado do processo e o codec
+configurado (REDIS_CODEC), com TTL em todas as chaves:
+
+    a2a:task:{task_id}               tarefa serializada
+    a2a:context_tasks:{context_id}   SET com os IDs de tarefas do contexto
+    a2a:push:{task_id}               HASH config_id -> configuração de push
+
+Cada operação é uma única ida ao servidor (pipeline).
+"""
+from typing import List, Optional, Tuple
+
+import redis.asyncio as redis
+from loguru import logger
+
+# Mesmas variantes de SDK aceitas por a2a_server
+try:
+    from a2a.server.context import ServerCallContext
+    from a2a.server.tasks import (
+        InMemoryPushNotificationConfigStore,
+        InMemoryTaskStore,
+        PushNotificationConfigStore,
+        TaskStore,
+    )
+    from a2a.types import PushNotificationConfig, Task
+except Exception:
+    from python_a2a.server.context import ServerCallContext  # type: ignore
+    from python_a2a.server.tasks import (  # type: ignore
+        InMemoryPushNotificationConfigStore,
+        InMemoryTaskStore,
+        PushNotificationConfigStore,
+        TaskStore,
+    )
+    from python_a2a.types import PushNotificationConfig, Task  # type: ignore
+
+from config.settings import PersistenceBackend, settings
+from infrastructure.adapters.outbound.codecs import ModelCodec, get_codec
+from infrastructure.adapters.outbound.redis_pool import get_shared_client
+
+TASK_KEY = "a2a:task:{}"
+CONTEXT_TASKS_KEY = "a2a:context_tasks:{}"
+PUSH_CONFIG_KEY = "a2a:push:{}"
+
+
+class RedisTaskStore(TaskStore):
+    """TaskStore compartilhado entre workers, com TTL por tarefa."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        ttl: Optional[int] = None,
+        codec: Optional[ModelCodec] = None,
+    ) -> None:
+        self.redis_client = client
+        self.ttl = ttl if ttl is not None else settings.a2a_task_ttl
+        self.codec = codec or get_codec(settings.redis_codec.value)
+
+    def _get_client(self) -> redis.Redis:
+        if self.redis_client is None:
+            # Pool compartilhado por todos os adaptadores do processo
+            self.redis_client = get_shared_client()
+        return self.redis_client
+
+    async def save(self, task: Task, context: Optional[ServerCallContext] = None) -> None:
+        """Grava a tarefa e a indexa pelo contexto, renovando os TTLs."""
+        context_key = CONTEXT_TASKS_KEY.format(task.context_id)
+        pipe = self._get_client().pipeline(transaction=False)
+        pipe.set(TASK_KEY.format(task.id), self.codec.encode(task), ex=self.ttl)
+        pipe.sadd(context_key, task.id)
+        pipe.expire(context_key, self.ttl)
+        await pipe.execute()
+        logger.debug(f"A2A task saved: {task.id} ({task.status.state.value})")
+
+    async def get(self, task_id: str, context: Optional[ServerCallContext] = None) -> Optional[Task]:
+        data = await self._get_client().get(TASK_KEY.format(task_id))
+        return self.codec.decode(data, Task) if data else None
+
+    async def delete(self, task_id: str, context: Optional[ServerCallContext] = None) -> None:
+        client = self._get_client()
+        task = await self.get(task_id)
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(TASK_KEY.format(task_id))
+        if task is not None:
+            pipe.srem(CONTEXT_TASKS_KEY.format(task.context_id), task_id)
+        await pipe.execute()
+
+    async def list_by_context(self, context_id: str) -> List[Task]:
+        """Tarefas (ainda não expiradas) de um contexto, com um MGET."""
+        client = self._get_client()
+        task_ids = sorted(
+            member.decode() if isinstance(member, bytes) else member
+            for member in await client.smembers(CONTEXT_TASKS_KEY.format(context_id))
+        )
+        if not task_ids:
+            return []
+        values = await client.mget([TASK_KEY.format(task_id) for task_id in task_ids])
+        return [self.codec.decode(value, Task) for value in values if value]
+
+
+class RedisPushNotificationConfigStore(PushNotificationConfigStore):
+    """Configurações de push por tarefa em um HASH Redis, com TTL."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        ttl: Optional[int] = None,
+        codec: Optional[ModelCodec] = None,
+    ) -> None:
+        self.redis_client = client
+        self.ttl = ttl if ttl is not None else settings.a2a_task_ttl
+        self.codec = codec or get_codec(settings.redis_codec.value)
+
+    def _get_client(self) -> redis.Redis:
+        if self.redis_client is None:
+            self.redis_client = get_shared_client()
+        return self.redis_client
+
+    async def set_info(self, task_id: str, notification_config: PushNotificationConfig) -> None:
+        """Grava (ou substitui, pelo ID) uma configuração; sem ID, usa o da tarefa."""
+        if notification_config.id is None:
+            notification_config.id = task_id
+        key = PUSH_CONFIG_KEY.format(task_id)
+        pipe = self._get_client().pipeline(transaction=True)
+        pipe.hset(key, notification_config.id, self.codec.encode(notification_config))
+        pipe.expire(key, self.ttl)
+        await pipe.execute()
+
+    async def get_info(self, task_id: str) -> List[PushNotificationConfig]:
+        values = await self._get_client().hvals(PUSH_CONFIG_KEY.format(task_id))
+        return [self.codec.decode(value, PushNotificationConfig) for value in values]
+
+    async def delete_info(self, task_id: str, config_id: Optional[str] = None) -> None:
+        await self._get_client().hdel(PUSH_CONFIG_KEY.format(task_id), config_id or task_id)
+
+
+def build_a2a_stores() -> Tuple[TaskStore, PushNotificationConfigStore]:
+    """
+    Cria os stores do A2A conforme A2A_STORE_BACKEND: em memória (um único
+    processo) ou Redis (vários workers/réplicas).
+    """
+    if settings.a2a_store_backend == PersistenceBackend.REDIS:
+        logger.info("A2A task and push config stores backed by Redis")
+        return RedisTaskStore(), RedisPushNotificationConfigStore()
+    return InMemoryTaskStore(), InMemoryPushNotificationConfigStore()
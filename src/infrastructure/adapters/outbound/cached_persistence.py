@@ -0,0 +1,276 @@
+"""
+Cache L1 em processo (LRU + TTL) sobre um PersistencePort.
+
+Leituras de conversações e tarefas são servidas da memória, sem ida ao
+Redis nem parse pydantic. O cache guarda uma cópia própria do modelo, feita
+na escrita; cada acerto devolve uma cópia rasa com listas e dicts de
+primeiro nível próprios, então atribuir campos ou acrescentar mensagens não
+afeta o cache. Objetos aninhados (mensagens, valores de metadata) são
+compartilhados e devem ser tratados como somente leitura: alterações passam
+por save_*/update_*. Escritas atualizam o cache local e publicam
+a chave alterada num canal Redis pub/sub para que os demais processos a
+descartem. Se a assinatura cair, o cache local é esvaziado, pois
+invalidações podem ter sido perdidas; o TTL limita a defasagem restante.
+"""
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from loguru import logger
+
+from config.settings import settings
+from core.application.ports.outbound.persistence_port import PersistencePort
+from core.domain.models import ConversationContext, Message, MessagePage, PageDirection, Task
+
+
+class LRUTTLCache:
+    """Cache LRU com expiração por TTL e limite de entradas e/ou bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 0,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, size: int = 0, ttl: Optional[float] = None) -> None:
+        if self.max_bytes and size > self.max_bytes:
+            self._remove(key)
+            return
+        self._remove(key)
+        self._entries[key] = (value, self._clock() + (self.ttl if ttl is None else ttl), size)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        if self._remove(key):
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class CachedPersistenceAdapter(PersistencePort):
+    """Decorador de PersistencePort com cache L1 e invalidação entre processos."""
+
+    def __init__(
+        self,
+        inner: PersistencePort,
+        invalidation_client: Optional[redis.Redis] = None,
+        cache: Optional[LRUTTLCache] = None,
+        channel: Optional[str] = None,
+    ) -> None:
+        self.inner = inner
+        if cache is None:
+            cache = LRUTTLCache(
+                max_entries=settings.persistence_cache_max_entries,
+                max_bytes=settings.persistence_cache_max_bytes,
+                ttl=settings.persistence_cache_ttl,
+            )
+        self.cache = cache
+        self.channel = channel or settings.persistence_cache_channel
+        self.invalidation_client = invalidation_client
+        self.instance_id = uuid.uuid4().hex
+        # Incrementado a cada invalidação; uma leitura iniciada antes dela
+        # não pode popular o cache com um valor possivelmente antigo.
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    async def start(self) -> None:
+        """Inicia a escuta de invalidações publicadas por outros processos."""
+        if self.invalidation_client is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+            try:
+                await asyncio.wait_for(self._subscribed.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("L1 cache invalidation channel not subscribed yet; retrying in background")
+
+    async def stop(self) -> None:
+        """Encerra a escuta de invalidações."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+            self._subscribed.clear()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.invalidation_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                self._subscribed.set()
+                async for message in pubsub.listen():
+                    self._handle_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidações podem ter sido perdidas durante a queda
+                logger.warning(f"L1 cache invalidation listener failed, clearing cache: {e}")
+                self._invalidate_all()
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    def _handle_invalidation(self, data: Any) -> None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        if not isinstance(data, str):
+            return
+        origin, _, key = data.partition("|")
+        if origin != self.instance_id and key:
+            self._generation += 1
+            self.cache.invalidate(key)
+
+    def _invalidate_all(self) -> None:
+        self._generation += 1
+        self.cache.clear()
+
+    async def _publish(self, key: str) -> None:
+        if self.invalidation_client is not None:
+            await self.invalidation_client.publish(self.channel, f"{self.instance_id}|{key}")
+
+    def _store(self, key: str, value: Any) -> None:
+        # Cópia própria, desligada do objeto do chamador; o JSON dá o tamanho em bytes
+        snapshot = value.model_dump_json()
+        self.cache.set(key, type(value).model_validate_json(snapshot), len(snapshot))
+
+    @staticmethod
+    def _detached(model: Any) -> Any:
+        """Cópia rasa com listas e dicts de primeiro nível próprios."""
+        copied = model.__copy__()
+        fields = copied.__dict__
+        for name, value in fields.items():
+            if isinstance(value, (list, dict)):
+                fields[name] = value.copy()
+        return copied
+
+    async def _cached_read(self, key: str, load) -> Optional[Any]:
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._detached(cached)
+        generation = self._generation
+        value = await load()
+        if value is not None and generation == self._generation:
+            self._store(key, value)
+        return value
+
+    async def _write_through(self, key: str, value: Any, write) -> None:
+        self._generation += 1
+        self.cache.invalidate(key)
+        await write(value)
+        self._store(key, value)
+        await self._publish(key)
+
+    async def save_conversation(self, conversation: ConversationContext) -> None:
+        """Salva uma conversação e propaga a invalidação."""
+        await self._write_through(
+            f"conversation:{conversation.id}", conversation, self.inner.save_conversation
+        )
+
+    async def get_conversation(self, conversation_id: str) -> Optional[ConversationContext]:
+        """Recupera uma conversação, do cache quando possível."""
+        return await self._cached_read(
+            f"conversation:{conversation_id}",
+            lambda: self.inner.get_conversation(conversation_id),
+        )
+
+    async def save_message(self, message: Message) -> None:
+        """Salva uma mensagem (sem cache)."""
+        await self.inner.save_message(message)
+
+    async def get_messages(self, conversation_id: str) -> List[Message]:
+        """Recupera mensagens de uma conversação (sem cache)."""
+        return await self.inner.get_messages(conversation_id)
+
+    async def get_messages_page(
+        self,
+        conversation_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        direction: PageDirection = PageDirection.BACKWARD,
+        since: Optional[datetime] = None,
+    ) -> MessagePage:
+        """Recupera uma página de mensagens (sem cache)."""
+        return await self.inner.get_messages_page(conversation_id, limit, cursor, direction, since)
+
+    async def save_task(self, task: Task) -> None:
+        """Salva uma tarefa e propaga a invalidação."""
+        await self._write_through(f"task:{task.id}", task, self.inner.save_task)
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Recupera uma tarefa, do cache quando possível."""
+        return await self._cached_read(f"task:{task_id}", lambda: self.inner.get_task(task_id))
+
+    async def update_task(self, task: Task) -> None:
+        """Atualiza uma tarefa e propaga a invalidação."""
+        await self._write_through(f"task:{task.id}", task, self.inner.update_task)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna contadores de acerto/erro do cache."""
+        return self.cache.stats()
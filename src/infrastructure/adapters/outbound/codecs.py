@@ -0,0 +1,92 @@
+"""
+Codecs de serialização dos modelos de domínio gravados no Redis.
+
+JSON (pydantic) é gravado sem prefixo, exatamente como nas versões
+anteriores, para que chaves antigas e leitores legados continuem válidos.
+Formatos binários levam um prefixo de 2 bytes: o byte 0xC1, que nunca inicia
+um documento msgpack ou JSON válido, seguido da versão do formato. A leitura
+escolhe o decodificador pelo prefixo, independente do codec configurado.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional, Set, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+FORMAT_MAGIC = b"\xc1"
+MSGPACK_V1_TAG = FORMAT_MAGIC + b"\x01"
+
+
+class ModelCodec(ABC):
+    """Interface de codificação de modelos pydantic para bytes."""
+
+    name: str
+
+    @abstractmethod
+    def encode(self, model: BaseModel, exclude: Optional[Set[str]] = None) -> bytes:
+        """Codifica um modelo."""
+        pass
+
+    def decode(self, data: Union[bytes, str], model_cls: Type[ModelT]) -> ModelT:
+        """Decodifica dados em qualquer formato conhecido."""
+        return decode_model(data, model_cls)
+
+
+class JsonCodec(ModelCodec):
+    """JSON do pydantic, sem prefixo (formato legado)."""
+
+    name = "json"
+
+    def encode(self, model: BaseModel, exclude: Optional[Set[str]] = None) -> bytes:
+        return model.model_dump_json(exclude=exclude).encode()
+
+
+class MsgPackCodec(ModelCodec):
+    """msgpack compacto com prefixo de formato/versão."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        if not MSGPACK_AVAILABLE:
+            raise RuntimeError(
+                "REDIS_CODEC=msgpack, mas o pacote opcional msgpack não está instalado. "
+                "Instale com: pip install msgpack (ou use REDIS_CODEC=json)"
+            )
+
+    def encode(self, model: BaseModel, exclude: Optional[Set[str]] = None) -> bytes:
+        payload = model.model_dump(mode="json", exclude=exclude)
+        return MSGPACK_V1_TAG + msgpack.packb(payload, use_bin_type=True)
+
+
+def decode_model(data: Union[bytes, str], model_cls: Type[ModelT]) -> ModelT:
+    """Decodifica um modelo detectando o formato pelo prefixo."""
+    if isinstance(data, str):
+        return model_cls.model_validate_json(data)
+    if data[:1] != FORMAT_MAGIC:
+        return model_cls.model_validate_json(data)
+    if data[:2] == MSGPACK_V1_TAG:
+        if not MSGPACK_AVAILABLE:
+            raise RuntimeError("Dados em msgpack encontrados, mas o pacote msgpack não está instalado")
+        return model_cls.model_validate(msgpack.unpackb(data[2:], raw=False))
+    raise ValueError(f"Formato de serialização desconhecido: {data[:2]!r}")
+
+
+CODECS = {
+    JsonCodec.name: JsonCodec,
+    MsgPackCodec.name: MsgPackCodec,
+}
+
+
+def get_codec(name: str) -> ModelCodec:
+    """Cria o codec pelo nome configurado."""
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Codec desconhecido: {name} (opções: {', '.join(CODECS)})")
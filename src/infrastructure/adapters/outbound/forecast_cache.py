@@ -0,0 +1,203 @@
+"""
+Cache de respostas de previsão por célula de grade, variáveis e hora de modelo.
+
+Coordenadas são arredondadas para uma grade (padrão 0,1°, próxima da
+resolução dos modelos do Open-Meteo) e a consulta ao upstream usa o centro
+da célula, então todos os pontos da célula compartilham a mesma resposta.
+Os dados do upstream mudam a cada hora: uma entrada é fresca enquanto a hora
+de modelo em que foi buscada for a atual. Depois disso ela ainda é servida
+imediatamente por até `max_stale` segundos (stale-while-revalidate),
+enquanto uma única atualização roda em segundo plano.
+"""
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from infrastructure.adapters.outbound.cached_persistence import LRUTTLCache
+
+ForecastFetcher = Callable[[float, float, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class ForecastCache:
+    """Cache de previsões com grade espacial, hora de modelo e stale-while-revalidate."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        grid_degrees: Optional[float] = None,
+        update_interval: Optional[float] = None,
+        max_stale: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.grid_degrees = grid_degrees or settings.forecast_cache_grid_degrees
+        self.update_interval = update_interval or settings.forecast_cache_update_interval
+        self.max_stale = max_stale if max_stale is not None else settings.forecast_cache_max_stale
+        self._clock = clock
+        # Expiração dura: fim da hora de modelo mais a janela de dados velhos
+        self.cache = LRUTTLCache(
+            max_entries=max_entries or settings.forecast_cache_max_entries,
+            ttl=self.update_interval + self.max_stale,
+            clock=clock,
+        )
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        """Índices da célula de grade que contém a coordenada."""
+        return round(latitude / self.grid_degrees), round(longitude / self.grid_degrees)
+
+    def cell_center(self, cell: Tuple[int, int]) -> Tuple[float, float]:
+        """Coordenadas do centro de uma célula."""
+        return round(cell[0] * self.grid_degrees, 4), round(cell[1] * self.grid_degrees, 4)
+
+    def model_hour(self, timestamp: Optional[float] = None) -> int:
+        """Hora de modelo (ciclo de atualização do upstream) de um instante."""
+        return int((self._clock() if timestamp is None else timestamp) // self.update_interval)
+
+    @staticmethod
+    def canonical_params(params: Dict[str, Any]) -> str:
+        """Representação estável dos parâmetros; listas de variáveis são ordenadas."""
+        parts = []
+        for name in sorted(params):
+            value = params[name]
+            if isinstance(value, str) and "," in value:
+                value = ",".join(sorted(v.strip() for v in value.split(",")))
+            parts.append(f"{name}={value}")
+        return "&".join(parts)
+
+    def key(self, cell: Tuple[int, int], params: Dict[str, Any]) -> str:
+        return f"{cell[0]}:{cell[1]}:{self.canonical_params(params)}"
+
+    async def get_or_fetch(
+        self,
+        latitude: float,
+        longitude: float,
+        params: Dict[str, Any],
+        fetch: ForecastFetcher,
+    ) -> Dict[str, Any]:
+        """
+        Retorna a previsão da célula, buscando no upstream quando necessário.
+
+        `fetch` recebe as coordenadas do centro da célula e os parâmetros.
+        Entradas velhas são devolvidas na hora e atualizadas em segundo plano;
+        sem entrada utilizável, a busca é feita de forma síncrona.
+        """
+        cached = self.lookup(latitude, longitude, params, fetch)
+        if cached is not None:
+            return cached
+        cell = self.cell(latitude, longitude)
+        key = self.key(cell, params)
+        model_hour = self.model_hour()
+        center_latitude, center_longitude = self.cell_center(cell)
+        data = await fetch(center_latitude, center_longitude, params)
+        self._put(key, model_hour, data)
+        return data
+
+    def lookup(
+        self,
+        latitude: float,
+        longitude: float,
+        params: Dict[str, Any],
+        fetch: ForecastFetcher,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retorna a entrada fresca ou velha da célula, ou None se não houver.
+
+        Entradas velhas agendam uma atualização em segundo plano via `fetch`.
+        """
+        cell = self.cell(latitude, longitude)
+        key = self.key(cell, params)
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        model_hour, payload = entry
+        if model_hour == self.model_hour():
+            self.fresh_hits += 1
+        else:
+            self.stale_hits += 1
+            self._schedule_refresh(key, cell, params, fetch)
+        return json.loads(payload)
+
+    def store(self, latitude: float, longitude: float, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Guarda a resposta buscada para o centro da célula da coordenada."""
+        self._put(self.key(self.cell(latitude, longitude), params), self.model_hour(), data)
+
+    def _put(self, key: str, model_hour: int, data: Dict[str, Any]) -> None:
+        # A entrada expira de vez `max_stale` segundos após o fim da sua hora
+        expires_in = (model_hour + 1) * self.update_interval + self.max_stale - self._clock()
+        self.cache.set(key, (model_hour, json.dumps(data)), ttl=max(expires_in, 0.0))
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        cell: Tuple[int, int],
+        params: Dict[str, Any],
+        fetch: ForecastFetcher,
+    ) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, cell, params, fetch))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        cell: Tuple[int, int],
+        params: Dict[str, Any],
+        fetch: ForecastFetcher,
+    ) -> None:
+        try:
+            model_hour = self.model_hour()
+            latitude, longitude = self.cell_center(cell)
+            self._put(key, model_hour, await fetch(latitude, longitude, params))
+            self.refreshes += 1
+        except Exception as e:
+            # Mantém a entrada velha; a próxima leitura tenta de novo
+            self.refresh_errors += 1
+            logger.warning(f"Forecast background refresh failed for {key}: {e}")
+
+    async def aclose(self) -> None:
+        """Cancela atualizações em segundo plano pendentes."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna contadores de acertos (frescos/velhos), faltas e atualizações."""
+        return {
+            "entries": len(self.cache),
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._refreshing),
+        }
+
+
+_shared_cache: Optional[ForecastCache] = None
+
+
+def get_forecast_cache() -> ForecastCache:
+    """Obtém (ou cria) o cache de previsões compartilhado pelo processo."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ForecastCache()
+    return _shared_cache
+
+
+async def close_forecast_cache() -> None:
+    """Cancela as atualizações em segundo plano do cache compartilhado."""
+    if _shared_cache is not None:
+        await _shared_cache.aclose()
@@ -0,0 +1,268 @@
+"""
+Geocodificador offline sobre um gazetteer binário mapeado em memória.
+
+O arquivo (gerado por scripts/build_gazetteer.py a partir do GeoNames) é
+aberto com mmap e lido sem cópia: os registros de tamanho fixo ficam
+ordenados pelo nome normalizado, o que permite busca exata com bisect, e
+um índice de trigramas (hash CRC32 -> lista de registros) atende a busca
+aproximada. Empates entre homônimas são resolvidos pela população.
+
+Layout (little-endian):
+    cabeçalho   <4sIIIII  magic, registros, trigramas, postings, bytes de texto, reservado
+    registros   <IHIHffI  chave (offset, tamanho), exibição (offset, tamanho), lat, lon, população
+    trigramas   uint32[n] hashes ordenados, uint32[n] offsets, uint32[n] tamanhos
+    postings    uint32[m] índices de registros
+    texto       UTF-8: chaves normalizadas e "nome\\tpaís\\tcódigo ISO"
+"""
+import mmap
+import struct
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from core.domain.models import GeoLocation
+from infrastructure.adapters.outbound.geocoding_cache import normalize_location
+
+MAGIC = b"GAZ1"
+HEADER = struct.Struct("<4sIIIII")
+RECORD = struct.Struct("<IHIHffI")
+
+# Limites da busca aproximada: trigramas muito comuns pouco discriminam
+MAX_POSTINGS_PER_TRIGRAM = 20000
+FUZZY_CANDIDATES = 25
+
+
+def trigrams(key: str) -> Set[str]:
+    """Trigramas de uma chave normalizada, com bordas marcadas por espaço."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_hash(trigram: str) -> int:
+    return zlib.crc32(trigram.encode())
+
+
+class Gazetteer:
+    """Índice de cidades somente leitura sobre um arquivo mapeado em memória."""
+
+    def __init__(self, path: str, min_similarity: Optional[float] = None) -> None:
+        self.path = path
+        self.min_similarity = min_similarity if min_similarity is not None else settings.gazetteer_min_similarity
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = buffer = memoryview(self._mmap)
+        magic, self.size, trigram_count, postings_count, strings_size, _ = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"Arquivo de gazetteer inválido: {path}")
+
+        offset = HEADER.size
+        self._records = buffer[offset:offset + self.size * RECORD.size]
+        offset += self.size * RECORD.size
+        self._trigram_hashes = buffer[offset:offset + 4 * trigram_count].cast("I")
+        offset += 4 * trigram_count
+        self._trigram_offsets = buffer[offset:offset + 4 * trigram_count].cast("I")
+        offset += 4 * trigram_count
+        self._trigram_lengths = buffer[offset:offset + 4 * trigram_count].cast("I")
+        offset += 4 * trigram_count
+        self._postings = buffer[offset:offset + 4 * postings_count].cast("I")
+        offset += 4 * postings_count
+        self._strings = buffer[offset:offset + strings_size]
+
+    def close(self) -> None:
+        """Libera o mapeamento do arquivo."""
+        for view in (self._records, self._trigram_hashes, self._trigram_offsets,
+                     self._trigram_lengths, self._postings, self._strings, self._buffer):
+            view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ------------------------------------------------------------------
+    # Acesso aos registros
+    # ------------------------------------------------------------------
+
+    def _record(self, index: int) -> Tuple[int, int, int, int, float, float, int]:
+        return RECORD.unpack_from(self._records, index * RECORD.size)
+
+    def _key(self, index: int) -> str:
+        key_offset, key_length = RECORD.unpack_from(self._records, index * RECORD.size)[:2]
+        return str(self._strings[key_offset:key_offset + key_length], "utf-8")
+
+    def _population(self, index: int) -> int:
+        return self._record(index)[6]
+
+    def _display(self, index: int) -> List[str]:
+        _, _, display_offset, display_length, _, _, _ = self._record(index)
+        return str(self._strings[display_offset:display_offset + display_length], "utf-8").split("\t")
+
+    def _location(self, index: int) -> GeoLocation:
+        name, country, _ = self._display(index)
+        latitude, longitude = self._record(index)[4:6]
+        return GeoLocation(name=name, country=country, latitude=round(latitude, 5), longitude=round(longitude, 5))
+
+    # ------------------------------------------------------------------
+    # Busca
+    # ------------------------------------------------------------------
+
+    def lookup(self, location: str) -> Optional[GeoLocation]:
+        """
+        Resolve uma localização localmente só por nome exato (normalizado);
+        None quando não há correspondência. Um qualificador após a última
+        vírgula ("Paris, FR", "Paris, França") restringe o país.
+
+        Prefixos e erros de digitação não resolvem aqui: um quase acerto
+        apontaria para a cidade errada sem consultar a API remota.
+        """
+        return self._resolve(location, self._exact)
+
+    def closest(self, location: str) -> Optional[GeoLocation]:
+        """
+        Cidade mais parecida (trigramas, Dice >= min_similarity), só quando
+        a melhor candidata é única; para quando a API remota não responde.
+        """
+        return self._resolve(location, self._fuzzy)
+
+    def _resolve(self, location: str, strategy: Callable[[str], List[int]]) -> Optional[GeoLocation]:
+        key = normalize_location(location)
+        if not key:
+            return None
+        if "," in location:
+            # Qualificador sem correspondência ("Paris, Texas") fica para a API
+            # remota, em vez de cair numa homônima de outro país
+            name, _, qualifier = location.rpartition(",")
+            index = self._best(strategy, normalize_location(name), normalize_location(qualifier))
+            if index is None:
+                index = self._best(strategy, key, None)
+        else:
+            index = self._best(strategy, key, None)
+        return self._location(index) if index is not None else None
+
+    def _best(self, strategy: Callable[[str], List[int]], key: str, country: Optional[str]) -> Optional[int]:
+        if not key:
+            return None
+        matches = [i for i in strategy(key) if country is None or self._country_matches(i, country)]
+        # Homônimas (mesma chave) são desempatadas pela população
+        return max(matches, key=self._population) if matches else None
+
+    def _country_matches(self, index: int, country: str) -> bool:
+        _, name, code = self._display(index)
+        return country in (normalize_location(name), code.lower())
+
+    def _exact(self, key: str) -> List[int]:
+        start = bisect_left(range(self.size), key, key=self._key)
+        end = bisect_right(range(self.size), key, lo=start, key=self._key)
+        return list(range(start, end))
+
+    def _fuzzy(self, key: str) -> List[int]:
+        if len(key) < 4:
+            return []
+        query = trigrams(key)
+        counts: Counter = Counter()
+        for trigram in query:
+            hashed = trigram_hash(trigram)
+            position = bisect_left(self._trigram_hashes, hashed)
+            if position == len(self._trigram_hashes) or self._trigram_hashes[position] != hashed:
+                continue
+            length = self._trigram_lengths[position]
+            if length > MAX_POSTINGS_PER_TRIGRAM:
+                continue
+            offset = self._trigram_offsets[position]
+            counts.update(self._postings[offset:offset + length])
+
+        scored = []
+        for index, _ in counts.most_common(FUZZY_CANDIDATES):
+            candidate = trigrams(self._key(index))
+            # Coeficiente de Dice sobre os trigramas reais (hashes podem colidir)
+            similarity = 2 * len(query & candidate) / (len(query) + len(candidate))
+            scored.append((similarity, index))
+        if not scored:
+            return []
+        best = max(similarity for similarity, _ in scored)
+        if best < self.min_similarity:
+            return []
+        closest = [index for similarity, index in scored if similarity == best]
+        # Chaves diferentes empatadas: ambíguo, melhor não adivinhar
+        if len({self._key(index) for index in closest}) > 1:
+            return []
+        return closest
+
+
+def build_gazetteer(
+    entries: Iterable[Tuple[str, str, str, float, float, int]],
+    output_path: str,
+    extra_names: Optional[Dict[int, Iterable[str]]] = None,
+) -> int:
+    """
+    Grava um gazetteer binário a partir de (nome, país, código, lat, lon, população).
+
+    `extra_names` associa a posição de uma entrada a grafias alternativas,
+    indexadas como chaves adicionais do mesmo lugar. Retorna o número de
+    registros gravados.
+    """
+    strings = bytearray()
+    string_offsets: Dict[str, Tuple[int, int]] = {}
+
+    def intern(text: str) -> Tuple[int, int]:
+        if text not in string_offsets:
+            data = text.encode()[:0xFFFF]
+            string_offsets[text] = (len(strings), len(data))
+            strings.extend(data)
+        return string_offsets[text]
+
+    rows = []
+    for position, (name, country, code, latitude, longitude, population) in enumerate(entries):
+        keys = {normalize_location(name)}
+        keys.update(normalize_location(n) for n in (extra_names or {}).get(position, ()))
+        display = intern(f"{name}\t{country}\t{code}")
+        for key in sorted(k for k in keys if k):
+            rows.append((key, display, latitude, longitude, population))
+    rows.sort(key=lambda row: (row[0], -row[4]))
+
+    records = bytearray()
+    postings_by_trigram: Dict[int, List[int]] = {}
+    for index, (key, display, latitude, longitude, population) in enumerate(rows):
+        key_offset, key_length = intern(key)
+        records.extend(RECORD.pack(
+            key_offset, key_length, display[0], display[1], latitude, longitude, min(population, 0xFFFFFFFF)
+        ))
+        for trigram in trigrams(key):
+            postings_by_trigram.setdefault(trigram_hash(trigram), []).append(index)
+
+    hashes = sorted(postings_by_trigram)
+    offsets, lengths, postings = [], [], []
+    for hashed in hashes:
+        offsets.append(len(postings))
+        lengths.append(len(postings_by_trigram[hashed]))
+        postings.extend(postings_by_trigram[hashed])
+
+    with open(output_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(rows), len(hashes), len(postings), len(strings), 0))
+        file.write(records)
+        for array in (hashes, offsets, lengths, postings):
+            file.write(struct.pack(f"<{len(array)}I", *array))
+        file.write(strings)
+    logger.info(f"Gazetteer built: {len(rows)} records, {len(hashes)} trigrams -> {output_path}")
+    return len(rows)
+
+
+_shared_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """Obtém o gazetteer do processo; None se GAZETTEER_PATH não estiver configurado."""
+    global _shared_gazetteer, _gazetteer_loaded
+    if not _gazetteer_loaded:
+        _gazetteer_loaded = True
+        if settings.gazetteer_path:
+            try:
+                _shared_gazetteer = Gazetteer(settings.gazetteer_path)
+                logger.info(f"Gazetteer loaded: {len(_shared_gazetteer)} records from {settings.gazetteer_path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Gazetteer unavailable, using remote geocoding only: {e}")
+    return _shared_gazetteer
@@ -0,0 +1,150 @@
+"""
+Cache de geocodificação (localização -> coordenadas) em dois níveis.
+
+Nível 1: LRU em processo. Nível 2 (opcional): Redis, compartilhado entre
+processos e reinícios. As chaves são normalizadas (caixa, acentos, espaços e
+pontuação), então "São Paulo", "sao  paulo" e "SAO PAULO" ocupam uma única
+entrada. Localizações inexistentes também são guardadas (cache negativo), com
+TTL mais curto; falhas do serviço de geocodificação nunca são guardadas.
+Faltas concorrentes para a mesma chave compartilham uma única consulta.
+"""
+import re
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import redis.asyncio as redis
+from loguru import logger
+
+from config.settings import settings
+from core.domain.models import GeoLocation
+from infrastructure.adapters.outbound.cached_persistence import LRUTTLCache
+from infrastructure.adapters.outbound.redis_pool import get_shared_client
+from infrastructure.adapters.outbound.singleflight import SingleFlight, get_single_flight
+
+GEOCODE_KEY_PREFIX = "geocode:"
+# Marcador de localização inexistente (L1 e L2)
+NOT_FOUND = ""
+
+_PUNCTUATION = re.compile(r"[^\w]+")
+
+
+def normalize_location(location: str) -> str:
+    """Normaliza o nome de uma localização para uso como chave de cache."""
+    decomposed = unicodedata.normalize("NFKD", location)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_PUNCTUATION.sub(" ", stripped.casefold()).split())
+
+
+class GeocodingCache:
+    """Cache de geocodificação com LRU local, Redis opcional e cache negativo."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        cache: Optional[LRUTTLCache] = None,
+        flight: Optional[SingleFlight] = None,
+    ) -> None:
+        self.ttl = ttl if ttl is not None else settings.geocoding_cache_ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else settings.geocoding_negative_ttl
+        if cache is None:
+            cache = LRUTTLCache(max_entries=settings.geocoding_cache_max_entries, ttl=self.ttl)
+        self.cache = cache
+        self.client = client
+        self.flight = flight if flight is not None else get_single_flight("geocoding")
+        self.l2_hits = 0
+        self.l2_errors = 0
+        self.upstream_calls = 0
+
+    async def get_or_load(
+        self,
+        location: str,
+        loader: Callable[[str], Awaitable[Optional[GeoLocation]]],
+    ) -> Optional[GeoLocation]:
+        """
+        Resolve uma localização pelo cache ou, na falta, pelo `loader`.
+
+        O `loader` recebe o texto original e retorna None para localizações
+        inexistentes; exceções dele são propagadas sem popular o cache.
+        """
+        key = normalize_location(location)
+        if not key:
+            return None
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._decode(cached)
+        result = await self.flight.do(key, lambda: self._load(key, location, loader))
+        # Quem aguardou a mesma chamada não compartilha o mesmo objeto
+        return result.model_copy() if result is not None else None
+
+    async def _load(
+        self,
+        key: str,
+        location: str,
+        loader: Callable[[str], Awaitable[Optional[GeoLocation]]],
+    ) -> Optional[GeoLocation]:
+        cached = await self._l2_get(key)
+        if cached is not None:
+            self.l2_hits += 1
+            self.cache.set(key, cached, ttl=self._ttl_for(cached))
+            return self._decode(cached)
+
+        self.upstream_calls += 1
+        result = await loader(location)
+        entry = result.model_dump_json() if result is not None else NOT_FOUND
+        self.cache.set(key, entry, ttl=self._ttl_for(entry))
+        await self._l2_set(key, entry)
+        return result
+
+    def _ttl_for(self, entry: str) -> float:
+        return self.ttl if entry != NOT_FOUND else self.negative_ttl
+
+    @staticmethod
+    def _decode(entry: str) -> Optional[GeoLocation]:
+        return GeoLocation.model_validate_json(entry) if entry != NOT_FOUND else None
+
+    async def _l2_get(self, key: str) -> Optional[str]:
+        if self.client is None:
+            return None
+        try:
+            data: Union[bytes, str, None] = await self.client.get(GEOCODE_KEY_PREFIX + key)
+        except Exception as e:
+            # O Redis é só um segundo nível: indisponível, segue para o upstream
+            self.l2_errors += 1
+            logger.warning(f"Geocoding cache L2 read failed: {e}")
+            return None
+        if isinstance(data, bytes):
+            data = data.decode()
+        return data
+
+    async def _l2_set(self, key: str, entry: str) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(GEOCODE_KEY_PREFIX + key, entry, ex=int(self._ttl_for(entry)))
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Geocoding cache L2 write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna contadores dos dois níveis e chamadas ao upstream."""
+        return {
+            **self.cache.stats(),
+            "l2_hits": self.l2_hits,
+            "l2_errors": self.l2_errors,
+            "upstream_calls": self.upstream_calls,
+        }
+
+
+_shared_cache: Optional[GeocodingCache] = None
+
+
+def get_geocoding_cache() -> GeocodingCache:
+    """Obtém (ou cria) o cache de geocodificação compartilhado pelo processo."""
+    global _shared_cache
+    if _shared_cache is None:
+        client = get_shared_client() if settings.geocoding_cache_redis_enabled else None
+        _shared_cache = GeocodingCache(client=client)
+    return _shared_cache
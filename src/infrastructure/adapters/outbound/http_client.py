@@ -0,0 +1,68 @@
+"""
+Cliente HTTP compartilhado pelo processo, com conexões persistentes.
+
+Um único httpx.AsyncClient por processo reaproveita conexões TCP/TLS entre
+requisições (geocodificação, previsão, notificações push). Limites e
+timeouts vêm do Settings; HTTP/2 é opcional e requer o pacote h2.
+"""
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+from loguru import logger
+
+from config.settings import settings
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def build_http_client(**overrides: Any) -> httpx.AsyncClient:
+    """Cria um AsyncClient com limites e timeouts configurados."""
+    http2 = settings.http2_enabled
+    if http2 and not HTTP2_AVAILABLE:
+        logger.warning("HTTP/2 habilitado, mas o pacote h2 não está instalado; usando HTTP/1.1")
+        http2 = False
+    options = {
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout),
+        "http2": http2,
+        **overrides,
+    }
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Obtém (ou cria) o cliente HTTP compartilhado pelo processo."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = build_http_client()
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Fecha o cliente compartilhado e suas conexões."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("Shared HTTP client closed")
+
+
+@asynccontextmanager
+async def http_client_lifespan(_app: Any = None) -> AsyncIterator[None]:
+    """Lifespan (Starlette/FastMCP) que abre e fecha o cliente compartilhado."""
+    get_http_client()
+    try:
+        yield
+    finally:
+        await close_http_client()
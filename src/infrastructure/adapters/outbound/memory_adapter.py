@@ -0,0 +1,315 @@
+"""
+Adaptador de persistência em memória, para execução em nó único e testes.
+
+Espelha o layout de chaves do RedisAdapter num único espaço de chaves LRU:
+message:{id}, conversation_messages:{id}, conversation:{id}, task:{id} e
+cache:{key}. Modelos são guardados como snapshots JSON, que isolam o
+armazenamento dos objetos do chamador e são reconstruídos pelo parser do
+pydantic mais rápido que um deep copy. A expiração usa um heap de prazos
+com remoção preguiçosa (sem uma task asyncio por chave). A memória é
+limitada em entradas e em bytes estimados (tamanho do snapshot JSON, ou a
+soma dos IDs numa lista de mensagens), com despejo da menos usada. Nenhum
+método suspende (await) no meio de uma alteração, então cada operação é
+atômica sob concorrência asyncio.
+"""
+import bisect
+import heapq
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from core.application.ports.outbound.persistence_port import PersistencePort
+from core.domain.models import ConversationContext, Message, MessagePage, PageDirection, Task
+from core.domain.repositories import CacheRepository, ConversationRepository, TaskRepository
+
+
+class InMemoryAdapter(PersistencePort, TaskRepository, ConversationRepository, CacheRepository):
+    """Adaptador de persistência em memória com TTL, LRU e índice de status."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        message_ttl: int = 86400,
+        conversation_ttl: int = 86400,
+        task_ttl: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries or settings.memory_store_max_entries
+        # 0 = sem limite em bytes
+        self.max_bytes = max_bytes if max_bytes is not None else settings.memory_store_max_bytes
+        self.message_ttl = message_ttl
+        self.conversation_ttl = conversation_ttl
+        self.task_ttl = task_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._deadlines: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # status -> [(created_at, task_id)] ordenado; task_id -> (status, created_at)
+        self._status_index: Dict[str, List[Tuple[float, str]]] = {}
+        self._task_status: Dict[str, Tuple[str, float]] = {}
+        self.evictions = 0
+        self.expirations = 0
+
+    # ------------------------------------------------------------------
+    # Espaço de chaves com TTL e LRU
+    # ------------------------------------------------------------------
+
+    def _get(self, key: str) -> Any:
+        self._purge_expired()
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        """Tamanho estimado: o snapshot JSON ou a soma dos IDs de uma lista."""
+        if isinstance(value, list):
+            return sum(len(item) + 1 for item in value)
+        return len(value)
+
+    def _set(self, key: str, value: Any, ttl: Optional[float], size: Optional[int] = None) -> None:
+        self._purge_expired()
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        size = self._size(value) if size is None else size
+        self._bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+        if ttl:
+            deadline = self._clock() + ttl
+            self._deadlines[key] = deadline
+            heapq.heappush(self._expiry_heap, (deadline, key))
+        else:
+            self._deadlines.pop(key, None)
+        # A entrada recém-gravada nunca é despejada, mesmo maior que o limite
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._delete(oldest)
+            self.evictions += 1
+
+    def _delete(self, key: str) -> bool:
+        self._deadlines.pop(key, None)
+        if self._entries.pop(key, None) is None:
+            return False
+        self._bytes -= self._sizes.pop(key, 0)
+        if key.startswith("task:"):
+            self._unindex_task(key[len("task:"):])
+        return True
+
+    def _purge_expired(self) -> None:
+        """Remove as chaves vencidas; entradas obsoletas do heap são descartadas."""
+        now = self._clock()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, key = heapq.heappop(heap)
+            if self._deadlines.get(key) == deadline:
+                self._delete(key)
+                self.expirations += 1
+        # Compacta o heap quando acumula muitas entradas substituídas
+        if len(heap) > 2 * len(self._deadlines) + 1024:
+            self._expiry_heap = [(d, k) for k, d in self._deadlines.items()]
+            heapq.heapify(self._expiry_heap)
+
+    # ------------------------------------------------------------------
+    # Índice de tarefas por status (ordenado por created_at)
+    # ------------------------------------------------------------------
+
+    def _index_task(self, task: Task) -> None:
+        self._unindex_task(task.id)
+        entry = (task.created_at.timestamp(), task.id)
+        bisect.insort(self._status_index.setdefault(task.status, []), entry)
+        self._task_status[task.id] = (task.status, entry[0])
+
+    def _unindex_task(self, task_id: str) -> None:
+        previous = self._task_status.pop(task_id, None)
+        if previous is None:
+            return
+        status, score = previous
+        index = self._status_index.get(status, [])
+        position = bisect.bisect_left(index, (score, task_id))
+        if position < len(index) and index[position] == (score, task_id):
+            del index[position]
+
+    # ------------------------------------------------------------------
+    # Conversações
+    # ------------------------------------------------------------------
+
+    async def save_conversation(self, conversation: ConversationContext) -> None:
+        """Salva uma conversação."""
+        self._set(f"conversation:{conversation.id}", conversation.model_dump_json(), self.conversation_ttl)
+        logger.debug(f"Conversation saved: {conversation.id}")
+
+    async def get_conversation(self, conversation_id: str) -> Optional[ConversationContext]:
+        """Recupera uma conversação."""
+        data = self._get(f"conversation:{conversation_id}")
+        return ConversationContext.model_validate_json(data) if data is not None else None
+
+    async def update_conversation(self, conversation: ConversationContext) -> None:
+        """Atualiza uma conversação."""
+        await self.save_conversation(conversation)
+
+    async def delete_conversation(self, conversation_id: str) -> None:
+        """Remove uma conversação."""
+        self._delete(f"conversation:{conversation_id}")
+
+    # ------------------------------------------------------------------
+    # Mensagens
+    # ------------------------------------------------------------------
+
+    async def save_message(self, message: Message) -> None:
+        """Salva uma mensagem."""
+        self._set(f"message:{message.id}", message.model_dump_json(), self.message_ttl)
+        if "conversation_id" in message.metadata:
+            key = f"conversation_messages:{message.metadata['conversation_id']}"
+            message_ids = self._get(key) or []
+            message_ids.append(message.id)
+            # Tamanho incremental: recalcular a lista inteira a cada mensagem seria O(n)
+            size = self._sizes.get(key, 0) + len(message.id) + 1
+            self._set(key, message_ids, self.message_ttl, size)
+        logger.debug(f"Message saved: {message.id}")
+
+    async def get_messages(self, conversation_id: str) -> List[Message]:
+        """Recupera mensagens de uma conversação em ordem cronológica."""
+        message_ids = self._get(f"conversation_messages:{conversation_id}") or []
+        return self._load_messages(message_ids)
+
+    async def get_messages_page(
+        self,
+        conversation_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        direction: PageDirection = PageDirection.BACKWARD,
+        since: Optional[datetime] = None,
+    ) -> MessagePage:
+        """
+        Recupera uma página de mensagens.
+
+        O cursor segue a mesma convenção do RedisAdapter: posição da
+        mensagem contada a partir da mais antiga. Cursor inválido levanta
+        ValueError.
+        """
+        position = MessagePage.parse_cursor(cursor)
+        message_ids = self._get(f"conversation_messages:{conversation_id}") or []
+        length = len(message_ids)
+        if limit <= 0:
+            return MessagePage()
+
+        if direction == PageDirection.BACKWARD:
+            end = length if position is None else min(position, length)
+            start = max(0, end - limit)
+            messages = self._load_messages(message_ids[start:end])
+            next_cursor = str(start) if start > 0 else None
+            if since is not None:
+                recent = [m for m in messages if m.timestamp >= since]
+                if len(recent) < len(messages):
+                    next_cursor = None
+                messages = recent
+        else:
+            if position is None and since is not None:
+                start = length
+                while start > 0:
+                    data = self._get(f"message:{message_ids[start - 1]}")
+                    if data is not None and Message.model_validate_json(data).timestamp < since:
+                        break
+                    start -= 1
+            else:
+                start = position or 0
+            messages = self._load_messages(message_ids[start:start + limit])
+            if since is not None:
+                messages = [m for m in messages if m.timestamp >= since]
+            next_cursor = str(start + limit) if start + limit < length else None
+
+        return MessagePage(messages=messages, next_cursor=next_cursor)
+
+    def _load_messages(self, message_ids: List[str]) -> List[Message]:
+        messages = []
+        for message_id in message_ids:
+            data = self._get(f"message:{message_id}")
+            if data is not None:
+                messages.append(Message.model_validate_json(data))
+        return messages
+
+    # ------------------------------------------------------------------
+    # Tarefas
+    # ------------------------------------------------------------------
+
+    async def save_task(self, task: Task) -> None:
+        """Salva uma tarefa e atualiza o índice de status."""
+        self._set(f"task:{task.id}", task.model_dump_json(), self.task_ttl)
+        # O despejo LRU pode ter removido a própria tarefa num limite muito baixo
+        if f"task:{task.id}" in self._entries:
+            self._index_task(task)
+        logger.debug(f"Task saved: {task.id}")
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Recupera uma tarefa."""
+        data = self._get(f"task:{task_id}")
+        return Task.model_validate_json(data) if data is not None else None
+
+    async def update_task(self, task: Task) -> None:
+        """Atualiza uma tarefa."""
+        await self.save_task(task)
+
+    async def update_task_status(self, task_id: str, status: str, result: Optional[str] = None) -> None:
+        """Atualiza o status (e o resultado) de uma tarefa."""
+        data = self._get(f"task:{task_id}")
+        if data is None:
+            logger.warning(f"Task not found for status update: {task_id}")
+            return
+        task = Task.model_validate_json(data)
+        updated = task.model_copy(update={
+            "status": status,
+            "result": result if result is not None else task.result,
+            "updated_at": datetime.now(),
+        })
+        await self.save_task(updated)
+
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Recupera as tarefas pendentes mais antigas."""
+        return await self.get_tasks_by_status("pending", limit)
+
+    async def get_tasks_by_status(self, status: str, limit: int = 100) -> List[Task]:
+        """Recupera as `limit` tarefas mais antigas de um status."""
+        self._purge_expired()
+        entries = self._status_index.get(status, [])[:max(0, limit)]
+        return [Task.model_validate_json(self._entries[f"task:{task_id}"]) for _, task_id in entries]
+
+    # ------------------------------------------------------------------
+    # Cache chave/valor
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[str]:
+        """Recupera um valor do cache."""
+        return self._get(f"cache:{key}")
+
+    async def set(self, key: str, value: str, expire: Optional[int] = None) -> None:
+        """Define um valor no cache."""
+        self._set(f"cache:{key}", value, expire)
+
+    async def delete(self, key: str) -> None:
+        """Remove uma chave do cache."""
+        self._delete(f"cache:{key}")
+
+    async def exists(self, key: str) -> bool:
+        """Verifica se uma chave existe no cache."""
+        return self._get(f"cache:{key}") is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna ocupação e contadores de despejo/expiração."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,216 @@
+"""
+Adaptador Open-Meteo para o WeatherPort, com geocodificação e previsões em cache.
+"""
+import asyncio
+import copy
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+from loguru import logger
+
+from config.settings import settings
+from core.application.ports.outbound.weather_port import WeatherPort
+from core.domain.models import GeoLocation, WeatherQuery, WeatherResponse
+from infrastructure.adapters.outbound.forecast_cache import ForecastCache, get_forecast_cache
+from infrastructure.adapters.outbound.gazetteer import Gazetteer, get_gazetteer
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache, get_geocoding_cache
+from infrastructure.adapters.outbound.http_client import get_http_client
+from infrastructure.adapters.outbound.singleflight import SingleFlight, get_single_flight
+
+
+class OpenMeteoWeatherAdapter(WeatherPort):
+    """Clima e geocodificação via Open-Meteo (gratuito, sem chave de API)."""
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        geocoding_cache: Optional[GeocodingCache] = None,
+        forecast_cache: Optional[ForecastCache] = None,
+        flight: Optional[SingleFlight] = None,
+        gazetteer: Optional[Gazetteer] = None,
+        language: str = "pt",
+    ) -> None:
+        self.client = client
+        self.gazetteer = gazetteer if gazetteer is not None else get_gazetteer()
+        self.geocoding_cache = geocoding_cache or get_geocoding_cache()
+        if forecast_cache is None and settings.forecast_cache_enabled:
+            forecast_cache = get_forecast_cache()
+        self.forecast_cache = forecast_cache
+        # Compartilhado pelo processo: agentes distintos também coalescem
+        self.flight = flight if flight is not None else get_single_flight("forecast")
+        self.language = language
+        self.base_url = settings.weather_api_base_url
+        self.geocoding_url = settings.geocoding_api_url
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Cliente injetado ou, por padrão, o cliente compartilhado do processo."""
+        return self.client if self.client is not None else get_http_client()
+
+    async def resolve_location(self, location: str) -> Optional[GeoLocation]:
+        """
+        Resolve pelo gazetteer local (nome exato) e, sem correspondência, pelo
+        cache/API remota. Se a API falhar, aceita a cidade local mais parecida.
+        """
+        if self.gazetteer is None:
+            return await self.geocoding_cache.get_or_load(location, self._fetch_location)
+        local = self.gazetteer.lookup(location)
+        if local is not None:
+            return local
+        try:
+            return await self.geocoding_cache.get_or_load(location, self._fetch_location)
+        except httpx.HTTPError:
+            closest = self.gazetteer.closest(location)
+            if closest is None:
+                raise
+            logger.warning(f"Geocoding API unavailable; using closest local match for {location}: {closest.name}")
+            return closest
+
+    async def _fetch_location(self, location: str) -> Optional[GeoLocation]:
+        response = await self.http.get(self.geocoding_url, params={
+            "name": location.strip(),
+            "count": 1,
+            "language": self.language,
+            "format": "json",
+        })
+        response.raise_for_status()
+        results = response.json().get("results")
+        if not results:
+            logger.debug(f"Location not found: {location}")
+            return None
+        result = results[0]
+        return GeoLocation(
+            name=result["name"],
+            country=result.get("country", ""),
+            latitude=result["latitude"],
+            longitude=result["longitude"],
+        )
+
+    async def geocode_location(self, location: str) -> tuple[float, float]:
+        """Converte endereço em coordenadas."""
+        resolved = await self.resolve_location(location)
+        if resolved is None:
+            raise ValueError(f"Localização não encontrada: {location}")
+        return resolved.latitude, resolved.longitude
+
+    async def fetch_forecast(self, latitude: float, longitude: float, **params: Any) -> Dict[str, Any]:
+        """Consulta a API de previsão com parâmetros livres e retorna o JSON."""
+        if self.forecast_cache is not None:
+            return await self.forecast_cache.get_or_fetch(latitude, longitude, params, self._coalesced_forecast)
+        return await self._coalesced_forecast(latitude, longitude, params)
+
+    async def _coalesced_forecast(self, latitude: float, longitude: float, params: Dict[str, Any]) -> Dict[str, Any]:
+        key = f"{latitude}:{longitude}:{ForecastCache.canonical_params(params)}"
+        data = await self.flight.do(key, lambda: self._fetch_forecast(latitude, longitude, params))
+        # Cada chamador recebe sua própria cópia do resultado compartilhado
+        return copy.deepcopy(data)
+
+    async def fetch_forecast_batch(
+        self,
+        coordinates: Sequence[Tuple[float, float]],
+        **params: Any,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Busca previsões de várias coordenadas em poucas requisições.
+
+        O Open-Meteo aceita listas de latitude/longitude separadas por vírgula;
+        as faltas do cache são agrupadas em lotes de até
+        `weather_batch_max_locations` coordenadas. O resultado segue a ordem da
+        entrada e traz a exceção no lugar da coordenada cujo lote falhou.
+        """
+        results: List[Union[Dict[str, Any], Exception, None]] = [None] * len(coordinates)
+        # Coordenada a buscar -> posições da entrada que a usam
+        pending: Dict[Tuple[float, float], List[int]] = {}
+        for index, (latitude, longitude) in enumerate(coordinates):
+            if self.forecast_cache is not None:
+                cached = self.forecast_cache.lookup(latitude, longitude, params, self._coalesced_forecast)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+                target = self.forecast_cache.cell_center(self.forecast_cache.cell(latitude, longitude))
+            else:
+                target = (latitude, longitude)
+            pending.setdefault(target, []).append(index)
+
+        targets = list(pending)
+        size = max(1, settings.weather_batch_max_locations)
+        chunks = [targets[i:i + size] for i in range(0, len(targets), size)]
+        responses = await asyncio.gather(
+            *[self._fetch_forecast_chunk(chunk, params) for chunk in chunks], return_exceptions=True
+        )
+        for chunk, response in zip(chunks, responses):
+            for position, target in enumerate(chunk):
+                data = response if isinstance(response, Exception) else response[position]
+                if not isinstance(data, Exception) and self.forecast_cache is not None:
+                    self.forecast_cache.store(target[0], target[1], params, data)
+                for index in pending[target]:
+                    results[index] = data if isinstance(data, Exception) else copy.deepcopy(data)
+        return results
+
+    async def _fetch_forecast_chunk(
+        self,
+        chunk: List[Tuple[float, float]],
+        params: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        response = await self.http.get(self.base_url, params={
+            "latitude": ",".join(str(latitude) for latitude, _ in chunk),
+            "longitude": ",".join(str(longitude) for _, longitude in chunk),
+            "timezone": "auto",
+            **params,
+        })
+        response.raise_for_status()
+        data = response.json()
+        # Uma única coordenada volta como objeto, várias como lista
+        items = data if isinstance(data, list) else [data]
+        if len(items) != len(chunk):
+            raise ValueError(f"Resposta com {len(items)} localizações para {len(chunk)} coordenadas")
+        return items
+
+    async def _fetch_forecast(self, latitude: float, longitude: float, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.http.get(self.base_url, params={
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": "auto",
+            **params,
+        })
+        response.raise_for_status()
+        return response.json()
+
+    async def _locate(self, query: WeatherQuery) -> GeoLocation:
+        if query.latitude is not None and query.longitude is not None:
+            return GeoLocation(name=query.location, latitude=query.latitude, longitude=query.longitude)
+        resolved = await self.resolve_location(query.location)
+        if resolved is None:
+            raise ValueError(f"Localização não encontrada: {query.location}")
+        return resolved
+
+    async def get_current_weather(self, query: WeatherQuery) -> WeatherResponse:
+        """Obtém clima atual para uma localização."""
+        location = await self._locate(query)
+        data = await self.fetch_forecast(
+            location.latitude, location.longitude, current=",".join(query.parameters)
+        )
+        return WeatherResponse(
+            location=location.name,
+            latitude=location.latitude,
+            longitude=location.longitude,
+            current=data.get("current", {}),
+        )
+
+    async def get_weather_forecast(self, query: WeatherQuery, days: int = 7) -> WeatherResponse:
+        """Obtém previsão do tempo."""
+        location = await self._locate(query)
+        data = await self.fetch_forecast(
+            location.latitude,
+            location.longitude,
+            current=",".join(query.parameters),
+            daily="temperature_2m_max,temperature_2m_min,weather_code",
+            forecast_days=days,
+        )
+        return WeatherResponse(
+            location=location.name,
+            latitude=location.latitude,
+            longitude=location.longitude,
+            current=data.get("current", {}),
+            forecast=data.get("daily", {}),
+        )
@@ -0,0 +1,25 @@
+"""
+Montagem do adaptador de persistência conforme as configurações.
+"""
+from core.application.ports.outbound.persistence_port import PersistencePort
+from config.settings import settings, PersistenceBackend
+
+
+def build_persistence_adapter() -> PersistencePort:
+    """
+    Cria o backend configurado (Redis ou memória), opcionalmente envolto
+    pelo cache L1. Se houver cache, chame `start()` no adaptador retornado
+    para ativar a invalidação entre processos.
+    """
+    if settings.persistence_backend == PersistenceBackend.MEMORY:
+        from infrastructure.adapters.outbound.memory_adapter import InMemoryAdapter
+        # O backend em memória já é local ao processo; o cache L1 não se aplica
+        return InMemoryAdapter()
+
+    from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+    adapter = RedisAdapter()
+    if settings.persistence_cache_enabled:
+        from infrastructure.adapters.outbound.cached_persistence import CachedPersistenceAdapter
+        from infrastructure.adapters.outbound.redis_pool import get_shared_client
+        return CachedPersistenceAdapter(adapter, invalidation_client=get_shared_client())
+    return adapter
@@ -0,0 +1,339 @@
+"""
+Entrega assíncrona de notificações push do A2A.
+
+O BasePushNotificationSender do SDK faz o POST para o webhook dentro do
+fluxo da requisição: um receptor lento ou fora do ar atrasa a execução do
+agente. Aqui `send_notification` só enfileira o ID da tarefa e volta na
+hora; workers em segundo plano buscam as configurações e fazem a entrega.
+
+- Fila limitada: com a fila cheia a notificação vai para as dead letters.
+- Coalescência: atualizações seguidas da mesma tarefa, ainda não enviadas,
+  são substituídas pela mais recente; as entregas de uma tarefa são
+  sequenciais, então o receptor nunca recebe um estado mais antigo depois
+  de um mais novo.
+- Limite de entregas simultâneas por endpoint (scheme://host:porta).
+- Retentativas em falhas de rede, 429 e 5xx com backoff exponencial e
+  jitter (full jitter), respeitando Retry-After; desiste se um estado mais
+  novo da tarefa já estiver esperando. A espera do backoff não ocupa um
+  worker: a retentativa volta para a fila quando o prazo vence, e um
+  webhook fora do ar não atrasa as entregas para os demais.
+- Dead letters: falhas definitivas ficam nas últimas N entradas, expostas
+  em `stats()`.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, Set
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+from pydantic import BaseModel
+
+# Mesmas variantes de SDK aceitas por a2a_server
+try:
+    from a2a.server.tasks import PushNotificationConfigStore, PushNotificationSender
+    from a2a.types import PushNotificationConfig, Task
+except Exception:
+    from python_a2a.server.tasks import PushNotificationConfigStore, PushNotificationSender  # type: ignore
+    from python_a2a.types import PushNotificationConfig, Task  # type: ignore
+
+from config.settings import settings
+from infrastructure.adapters.outbound.http_client import get_http_client
+
+NOTIFICATION_TOKEN_HEADER = "X-A2A-Notification-Token"
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class DeadLetter(BaseModel):
+    """Notificação descartada após falha definitiva."""
+
+    task_id: str
+    url: Optional[str] = None
+    state: Optional[str] = None
+    reason: str
+    attempts: int = 0
+    status_code: Optional[int] = None
+    failed_at: float
+
+
+class _Retry(NamedTuple):
+    """Nova tentativa de entrega de um estado para uma configuração."""
+
+    task: Task
+    config: PushNotificationConfig
+    attempt: int
+
+
+class QueuedPushNotificationSender(PushNotificationSender):
+    """PushNotificationSender com fila, workers, coalescência e retentativas."""
+
+    def __init__(
+        self,
+        config_store: PushNotificationConfigStore,
+        client: Optional[httpx.AsyncClient] = None,
+        queue_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_per_endpoint: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        timeout: Optional[float] = None,
+        dead_letter_size: Optional[int] = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self.config_store = config_store
+        self.http_client = client
+        self.queue_size = queue_size if queue_size is not None else settings.a2a_push_queue_size
+        self.workers = workers if workers is not None else settings.a2a_push_workers
+        self.max_per_endpoint = (
+            max_per_endpoint if max_per_endpoint is not None else settings.a2a_push_max_per_endpoint
+        )
+        self.max_attempts = max_attempts if max_attempts is not None else settings.a2a_push_max_attempts
+        self.backoff_base = backoff_base if backoff_base is not None else settings.a2a_push_backoff_base
+        self.backoff_max = backoff_max if backoff_max is not None else settings.a2a_push_backoff_max
+        self.timeout = timeout if timeout is not None else settings.a2a_push_timeout
+        self._sleep = sleep
+        self._rand = rand
+
+        # IDs de tarefa e retentativas (_Retry) prontas para entrega
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        # Estado mais recente ainda não enviado, por tarefa
+        self._pending: Dict[str, Task] = {}
+        # Entregas em andamento por tarefa, contando as retentativas agendadas
+        # (o próximo estado espera todas terminarem)
+        self._inflight: Dict[str, int] = {}
+        # Esperas de backoff, fora dos workers
+        self._retrying: Set[asyncio.Task] = set()
+        self._endpoints: Dict[str, asyncio.Semaphore] = {}
+        self._dead_letters: Deque[DeadLetter] = deque(
+            maxlen=dead_letter_size if dead_letter_size is not None else settings.a2a_push_dead_letter_size
+        )
+
+        self.enqueued = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.retries = 0
+        self.superseded = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Cliente compartilhado do processo; recriado se o lifespan o fechou
+        return self.http_client if self.http_client is not None else get_http_client()
+
+    def start(self) -> None:
+        """Inicia os workers de entrega (idempotente)."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"push-delivery-{i}") for i in range(max(self.workers, 1))
+        ]
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Aguarda a fila e as retentativas agendadas esvaziarem por até
+        `timeout` segundos e encerra os workers.
+        """
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Push delivery closed with {self._queue.qsize()} notifications pending "
+                f"and {len(self._retrying)} retries scheduled"
+            )
+        for pending in (*self._retrying, *self._workers):
+            pending.cancel()
+        await asyncio.gather(*self._retrying, *self._workers, return_exceptions=True)
+        self._workers = []
+        self._retrying.clear()
+        self._pending.clear()
+        self._inflight.clear()
+
+    async def _drain(self) -> None:
+        while True:
+            await self._queue.join()
+            if not self._retrying:
+                return
+            # Cada retentativa volta para a fila quando a espera termina
+            await asyncio.gather(*self._retrying, return_exceptions=True)
+
+    async def send_notification(self, task: Task) -> None:
+        """Enfileira o estado da tarefa para entrega; não faz I/O."""
+        self.start()
+        if task.id in self._pending:
+            self._pending[task.id] = task
+            self.coalesced += 1
+            return
+        if task.id in self._inflight:
+            # Enfileirada quando a entrega atual terminar
+            self._pending[task.id] = task
+            self.enqueued += 1
+            return
+        try:
+            self._queue.put_nowait(task.id)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self._dead_letter(task, None, "queue_full", 0)
+            return
+        self._pending[task.id] = task
+        self.enqueued += 1
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                if isinstance(item, _Retry):
+                    await self._deliver(item.task, item.config, item.attempt)
+                else:
+                    await self._process(item)
+            except Exception as e:
+                logger.error(f"Push delivery failed for {item}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, task_id: str) -> None:
+        task = self._pending.pop(task_id, None)
+        if task is None:
+            return
+        # Reserva enquanto as configurações são lidas
+        self._inflight[task_id] = 1
+        try:
+            configs = await self.config_store.get_info(task_id) or []
+            self._inflight[task_id] += len(configs)
+            await asyncio.gather(*(self._deliver(task, config, 1) for config in configs))
+        finally:
+            self._finish(task_id)
+
+    def _finish(self, task_id: str) -> None:
+        """Encerra uma entrega da tarefa; sem nenhuma em andamento, libera o próximo estado."""
+        remaining = self._inflight.get(task_id, 1) - 1
+        if remaining > 0:
+            self._inflight[task_id] = remaining
+            return
+        self._inflight.pop(task_id, None)
+        if task_id in self._pending:
+            try:
+                self._queue.put_nowait(task_id)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self._dead_letter(self._pending.pop(task_id), None, "queue_full", 0)
+
+    async def _deliver(self, task: Task, config: PushNotificationConfig, attempt: int) -> None:
+        """Uma tentativa de entrega; falhas temporárias agendam a próxima fora do worker."""
+        delay: Optional[float] = None
+        try:
+            if attempt > 1 and task.id in self._pending:
+                # Já existe um estado mais novo; ele será entregue no lugar deste
+                self.superseded += 1
+                return
+            headers = {NOTIFICATION_TOKEN_HEADER: config.token} if config.token else None
+            payload = task.model_dump(mode="json", exclude_none=True)
+            status_code: Optional[int] = None
+            retry_after: Optional[float] = None
+            try:
+                async with self._endpoint(config.url):
+                    response = await self._get_client().post(
+                        config.url, json=payload, headers=headers, timeout=self.timeout
+                    )
+                status_code = response.status_code
+                if status_code < 400:
+                    self.delivered += 1
+                    logger.debug(f"Push notification sent for task {task.id} to {config.url}")
+                    return
+                if status_code not in RETRYABLE_STATUS:
+                    self._dead_letter(task, config.url, f"http_{status_code}", attempt, status_code)
+                    return
+                reason = f"http_{status_code}"
+                retry_after = self._retry_after(response)
+            except httpx.HTTPError as e:
+                reason = type(e).__name__
+
+            if attempt >= self.max_attempts:
+                self._dead_letter(task, config.url, reason, attempt, status_code)
+                return
+            if task.id in self._pending:
+                self.superseded += 1
+                return
+            self.retries += 1
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+        finally:
+            if delay is None:
+                self._finish(task.id)
+        self._schedule(_Retry(task, config, attempt + 1), delay)
+
+    def _schedule(self, retry: _Retry, delay: float) -> None:
+        """Devolve a retentativa à fila depois de `delay` segundos, sem ocupar um worker."""
+
+        async def wait_and_enqueue() -> None:
+            await self._sleep(delay)
+            try:
+                self._queue.put_nowait(retry)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                self._dead_letter(retry.task, retry.config.url, "queue_full", retry.attempt - 1)
+                self._finish(retry.task.id)
+
+        timer = asyncio.create_task(wait_and_enqueue())
+        self._retrying.add(timer)
+        timer.add_done_callback(self._retrying.discard)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: aleatório entre 0 e base * 2^(tentativa-1), limitado."""
+        return self._rand() * min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        try:
+            return min(float(response.headers["retry-after"]), self.backoff_max)
+        except (KeyError, ValueError):
+            return None
+
+    def _endpoint(self, url: str) -> asyncio.Semaphore:
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        semaphore = self._endpoints.get(key)
+        if semaphore is None:
+            semaphore = self._endpoints[key] = asyncio.Semaphore(max(self.max_per_endpoint, 1))
+        return semaphore
+
+    def _dead_letter(
+        self, task: Task, url: Optional[str], reason: str, attempts: int, status_code: Optional[int] = None
+    ) -> None:
+        self.failed += 1
+        self._dead_letters.append(DeadLetter(
+            task_id=task.id,
+            url=url,
+            state=task.status.state.value,
+            reason=reason,
+            attempts=attempts,
+            status_code=status_code,
+            failed_at=time.time(),
+        ))
+        logger.warning(f"Push notification dead-lettered for task {task.id} ({url}): {reason}")
+
+    def dead_letters(self) -> List[DeadLetter]:
+        """Últimas notificações descartadas, da mais antiga para a mais recente."""
+        return list(self._dead_letters)
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidade da fila, contadores de entrega e dead letters recentes."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_size": self.queue_size,
+            "in_flight": len(self._inflight),
+            "retries_scheduled": len(self._retrying),
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "retries": self.retries,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "dead_letters": [letter.model_dump() for letter in self._dead_letters],
+        }
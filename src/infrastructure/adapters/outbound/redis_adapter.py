@@ -2,41 +2,156 @@
 Adaptador Redis para persistência de dados.
 """
 import json
-from typing import Optional, List
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, List, Union
 import redis.asyncio as redis
+from redis.exceptions import WatchError
 from loguru import logger
-from ....core.application.ports.outbound.persistence_port import PersistencePort
-from ....core.domain.models import Message, Task, ConversationContext
-from ....config.settings import settings
+from core.application.ports.outbound.persistence_port import PersistencePort
+from core.domain.repositories import TaskRepository
+from core.domain.models import Message, MessagePage, PageDirection, Task, ConversationContext
+from config.settings import settings, ConversationStorageMode
+from infrastructure.adapters.outbound.codecs import ModelCodec, get_codec
+from infrastructure.adapters.outbound.redis_pool import get_shared_client
 
+# Quantidade máxima de chaves por MGET na leitura em lote de mensagens
+MGET_CHUNK_SIZE = 500
 
-class RedisAdapter(PersistencePort):
+# Índice de tarefas por status: ZSETs tasks_by_status:{status} ordenados por
+# created_at, o hash task_status (id -> status atual) e o ZSET tasks_expiry
+# (id -> instante em que task:{id} expira). As chaves do índice não têm TTL;
+# cada membro é removido individualmente quando a tarefa expira.
+TASK_STATUS_INDEX_KEY = "task_status"
+TASK_EXPIRY_INDEX_KEY = "tasks_expiry"
+
+# TTL das tarefas (1 hora)
+TASK_TTL = 3600
+
+# Quantidade máxima de tarefas expiradas removidas do índice por chamada
+TASK_PURGE_BATCH_SIZE = 100
+
+# Remove do índice as tarefas expiradas até ARGV[1] (no máximo ARGV[2]).
+# Espera KEYS[1] = tasks_expiry e KEYS[2] = task_status.
+_PURGE_EXPIRED_TASKS_LUA = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, id in ipairs(expired) do
+    local status = redis.call('HGET', KEYS[2], id)
+    if status then
+        redis.call('ZREM', 'tasks_by_status:' .. status, id)
+        redis.call('HDEL', KEYS[2], id)
+    end
+    redis.call('ZREM', KEYS[1], id)
+end
+"""
+
+# Grava a tarefa e move seu ID entre os índices de status de forma atômica.
+# O status anterior é lido no próprio servidor, evitando a corrida de
+# leitura-modificação-escrita entre atualizadores concorrentes.
+# KEYS = tasks_expiry, task_status, task:{id}
+# ARGV = agora, lote de limpeza, task_id, JSON da tarefa, status novo,
+#        TTL em segundos, score de created_at, instante de expiração
+SAVE_TASK_SCRIPT = _PURGE_EXPIRED_TASKS_LUA + """
+local previous = redis.call('HGET', KEYS[2], ARGV[3])
+if previous and previous ~= ARGV[5] then
+    redis.call('ZREM', 'tasks_by_status:' .. previous, ARGV[3])
+end
+redis.call('SET', KEYS[3], ARGV[4], 'EX', ARGV[6])
+redis.call('ZADD', 'tasks_by_status:' .. ARGV[5], ARGV[7], ARGV[3])
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[5])
+redis.call('ZADD', KEYS[1], ARGV[8], ARGV[3])
+return previous and 1 or 0
+"""
+
+# Retorna os corpos das ARGV[4] tarefas mais antigas com status ARGV[3],
+# depois de limpar as expiradas. Membros sem corpo são removidos do índice.
+# KEYS = tasks_expiry, task_status
+# ARGV = agora, lote de limpeza, status, limite
+OLDEST_TASKS_SCRIPT = _PURGE_EXPIRED_TASKS_LUA + """
+local index_key = 'tasks_by_status:' .. ARGV[3]
+local ids = redis.call('ZRANGE', index_key, 0, tonumber(ARGV[4]) - 1)
+local tasks = {}
+for _, id in ipairs(ids) do
+    local data = redis.call('GET', 'task:' .. id)
+    if data then
+        table.insert(tasks, data)
+    else
+        redis.call('ZREM', index_key, id)
+        redis.call('HDEL', KEYS[2], id)
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+return tasks
+"""
+
+# Acrescenta ao log da conversação apenas as mensagens ainda não gravadas e
+# regrava os metadados. Retorna -1 quando o log diverge do que o cliente
+# enviou (lacuna ou conversação encurtada); nesse caso o cliente regrava tudo.
+# KEYS[1] = conversation_meta:{id}, KEYS[2] = conversation_log:{id}
+# ARGV = TTL, JSON dos metadados, índice da primeira mensagem enviada,
+#        total de mensagens da conversação, mensagens (JSON)...
+APPEND_CONVERSATION_SCRIPT = """
+local stored = redis.call('LLEN', KEYS[2])
+local offset = tonumber(ARGV[3])
+local total = tonumber(ARGV[4])
+if stored < offset or stored > total then
+    return -1
+end
+for i = 5 + (stored - offset), #ARGV do
+    redis.call('RPUSH', KEYS[2], ARGV[i])
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return total
+"""
+
+# Quantidade de conversações cujo tamanho já gravado é lembrado em memória
+CONVERSATION_LENGTH_CACHE_SIZE = 10000
+
+
+def _as_str(value: Union[bytes, str]) -> str:
+    """Normaliza valores lidos do Redis (bytes ou str, conforme decode_responses)."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisAdapter(PersistencePort, TaskRepository):
     """Adaptador Redis para persistência."""
     
-    def __init__(self):
-        self.redis_client = None
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        conversation_storage: Optional[ConversationStorageMode] = None,
+        codec: Optional[ModelCodec] = None,
+    ):
+        self.redis_client = client
+        self.codec = codec or get_codec(settings.redis_codec.value)
+        self.conversation_storage = conversation_storage or settings.redis_conversation_storage
+        self._save_task_script = None
+        self._oldest_tasks_script = None
+        self._append_conversation_script = None
+        # Tamanho do log já persistido por conversação (evita LLEN a cada turno)
+        self._conversation_lengths: OrderedDict[str, int] = OrderedDict()
         
     async def _get_client(self) -> redis.Redis:
         """Obtém cliente Redis."""
         if not self.redis_client:
-            self.redis_client = redis.Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                password=settings.redis_password,
-                decode_responses=True
-            )
+            # Pool compartilhado por todos os adaptadores do processo
+            self.redis_client = get_shared_client()
         return self.redis_client
     
     async def save_conversation(self, conversation: ConversationContext) -> None:
         """Salva uma conversação no Redis."""
         try:
-            client = await self._get_client()
-            key = f"conversation:{conversation.id}"
-            data = conversation.model_dump_json()
-            
-            # Salva com TTL de 24 horas
-            await client.setex(key, 86400, data)
+            if self.conversation_storage == ConversationStorageMode.APPEND:
+                await self._append_conversation(conversation)
+            else:
+                client = await self._get_client()
+                key = f"conversation:{conversation.id}"
+                data = self.codec.encode(conversation)
+                
+                # Salva com TTL de 24 horas
+                await client.setex(key, 86400, data)
             logger.debug(f"Conversation saved: {conversation.id}")
             
         except Exception as e:
@@ -48,31 +163,93 @@ class RedisAdapter(PersistencePort):
         try:
             client = await self._get_client()
             key = f"conversation:{conversation_id}"
+            
+            if self.conversation_storage == ConversationStorageMode.APPEND:
+                pipe = client.pipeline(transaction=False)
+                pipe.get(f"conversation_meta:{conversation_id}")
+                pipe.lrange(f"conversation_log:{conversation_id}", 0, -1)
+                meta, log = await pipe.execute()
+                if meta:
+                    conversation = self.codec.decode(meta, ConversationContext)
+                    conversation.messages = [self.codec.decode(m, Message) for m in log]
+                    self._remember_conversation_length(conversation_id, len(log))
+                    return conversation
+            
+            # Modo blob, ou conversação gravada antes do modo append
             data = await client.get(key)
             
             if data:
-                return ConversationContext.model_validate_json(data)
+                return self.codec.decode(data, ConversationContext)
             return None
             
         except Exception as e:
             logger.error(f"Error getting conversation: {e}")
             return None
     
+    async def _append_conversation(self, conversation: ConversationContext) -> None:
+        """
+        Grava metadados e apenas as mensagens novas da conversação.
+        
+        Assume que mensagens só são acrescentadas ao final; qualquer
+        divergência com o log gravado resulta numa regravação completa.
+        """
+        client = await self._get_client()
+        meta_key = f"conversation_meta:{conversation.id}"
+        log_key = f"conversation_log:{conversation.id}"
+        meta = self.codec.encode(conversation, exclude={"messages"})
+        total = len(conversation.messages)
+        
+        offset = self._conversation_lengths.get(conversation.id)
+        if offset is None:
+            offset = await client.llen(log_key)
+        offset = min(offset, total)
+        
+        if self._append_conversation_script is None:
+            self._append_conversation_script = client.register_script(APPEND_CONVERSATION_SCRIPT)
+        
+        # TTL de 24 horas
+        result = await self._append_conversation_script(
+            keys=[meta_key, log_key],
+            args=[86400, meta, offset, total] + [self.codec.encode(m) for m in conversation.messages[offset:]],
+        )
+        
+        if result == -1:
+            pipe = client.pipeline(transaction=True)
+            pipe.delete(log_key, f"conversation:{conversation.id}")
+            if conversation.messages:
+                pipe.rpush(log_key, *[self.codec.encode(m) for m in conversation.messages])
+                pipe.expire(log_key, 86400)
+            pipe.setex(meta_key, 86400, meta)
+            await pipe.execute()
+        
+        self._remember_conversation_length(conversation.id, total)
+    
+    def _remember_conversation_length(self, conversation_id: str, length: int) -> None:
+        """Guarda o tamanho persistido do log numa LRU limitada."""
+        self._conversation_lengths[conversation_id] = length
+        self._conversation_lengths.move_to_end(conversation_id)
+        if len(self._conversation_lengths) > CONVERSATION_LENGTH_CACHE_SIZE:
+            self._conversation_lengths.popitem(last=False)
+    
     async def save_message(self, message: Message) -> None:
         """Salva uma mensagem no Redis."""
         try:
             client = await self._get_client()
+            pipe = client.pipeline(transaction=True)
             
             # Salva mensagem individual
             message_key = f"message:{message.id}"
-            await client.setex(message_key, 86400, message.model_dump_json())
+            pipe.setex(message_key, 86400, self.codec.encode(message))
             
             # Adiciona à lista de mensagens da conversação (se especificada nos metadados)
             if "conversation_id" in message.metadata:
                 conversation_id = message.metadata["conversation_id"]
                 conversation_messages_key = f"conversation_messages:{conversation_id}"
-                await client.lpush(conversation_messages_key, message.id)
-                await client.expire(conversation_messages_key, 86400)
+                pipe.lpush(conversation_messages_key, message.id)
+                pipe.expire(conversation_messages_key, 86400)
+            
+            # MULTI/EXEC: uma única ida ao servidor, aplicada atomicamente
+            await pipe.execute()
             
             logger.debug(f"Message saved: {message.id}")
             
@@ -86,16 +263,9 @@ class RedisAdapter(PersistencePort):
             client = await self._get_client()
             messages_key = f"conversation_messages:{conversation_id}"
             
-            # Obtém IDs das mensagens
+            # Obtém IDs das mensagens (mais recente primeiro, via LPUSH)
             message_ids = await client.lrange(messages_key, 0, -1)
-            
-            messages = []
-            for message_id in message_ids:
-                message_key = f"message:{message_id}"
-                message_data = await client.get(message_key)
-                if message_data:
-                    message = Message.model_validate_json(message_data)
-                    messages.append(message)
+            messages = await self._fetch_messages(client, message_ids)
             
             # Retorna em ordem cronológica
             return list(reversed(messages))
@@ -104,21 +274,133 @@ class RedisAdapter(PersistencePort):
             logger.error(f"Error getting messages: {e}")
             return []
     
-    async def save_task(self, task: Task) -> None:
-        """Salva uma tarefa no Redis."""
+    async def get_messages_page(
+        self,
+        conversation_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        direction: PageDirection = PageDirection.BACKWARD,
+        since: Optional[datetime] = None,
+    ) -> MessagePage:
+        """
+        Recupera uma página de mensagens com leituras por faixa (LRANGE).
+        
+        O cursor é a posição da mensagem contada a partir da mais antiga,
+        que não muda quando novas mensagens entram no início da lista.
+        Em BACKWARD ele é o limite superior exclusivo da próxima página; em
+        FORWARD, a posição inicial. Cursor inválido levanta ValueError.
+        """
+        position = MessagePage.parse_cursor(cursor)
         try:
+            if limit <= 0 or (direction == PageDirection.BACKWARD and position == 0):
+                return MessagePage()
+            
             client = await self._get_client()
-            key = f"task:{task.id}"
-            data = task.model_dump_json()
+            key = f"conversation_messages:{conversation_id}"
+            
+            if direction == PageDirection.FORWARD and position is None and since is not None:
+                position = await self._find_first_position_since(client, key, since, limit)
+            
+            # A posição p (a partir da mais antiga) fica no índice -(p + 1) da lista
+            pipe = client.pipeline(transaction=True)
+            pipe.llen(key)
+            if direction == PageDirection.BACKWARD:
+                if position is None:
+                    pipe.lrange(key, 0, limit - 1)
+                else:
+                    pipe.lrange(key, -position, -(max(0, position - limit) + 1))
+            else:
+                start = position or 0
+                pipe.lrange(key, -(start + limit), -(start + 1))
+            length, message_ids = await pipe.execute()
+            
+            if direction == PageDirection.BACKWARD and position is not None and position > length:
+                # Cursor além do fim: a faixa acima foi calculada sobre índices
+                # inexistentes; relê a partir da mensagem mais recente
+                position = length
+                message_ids = await client.lrange(key, 0, limit - 1) if length else []
             
-            # Salva tarefa
-            await client.setex(key, 3600, data)  # TTL de 1 hora
+            if direction == PageDirection.BACKWARD:
+                end = length if position is None else position
+                if end <= 0:
+                    return MessagePage()
+                start = max(0, end - limit)
+                next_cursor = str(start) if start > 0 else None
+            else:
+                next_position = (position or 0) + limit
+                next_cursor = str(next_position) if next_position < length else None
             
-            # Adiciona à lista de tarefas por status
-            status_key = f"tasks:{task.status}"
-            await client.sadd(status_key, task.id)
-            await client.expire(status_key, 3600)
+            messages = list(reversed(await self._fetch_messages(client, message_ids)))
             
+            if since is not None:
+                recent = [m for m in messages if m.timestamp >= since]
+                if direction == PageDirection.BACKWARD and len(recent) < len(messages):
+                    next_cursor = None
+                messages = recent
+            
+            return MessagePage(messages=messages, next_cursor=next_cursor)
+            
+        except Exception as e:
+            logger.error(f"Error getting messages page: {e}")
+            return MessagePage()
+    
+    async def _find_first_position_since(
+        self, client: redis.Redis, key: str, since: datetime, batch_size: int
+    ) -> int:
+        """
+        Localiza a posição da primeira mensagem com timestamp >= since.
+        
+        Percorre a lista a partir das mais recentes, em blocos, e para na
+        primeira mensagem anterior a `since`; o custo é proporcional à janela
+        pedida e não ao histórico completo.
+        """
+        end = await client.llen(key)
+        while end > 0:
+            start = max(0, end - batch_size)
+            message_ids = await client.lrange(key, -end, -(start + 1))
+            slots = await self._fetch_message_slots(client, message_ids)
+            for offset, message in enumerate(slots):
+                if message is not None and message.timestamp < since:
+                    return end - offset
+            end = start
+        return 0
+    
+    async def _fetch_messages(self, client: redis.Redis, message_ids: List[Union[bytes, str]]) -> List[Message]:
+        """
+        Busca os corpos das mensagens em lote, preservando a ordem dos IDs.
+        
+        IDs cujas mensagens já expiraram são ignorados.
+        """
+        return [m for m in await self._fetch_message_slots(client, message_ids) if m is not None]
+    
+    async def _fetch_message_slots(
+        self, client: redis.Redis, message_ids: List[Union[bytes, str]]
+    ) -> List[Optional[Message]]:
+        """
+        Busca os corpos das mensagens alinhados aos IDs (None se expirada).
+        
+        Os IDs são divididos em blocos de MGET enviados num único pipeline,
+        o que custa um round trip independentemente do tamanho da lista.
+        """
+        if not message_ids:
+            return []
+        
+        pipe = client.pipeline(transaction=False)
+        for start in range(0, len(message_ids), MGET_CHUNK_SIZE):
+            chunk = message_ids[start:start + MGET_CHUNK_SIZE]
+            pipe.mget([f"message:{_as_str(message_id)}" for message_id in chunk])
+        results = await pipe.execute()
+        
+        return [
+            self.codec.decode(message_data, Message) if message_data else None
+            for chunk_data in results
+            for message_data in chunk_data
+        ]
+    
+    async def save_task(self, task: Task) -> None:
+        """Salva uma tarefa no Redis."""
+        try:
+            await self._write_task(task)
             logger.debug(f"Task saved: {task.id}")
             
         except Exception as e:
@@ -133,7 +415,7 @@ class RedisAdapter(PersistencePort):
             data = await client.get(key)
             
             if data:
-                return Task.model_validate_json(data)
+                return self.codec.decode(data, Task)
             return None
             
         except Exception as e:
@@ -142,23 +424,102 @@ class RedisAdapter(PersistencePort):
     
     async def update_task(self, task: Task) -> None:
         """Atualiza uma tarefa no Redis."""
+        try:
+            # A transição de status acontece no script, sem leitura prévia
+            await self._write_task(task)
+            logger.debug(f"Task updated: {task.id}")
+            
+        except Exception as e:
+            logger.error(f"Error updating task: {e}")
+            raise
+    
+    async def update_task_status(self, task_id: str, status: str, result: Optional[str] = None) -> None:
+        """Atualiza status (e resultado) de uma tarefa com transação otimista."""
         try:
             client = await self._get_client()
+            key = f"task:{task_id}"
             
-            # Remove da lista do status anterior se existir
-            old_task = await self.get_task(task.id)
-            if old_task and old_task.status != task.status:
-                old_status_key = f"tasks:{old_task.status}"
-                await client.srem(old_status_key, task.id)
+            async with client.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        await pipe.watch(key)
+                        data = await pipe.get(key)
+                        if not data:
+                            logger.warning(f"Task not found for status update: {task_id}")
+                            return
+                        
+                        task = self.codec.decode(data, Task)
+                        task.status = status
+                        if result is not None:
+                            task.result = result
+                        task.updated_at = datetime.now()
+                        
+                        pipe.multi()
+                        await self._write_task(task, pipe)
+                        await pipe.execute()
+                        break
+                    except WatchError:
+                        # Outro processo alterou a tarefa; relê e tenta de novo
+                        continue
             
-            # Salva tarefa atualizada
-            await self.save_task(task)
+            logger.debug(f"Task status updated: {task_id} -> {status}")
             
         except Exception as e:
-            logger.error(f"Error updating task: {e}")
+            logger.error(f"Error updating task status: {e}")
             raise
     
+    async def get_pending_tasks(self, limit: int = 100) -> List[Task]:
+        """Recupera as tarefas pendentes mais antigas."""
+        return await self.get_tasks_by_status("pending", limit)
+    
+    async def get_tasks_by_status(self, status: str, limit: int = 100) -> List[Task]:
+        """
+        Recupera as `limit` tarefas mais antigas (por created_at) de um status.
+        
+        Custa O(log n + k) no servidor e um único round trip; tarefas
+        expiradas são removidas do índice antes da consulta.
+        """
+        try:
+            if limit <= 0:
+                return []
+            
+            client = await self._get_client()
+            if self._oldest_tasks_script is None:
+                self._oldest_tasks_script = client.register_script(OLDEST_TASKS_SCRIPT)
+            
+            results = await self._oldest_tasks_script(
+                keys=[TASK_EXPIRY_INDEX_KEY, TASK_STATUS_INDEX_KEY],
+                args=[time.time(), TASK_PURGE_BATCH_SIZE, status, limit],
+            )
+            return [self.codec.decode(data, Task) for data in results]
+            
+        except Exception as e:
+            logger.error(f"Error getting tasks by status: {e}")
+            return []
+    
+    async def _write_task(self, task: Task, pipe: Optional[redis.client.Pipeline] = None) -> None:
+        """Grava a tarefa e atualiza o índice de status num único round trip."""
+        client = await self._get_client()
+        if self._save_task_script is None:
+            self._save_task_script = client.register_script(SAVE_TASK_SCRIPT)
+        
+        now = time.time()
+        await self._save_task_script(
+            keys=[TASK_EXPIRY_INDEX_KEY, TASK_STATUS_INDEX_KEY, f"task:{task.id}"],
+            args=[
+                now,
+                TASK_PURGE_BATCH_SIZE,
+                task.id,
+                self.codec.encode(task),
+                task.status,
+                TASK_TTL,
+                task.created_at.timestamp(),
+                now + TASK_TTL,
+            ],
+            client=pipe,
+        )
+    
     async def close(self) -> None:
-        """Fecha conexão Redis."""
+        """Fecha o cliente Redis (o pool compartilhado permanece aberto)."""
         if self.redis_client:
             await self.redis_client.aclose()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Pool de conexões Redis compartilhado pelo processo, com métricas de uso.
+"""
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import redis.asyncio as redis
+from redis.asyncio.connection import BlockingConnectionPool, Connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+from loguru import logger
+
+from config.settings import settings
+
+
+class PoolMetrics:
+    """Contadores acumulados de um pool de conexões."""
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.acquire_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.connects = 0
+        self.disconnects = 0
+
+
+class InstrumentedConnection(Connection):
+    """Conexão que contabiliza desconexões no pool de origem."""
+
+    pool_metrics = None
+
+    async def disconnect(self, *args, **kwargs) -> None:
+        if self.is_connected and self.pool_metrics is not None:
+            self.pool_metrics.disconnects += 1
+        await super().disconnect(*args, **kwargs)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Pool bloqueante que registra espera por conexão e rotatividade.
+
+    Ao atingir `max_connections`, novos pedidos aguardam até `timeout`
+    segundos por uma conexão livre antes de falhar com ConnectionError.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("connection_class", InstrumentedConnection)
+        super().__init__(**kwargs)
+        self.metrics = PoolMetrics()
+
+    def make_connection(self):
+        connection = super().make_connection()
+        connection.pool_metrics = self.metrics
+        connection.register_connect_callback(self._on_connect)
+        return connection
+
+    def _on_connect(self, connection: Connection) -> None:
+        self.metrics.connects += 1
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except RedisConnectionError:
+            self.metrics.acquire_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.metrics.acquisitions += 1
+            self.metrics.wait_seconds_total += waited
+            self.metrics.wait_seconds_max = max(self.metrics.wait_seconds_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna um retrato do estado e dos contadores do pool."""
+        metrics = self.metrics
+        in_use = len(self._in_use_connections)
+        idle = len(self._available_connections)
+        return {
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": idle,
+            "open": in_use + idle,
+            "acquisitions": metrics.acquisitions,
+            "acquire_timeouts": metrics.acquire_timeouts,
+            "wait_ms_avg": (
+                metrics.wait_seconds_total * 1000 / metrics.acquisitions
+                if metrics.acquisitions else 0.0
+            ),
+            "wait_ms_max": metrics.wait_seconds_max * 1000,
+            "connects": metrics.connects,
+            "disconnects": metrics.disconnects,
+        }
+
+
+# Pools compartilhados pelo processo, um por destino (host, porta, db, senha)
+_shared_pools: Dict[Tuple[Any, ...], InstrumentedConnectionPool] = {}
+
+
+def get_shared_pool() -> InstrumentedConnectionPool:
+    """Obtém (ou cria) o pool compartilhado para o Redis configurado."""
+    key = (settings.redis_host, settings.redis_port, settings.redis_db, settings.redis_password)
+    pool = _shared_pools.get(key)
+    if pool is None:
+        pool = InstrumentedConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            password=settings.redis_password,
+            max_connections=settings.redis_pool_max_connections,
+            timeout=settings.redis_pool_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_connect_timeout,
+            socket_keepalive=settings.redis_socket_keepalive,
+            health_check_interval=settings.redis_health_check_interval,
+            # Respostas em bytes: os codecs binários (msgpack) não são texto
+            decode_responses=False,
+        )
+        _shared_pools[key] = pool
+        logger.info(
+            f"Redis pool created for {settings.redis_host}:{settings.redis_port}/{settings.redis_db} "
+            f"(max_connections={settings.redis_pool_max_connections})"
+        )
+    return pool
+
+
+def get_shared_client() -> redis.Redis:
+    """Cria um cliente leve que usa o pool compartilhado (fechá-lo não fecha o pool)."""
+    return redis.Redis(connection_pool=get_shared_pool())
+
+
+def get_pool_stats() -> List[Dict[str, Any]]:
+    """Retorna as estatísticas de todos os pools compartilhados."""
+    return [
+        {"target": f"{host}:{port}/{db}", **pool.stats()}
+        for (host, port, db, _), pool in _shared_pools.items()
+    ]
+
+
+async def close_shared_pools() -> None:
+    """Desconecta e descarta todos os pools compartilhados."""
+    pools = list(_shared_pools.values())
+    _shared_pools.clear()
+    for pool in pools:
+        await pool.disconnect()
+    if pools:
+        logger.info(f"Closed {len(pools)} shared Redis pool(s)")
+
+
+@asynccontextmanager
+async def redis_pool_lifespan(_app: Any = None) -> AsyncIterator[None]:
+    """Lifespan que desconecta os pools compartilhados no desligamento."""
+    try:
+        yield
+    finally:
+        await close_shared_pools()
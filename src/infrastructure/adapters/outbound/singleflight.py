@@ -0,0 +1,92 @@
+"""
+Coalescência de chamadas concorrentes idênticas (single-flight).
+
+Enquanto uma chamada para uma chave está em andamento, novas chamadas com a
+mesma chave aguardam o mesmo resultado em vez de repetir a ida ao upstream.
+Erros são propagados a todos os que aguardam e nunca ficam guardados: a
+próxima chamada após a conclusão executa de novo. Cancelar quem aguarda não
+cancela a chamada compartilhada, a menos que ninguém mais a esteja
+aguardando.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Agrupa chamadas concorrentes pela chave e compartilha o resultado."""
+
+    def __init__(self, name: str = "default") -> None:
+        self.name = name
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0
+        self.deduplicated = 0
+        self.errors = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Executa `fn` uma vez por chave entre chamadas concorrentes."""
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            self.executions += 1
+            call.task.add_done_callback(lambda task: self._finish(key, call, task))
+        else:
+            self.deduplicated += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            # Último interessado desistiu: não há por que manter a chamada
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _finish(self, key: str, call: _Call, task: asyncio.Task) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Marca a exceção como consumida mesmo sem ninguém aguardando
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def in_flight(self) -> int:
+        """Número de chamadas em andamento."""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna execuções reais, chamadas deduplicadas e erros."""
+        requests = self.executions + self.deduplicated
+        return {
+            "name": self.name,
+            "executions": self.executions,
+            "deduplicated": self.deduplicated,
+            "dedup_ratio": self.deduplicated / requests if requests else 0.0,
+            "errors": self.errors,
+            "in_flight": len(self._calls),
+        }
+
+
+_shared_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Obtém (ou cria) o grupo single-flight do processo com este nome."""
+    flight = _shared_flights.get(name)
+    if flight is None:
+        flight = _shared_flights[name] = SingleFlight(name)
+    return flight
+
+
+def get_single_flight_stats() -> List[Dict[str, Any]]:
+    """Retorna as estatísticas de todos os grupos do processo."""
+    return [flight.stats() for flight in _shared_flights.values()]
@@ -0,0 +1,180 @@
+"""
+Resumos vetorizados de séries horárias de previsão (NumPy).
+
+Transforma o bloco "hourly" do Open-Meteo (centenas de valores por
+variável) em um payload compacto: estatísticas, percentis, janelas
+móveis, horas de chuva, agregados diários e histograma de códigos WMO.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+HOURLY_VARIABLES = (
+    "temperature_2m",
+    "apparent_temperature",
+    "relative_humidity_2m",
+    "precipitation",
+    "precipitation_probability",
+    "wind_speed_10m",
+    "weather_code",
+)
+
+# Variáveis contínuas resumidas com estatísticas e percentis
+STAT_VARIABLES = (
+    "temperature_2m",
+    "apparent_temperature",
+    "relative_humidity_2m",
+    "precipitation_probability",
+    "wind_speed_10m",
+)
+
+PERCENTILES = (10, 50, 90)
+
+
+def as_array(values: Optional[Sequence[Any]]) -> np.ndarray:
+    """Converte uma série do Open-Meteo em float64; valores nulos viram NaN."""
+    if not values:
+        return np.empty(0)
+    return np.array(values, dtype=np.float64)
+
+
+def _round(value: float, digits: int = 1) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def describe(values: np.ndarray) -> Optional[Dict[str, Any]]:
+    """Mínimo, máximo, média e percentis ignorando NaN; None se não houver dados."""
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return None
+    percentiles = np.percentile(valid, PERCENTILES)
+    return {
+        "min": _round(valid.min()),
+        "max": _round(valid.max()),
+        "mean": _round(valid.mean()),
+        **{f"p{p}": _round(v) for p, v in zip(PERCENTILES, percentiles)},
+    }
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Soma móvel de `window` horas via soma acumulada (NaN conta como zero)."""
+    if window <= 0 or values.size < window:
+        return np.empty(0)
+    cumulative = np.concatenate(([0.0], np.cumsum(np.nan_to_num(values))))
+    return cumulative[window:] - cumulative[:-window]
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Média móvel de `window` horas, ignorando horas sem dado."""
+    counts = rolling_sum((~np.isnan(values)).astype(np.float64), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return rolling_sum(values, window) / counts
+
+
+def _window(times: np.ndarray, series: np.ndarray, position: int, window: int) -> Dict[str, Any]:
+    return {"start": str(times[position]), "end": str(times[position + window - 1]),
+            "value": _round(series[position])}
+
+
+def summarize_hourly(
+    hourly: Dict[str, Any],
+    decode: Callable[[int], str],
+    window_hours: int = 6,
+    rain_threshold: float = 0.1,
+) -> Dict[str, Any]:
+    """
+    Resume o bloco "hourly" de uma previsão.
+
+    Args:
+        hourly: Séries horárias do Open-Meteo ("time" e uma lista por variável)
+        decode: Decodificador de códigos WMO (ex.: describe_weather_code)
+        window_hours: Tamanho das janelas móveis, em horas
+        rain_threshold: Precipitação mínima (mm) para contar uma hora como chuvosa
+
+    Returns:
+        Dicionário compacto com estatísticas, janelas, chuva, dias e condições
+    """
+    times = np.array(hourly.get("time") or [], dtype=str)
+    summary: Dict[str, Any] = {
+        "hours": int(times.size),
+        "period": {"start": str(times[0]), "end": str(times[-1])} if times.size else None,
+    }
+
+    series = {name: as_array(hourly.get(name)) for name in HOURLY_VARIABLES if hourly.get(name)}
+    summary["stats"] = {
+        name: stats for name in STAT_VARIABLES
+        if name in series and (stats := describe(series[name])) is not None
+    }
+
+    windows: Dict[str, Any] = {}
+    temperature = series.get("temperature_2m")
+    if temperature is not None:
+        means = rolling_mean(temperature, window_hours)
+        if means.size and not np.isnan(means).all():
+            windows["warmest"] = _window(times, means, int(np.nanargmax(means)), window_hours)
+            windows["coolest"] = _window(times, means, int(np.nanargmin(means)), window_hours)
+
+    precipitation = series.get("precipitation")
+    if precipitation is not None:
+        totals = rolling_sum(precipitation, window_hours)
+        if totals.size:
+            windows["wettest"] = _window(times, totals, int(np.argmax(totals)), window_hours)
+        rainy = np.nan_to_num(precipitation) >= rain_threshold
+        summary["rain"] = {
+            "total_mm": _round(np.nansum(precipitation)),
+            "rain_hours": int(rainy.sum()),
+            "max_hourly_mm": _round(np.nanmax(precipitation)) if not np.isnan(precipitation).all() else None,
+        }
+    if windows:
+        summary["windows"] = {"hours": window_hours, **windows}
+
+    summary["daily"] = _daily(times, series, rain_threshold)
+
+    codes = series.get("weather_code")
+    if codes is not None:
+        summary["conditions"] = _conditions(codes, decode)
+    return summary
+
+
+def _daily(times: np.ndarray, series: Dict[str, np.ndarray], rain_threshold: float) -> List[Dict[str, Any]]:
+    """Agregados por dia (horário local da previsão), usando reduceat sobre as fronteiras dos dias."""
+    if times.size == 0:
+        return []
+    days = np.array([t[:10] for t in times])
+    # A série já vem ordenada no tempo: cada dia é um bloco contíguo
+    starts = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+    lengths = np.diff(np.append(starts, days.size))
+    daily = [{"date": str(days[s])} for s in starts]
+
+    temperature = series.get("temperature_2m")
+    if temperature is not None and temperature.size == days.size:
+        highs = np.maximum.reduceat(np.where(np.isnan(temperature), -np.inf, temperature), starts)
+        lows = np.minimum.reduceat(np.where(np.isnan(temperature), np.inf, temperature), starts)
+        for entry, high, low in zip(daily, highs, lows):
+            entry["temperature_max"] = _round(high) if np.isfinite(high) else None
+            entry["temperature_min"] = _round(low) if np.isfinite(low) else None
+
+    precipitation = series.get("precipitation")
+    if precipitation is not None and precipitation.size == days.size:
+        totals = np.add.reduceat(np.nan_to_num(precipitation), starts)
+        rainy = np.add.reduceat((np.nan_to_num(precipitation) >= rain_threshold).astype(np.int64), starts)
+        for entry, total, hours in zip(daily, totals, rainy):
+            entry["precipitation_mm"] = _round(total)
+            entry["rain_hours"] = int(hours)
+
+    for entry, hours in zip(daily, lengths):
+        entry["hours"] = int(hours)
+    return daily
+
+
+def _conditions(codes: np.ndarray, decode: Callable[[int], str]) -> List[Dict[str, Any]]:
+    """Histograma de códigos WMO (horas por condição), do mais ao menos frequente."""
+    valid = codes[~np.isnan(codes)].astype(np.int64)
+    if valid.size == 0:
+        return []
+    values, counts = np.unique(valid, return_counts=True)
+    order = np.argsort(-counts, kind="stable")
+    return [
+        {"code": int(values[i]), "description": decode(int(values[i])), "hours": int(counts[i])}
+        for i in order
+    ]
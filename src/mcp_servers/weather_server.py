@@ -1,14 +1,99 @@
 """
 Servidor MCP para serviços meteorológicos.
 """
-from fastmcp import FastMCP
-from typing import Dict, Any
-import httpx
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 import asyncio
+from fastmcp import FastMCP
+from typing import Dict, Any, List
 from loguru import logger
 
+# Permite executar diretamente: python src/mcp_servers/weather_server.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.settings import settings
+from core.domain.models import GeoLocation
+from infrastructure.adapters.outbound.forecast_cache import close_forecast_cache
+from infrastructure.adapters.outbound.http_client import http_client_lifespan
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+from mcp_servers.forecast_analytics import HOURLY_VARIABLES, summarize_hourly
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Mantém o cliente HTTP compartilhado aberto enquanto o servidor roda."""
+    async with http_client_lifespan(server):
+        try:
+            yield {}
+        finally:
+            # Atualizações em segundo plano recriariam o cliente já fechado
+            await close_forecast_cache()
+
+
 # Cria instância do servidor MCP
-mcp = FastMCP("Weather MCP Server")
+mcp = FastMCP("Weather MCP Server", lifespan=lifespan)
+
+# Adaptador compartilhado; a geocodificação passa pelo cache do processo
+weather = OpenMeteoWeatherAdapter()
+
+FORECAST_PARAMS = {
+    "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code",
+    "daily": "temperature_2m_max,temperature_2m_min,weather_code",
+    "forecast_days": 3,
+}
+
+
+WEATHER_CODES = {
+    0: "Céu limpo",
+    1: "Principalmente claro",
+    2: "Parcialmente nublado", 
+    3: "Nublado",
+    45: "Neblina",
+    48: "Neblina com geada depositada",
+    51: "Garoa: Intensidade leve",
+    53: "Garoa: Intensidade moderada",
+    55: "Garoa: Intensidade densa",
+    61: "Chuva: Intensidade leve",
+    63: "Chuva: Intensidade moderada",
+    65: "Chuva: Intensidade forte",
+    71: "Queda de neve: Intensidade leve",
+    73: "Queda de neve: Intensidade moderada",
+    75: "Queda de neve: Intensidade forte",
+    80: "Pancadas de chuva: Leve",
+    81: "Pancadas de chuva: Moderada",
+    82: "Pancadas de chuva: Violenta",
+    95: "Tempestade: Leve ou moderada",
+    96: "Tempestade com granizo leve",
+    99: "Tempestade com granizo forte"
+}
+
+
+def describe_weather_code(code: int) -> str:
+    """Descrição em português de um código WMO (usada pela tool e pelas análises)."""
+    return WEATHER_CODES.get(code, f"Código desconhecido: {code}")
+
+
+def format_location(result: GeoLocation) -> Dict[str, Any]:
+    """Monta o bloco de localização das respostas de clima."""
+    return {
+        "name": result.name,
+        "country": result.country,
+        "latitude": result.latitude,
+        "longitude": result.longitude
+    }
+
+
+def format_weather(result: GeoLocation, weather_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Monta a resposta de clima de uma localização."""
+    return {
+        "location": format_location(result),
+        "current": weather_data.get("current", {}),
+        "daily_forecast": weather_data.get("daily", {}),
+        "units": weather_data.get("current_units", {}),
+        "timezone": weather_data.get("timezone", "")
+    }
 
 
 @mcp.tool
@@ -24,61 +109,122 @@ async def get_weather(location: str, units: str = "metric") -> Dict[str, Any]:
         Dicionário com informações meteorológicas
     """
     try:
-        # Primeiro, geocodifica a localização
-        geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
+        # Primeiro, geocodifica a localização (em cache)
+        result = await weather.resolve_location(location)
+        if result is None:
+            return {"error": f"Localização não encontrada: {location}"}
         
-        async with httpx.AsyncClient() as client:
-            # Geocodificação
-            geocoding_params = {
-                "name": location,
-                "count": 1,
-                "language": "pt",
-                "format": "json"
-            }
-            
-            geocoding_response = await client.get(geocoding_url, params=geocoding_params)
-            geocoding_data = geocoding_response.json()
-            
-            if not geocoding_data.get("results"):
-                return {"error": f"Localização não encontrada: {location}"}
-            
-            # Obtém coordenadas
-            result = geocoding_data["results"][0]
-            lat = result["latitude"]
-            lon = result["longitude"]
-            
-            # Consulta meteorológica
-            weather_url = "https://api.open-meteo.com/v1/forecast"
-            weather_params = {
-                "latitude": lat,
-                "longitude": lon,
-                "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code",
-                "daily": "temperature_2m_max,temperature_2m_min,weather_code",
-                "timezone": "auto",
-                "forecast_days": 3
-            }
-            
-            weather_response = await client.get(weather_url, params=weather_params)
-            weather_data = weather_response.json()
-            
-            return {
-                "location": {
-                    "name": result["name"],
-                    "country": result.get("country", ""),
-                    "latitude": lat,
-                    "longitude": lon
-                },
-                "current": weather_data.get("current", {}),
-                "daily_forecast": weather_data.get("daily", {}),
-                "units": weather_data.get("current_units", {}),
-                "timezone": weather_data.get("timezone", "")
-            }
+        # Consulta meteorológica
+        weather_data = await weather.fetch_forecast(result.latitude, result.longitude, **FORECAST_PARAMS)
+        
+        return format_weather(result, weather_data)
             
     except Exception as e:
         logger.error(f"Erro na consulta meteorológica: {e}")
         return {"error": f"Erro ao obter clima: {str(e)}"}
 
 
+@mcp.tool
+async def get_weather_batch(locations: List[str], units: str = "metric") -> Dict[str, Any]:
+    """
+    Obtém informações meteorológicas para várias localizações de uma vez.
+    
+    As localizações são geocodificadas em paralelo (limitado) e as previsões
+    buscadas em poucas requisições com listas de coordenadas.
+    
+    Args:
+        locations: Nomes das localizações (cidade, país)
+        units: Unidades de medida (metric, imperial)
+    
+    Returns:
+        Dicionário com um resultado (ou erro) por localização, na ordem da entrada
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.weather_batch_concurrency))
+    
+    async def geocode(location: str):
+        async with semaphore:
+            try:
+                resolved = await weather.resolve_location(location)
+            except Exception as e:
+                logger.error(f"Erro na geocodificação de {location}: {e}")
+                return f"Erro ao geocodificar: {str(e)}"
+            return resolved if resolved is not None else f"Localização não encontrada: {location}"
+    
+    resolved = await asyncio.gather(*[geocode(location) for location in locations])
+    found = [r for r in resolved if isinstance(r, GeoLocation)]
+    forecasts = iter(await weather.fetch_forecast_batch(
+        [(r.latitude, r.longitude) for r in found], **FORECAST_PARAMS
+    ))
+    
+    results = []
+    for location, result in zip(locations, resolved):
+        if not isinstance(result, GeoLocation):
+            results.append({"query": location, "error": result})
+            continue
+        weather_data = next(forecasts)
+        if isinstance(weather_data, Exception):
+            logger.error(f"Erro na consulta meteorológica de {location}: {weather_data}")
+            results.append({"query": location, "error": f"Erro ao obter clima: {str(weather_data)}"})
+        else:
+            results.append({"query": location, **format_weather(result, weather_data)})
+    
+    return {
+        "results": results,
+        "count": len(results),
+        "errors": sum(1 for r in results if "error" in r),
+    }
+
+
+@mcp.tool
+async def get_weather_analytics(
+    location: str,
+    days: int = 3,
+    window_hours: int = 6,
+    rain_threshold_mm: float = 0.1,
+) -> Dict[str, Any]:
+    """
+    Obtém um resumo estatístico da previsão horária de uma localização.
+    
+    Em vez das séries brutas, devolve valores pré-calculados: mínimo, máximo,
+    média e percentis por variável, janelas móveis mais quentes/frias/chuvosas,
+    horas de chuva, agregados diários e as condições (códigos WMO) mais frequentes.
+    
+    Args:
+        location: Nome da localização (cidade, país)
+        days: Dias de previsão (1 a 16)
+        window_hours: Tamanho das janelas móveis, em horas
+        rain_threshold_mm: Precipitação mínima para considerar uma hora chuvosa
+    
+    Returns:
+        Dicionário com a localização e o resumo da previsão horária
+    """
+    try:
+        result = await weather.resolve_location(location)
+        if result is None:
+            return {"error": f"Localização não encontrada: {location}"}
+        
+        weather_data = await weather.fetch_forecast(
+            result.latitude, result.longitude,
+            hourly=",".join(HOURLY_VARIABLES),
+            forecast_days=min(max(days, 1), 16),
+            timezone="auto",
+        )
+        
+        return {
+            "location": format_location(result),
+            "summary": summarize_hourly(
+                weather_data.get("hourly", {}), describe_weather_code,
+                window_hours=max(window_hours, 1), rain_threshold=rain_threshold_mm,
+            ),
+            "units": weather_data.get("hourly_units", {}),
+            "timezone": weather_data.get("timezone", "")
+        }
+            
+    except Exception as e:
+        logger.error(f"Erro na análise meteorológica: {e}")
+        return {"error": f"Erro ao analisar a previsão: {str(e)}"}
+
+
 @mcp.tool
 def decode_weather_code(code: int) -> str:
     """
@@ -90,32 +236,7 @@ def decode_weather_code(code: int) -> str:
     Returns:
         Descrição do clima em português
     """
-    weather_codes = {
-        0: "Céu limpo",
-        1: "Principalmente claro",
-        2: "Parcialmente nublado", 
-        3: "Nublado",
-        45: "Neblina",
-        48: "Neblina com geada depositada",
-        51: "Garoa: Intensidade leve",
-        53: "Garoa: Intensidade moderada",
-        55: "Garoa: Intensidade densa",
-        61: "Chuva: Intensidade leve",
-        63: "Chuva: Intensidade moderada",
-        65: "Chuva: Intensidade forte",
-        71: "Queda de neve: Intensidade leve",
-        73: "Queda de neve: Intensidade moderada",
-        75: "Queda de neve: Intensidade forte",
-        80: "Pancadas de chuva: Leve",
-        81: "Pancadas de chuva: Moderada",
-        82: "Pancadas de chuva: Violenta",
-        95: "Tempestade: Leve ou moderada",
-        96: "Tempestade com granizo leve",
-        99: "Tempestade com granizo forte"
-    }
-    
-    return weather_codes.get(code, f"Código desconhecido: {code}")
-
+    return describe_weather_code(code)
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
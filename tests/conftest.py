@@ -0,0 +1,13 @@
+"""
+Configuração compartilhada dos testes.
+
+Os módulos da aplicação são importados a partir de src/ ("config",
+"core", "infrastructure"), como no container; assim `pytest tests/unit/`
+roda sem PYTHONPATH.
+"""
+import sys
+from pathlib import Path
+
+src_path = Path(__file__).resolve().parents[1] / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
@@ -0,0 +1,55 @@
+"""
+Testes unitários para o modo multiprocesso do a2a_main.
+"""
+import a2a_main
+from config.settings import settings
+
+
+class TestServe:
+    """Testes para create_app e serve."""
+
+    def test_each_app_has_its_own_agent_factory(self):
+        """Testa que cada worker monta seu próprio pool de agentes."""
+        first, second = a2a_main.create_app(), a2a_main.create_app()
+
+        assert first.state.agent_factory is not second.state.agent_factory
+
+    def test_serve_uses_app_factory_and_worker_settings(self, monkeypatch):
+        """Testa a configuração repassada ao uvicorn."""
+        calls = []
+        monkeypatch.setattr(a2a_main.uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs)))
+        monkeypatch.setattr(settings, "a2a_workers", 4)
+        monkeypatch.setattr(settings, "a2a_graceful_timeout", 12.0)
+
+        a2a_main.serve()
+
+        app, kwargs = calls[0]
+        assert app == "a2a_main:create_app"
+        assert kwargs["factory"] is True
+        assert kwargs["workers"] == 4
+        assert kwargs["timeout_graceful_shutdown"] == 12.0
+        assert (kwargs["loop"], kwargs["http"]) == ("auto", "auto")
+
+    def test_single_worker_uses_the_same_server_options(self, monkeypatch):
+        """Testa que A2A_LOOP/HTTP/BACKLOG/GRACEFUL_TIMEOUT valem também com um worker."""
+        configs = []
+
+        class FakeServer:
+            def __init__(self, config):
+                configs.append(config)
+
+            def run(self):
+                pass
+
+        monkeypatch.setattr(a2a_main.uvicorn, "Server", FakeServer)
+        monkeypatch.setattr(a2a_main.logger, "add", lambda *args, **kwargs: None)
+        monkeypatch.setattr(settings, "a2a_loop", "asyncio")
+        monkeypatch.setattr(settings, "a2a_http", "h11")
+        monkeypatch.setattr(settings, "a2a_backlog", 512)
+        monkeypatch.setattr(settings, "a2a_graceful_timeout", 12.0)
+
+        a2a_main.main()
+
+        config = configs[0]
+        assert (config.loop, config.http, config.backlog) == ("asyncio", "h11", 512)
+        assert config.timeout_graceful_shutdown == 12.0
@@ -0,0 +1,107 @@
+"""
+Testes unitários para os stores do A2A sobre Redis (usando fakeredis).
+"""
+import pytest
+from a2a.types import PushNotificationConfig, Task, TaskState, TaskStatus
+from starlette.testclient import TestClient
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from config.settings import PersistenceBackend, settings
+from infrastructure.adapters.inbound.a2a_server import build_asgi_app
+from infrastructure.adapters.outbound import a2a_redis_stores
+from infrastructure.adapters.outbound.a2a_redis_stores import RedisPushNotificationConfigStore, RedisTaskStore
+
+
+@pytest.fixture
+def client():
+    """Cliente Redis em memória, em bytes como o pool compartilhado."""
+    return fakeredis.FakeAsyncRedis(decode_responses=False)
+
+
+def make_task(task_id: str, context_id: str = "ctx-1", state: TaskState = TaskState.working) -> Task:
+    return Task(id=task_id, context_id=context_id, status=TaskStatus(state=state))
+
+
+class TestRedisTaskStore:
+    """Testes para RedisTaskStore."""
+
+    @pytest.mark.asyncio
+    async def test_save_get_and_delete(self, client):
+        """Testa o ciclo de gravação, leitura e remoção com TTL."""
+        store = RedisTaskStore(client=client, ttl=120)
+
+        await store.save(make_task("t1"))
+        await store.save(make_task("t1", state=TaskState.completed))
+
+        task = await store.get("t1")
+        assert task.status.state == TaskState.completed
+        assert 0 < await client.ttl("a2a:task:t1") <= 120
+
+        await store.delete("t1")
+        assert await store.get("t1") is None
+        assert await store.list_by_context("ctx-1") == []
+
+    @pytest.mark.asyncio
+    async def test_list_by_context(self, client):
+        """Testa a listagem das tarefas de um contexto."""
+        store = RedisTaskStore(client=client, ttl=120)
+        for task_id in ("t1", "t2"):
+            await store.save(make_task(task_id))
+        await store.save(make_task("t3", context_id="ctx-2"))
+
+        assert [t.id for t in await store.list_by_context("ctx-1")] == ["t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_stores_share_state_across_instances(self, client):
+        """Testa que outra instância (outro worker) enxerga a tarefa."""
+        await RedisTaskStore(client=client, ttl=120).save(make_task("t1"))
+
+        assert (await RedisTaskStore(client=client, ttl=120).get("t1")).id == "t1"
+
+
+class TestRedisPushNotificationConfigStore:
+    """Testes para RedisPushNotificationConfigStore."""
+
+    @pytest.mark.asyncio
+    async def test_set_replace_and_delete(self, client):
+        """Testa configurações por ID, substituição e remoção."""
+        store = RedisPushNotificationConfigStore(client=client, ttl=120)
+
+        await store.set_info("t1", PushNotificationConfig(url="http://a/hook"))
+        await store.set_info("t1", PushNotificationConfig(id="second", url="http://b/hook"))
+        await store.set_info("t1", PushNotificationConfig(id="second", url="http://c/hook"))
+
+        configs = {c.id: c.url for c in await store.get_info("t1")}
+        assert configs == {"t1": "http://a/hook", "second": "http://c/hook"}
+
+        await store.delete_info("t1")
+        assert [c.id for c in await store.get_info("t1")] == ["second"]
+        assert await store.get_info("unknown") == []
+
+
+class TestMultiWorker:
+    """Teste de ponta a ponta com dois apps compartilhando o Redis."""
+
+    def test_task_created_on_one_worker_is_visible_on_another(self, monkeypatch):
+        """Testa tasks/get em um worker para tarefa criada em outro."""
+        shared = fakeredis.FakeAsyncRedis(decode_responses=False)
+        monkeypatch.setattr(a2a_redis_stores, "get_shared_client", lambda: shared)
+        monkeypatch.setattr(settings, "a2a_store_backend", PersistenceBackend.REDIS)
+
+        send = {
+            "jsonrpc": "2.0", "id": 1, "method": "message/send",
+            "params": {"message": {
+                "role": "user", "messageId": "m1", "kind": "message",
+                "parts": [{"kind": "text", "text": "info sobre o sistema"}],
+            }},
+        }
+        with TestClient(build_asgi_app()) as worker_a:
+            task = worker_a.post("/a2a", json=send).json()["result"]
+
+        get = {"jsonrpc": "2.0", "id": 2, "method": "tasks/get", "params": {"id": task["id"]}}
+        with TestClient(build_asgi_app()) as worker_b:
+            fetched = worker_b.post("/a2a", json=get).json()["result"]
+
+        assert fetched["status"]["state"] == "completed"
+        assert "informacional" in fetched["artifacts"][0]["parts"][0]["text"]
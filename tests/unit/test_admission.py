@@ -0,0 +1,201 @@
+"""
+Testes unitários para o controle de admissão do DynamicAgentExecutor.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from config.settings import settings
+from infrastructure.adapters.inbound import a2a_server
+from infrastructure.adapters.inbound.admission import AdmissionController, Limiter, OverloadedError, QueueFullError
+
+
+class SlowAgent:
+    """Agente que só responde depois de um atraso curto."""
+
+    def __init__(self, agent_id: str) -> None:
+        pass
+
+    async def handle(self, text: str) -> str:
+        await asyncio.sleep(0.2)
+        return "ok"
+
+
+def send_payload(request_id: int, agent_id: str = "dynamic") -> dict:
+    return {
+        "jsonrpc": "2.0", "id": request_id, "method": "message/send",
+        "params": {"message": {
+            "role": "user", "messageId": f"m{request_id}", "kind": "message",
+            "parts": [{"kind": "text", "text": "oi"}], "metadata": {"agent_id": agent_id},
+        }},
+    }
+
+
+class TestLimiter:
+    """Testes para Limiter."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_order(self):
+        """Testa a entrega das vagas liberadas na ordem da fila."""
+        limiter = Limiter(limit=1, max_queue=2)
+        assert await limiter.acquire(1) is False
+
+        order = []
+
+        async def wait(name: str) -> None:
+            assert await limiter.acquire(1) is True
+            order.append(name)
+
+        waiters = [asyncio.create_task(wait("a")), asyncio.create_task(wait("b"))]
+        await asyncio.sleep(0)
+        assert limiter.queued == 2
+
+        limiter.release()
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*waiters)
+
+        assert order == ["a", "b"]
+        assert limiter.active == 1 and limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_and_timeout(self):
+        """Testa a rejeição com fila cheia e a saída da fila no prazo."""
+        limiter = Limiter(limit=1, max_queue=1)
+        await limiter.acquire(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire(0.01)
+        assert limiter.queued == 0
+
+        waiting = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFullError):
+            await limiter.acquire(1)
+
+        limiter.release()
+        assert await waiting is True
+        limiter.release()
+        assert limiter.idle()
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_is_unlimited(self):
+        """Testa que limite 0 nunca enfileira."""
+        limiter = Limiter(limit=0, max_queue=0)
+
+        assert [await limiter.acquire(0) for _ in range(100)] == [False] * 100
+
+
+class TestAdmissionController:
+    """Testes para AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_agent_limit_does_not_block_other_agents(self):
+        """Testa que o limite por agente isola um agente ocupado."""
+        admission = AdmissionController(
+            max_concurrency=10, max_queue=10, agent_max_concurrency=1, agent_max_queue=1,
+            queue_timeout=1, retry_after=3,
+        )
+
+        async with admission.admit("busy"):
+            queued = asyncio.create_task(admission.admit("busy").__aenter__())
+            await asyncio.sleep(0)
+            with pytest.raises(OverloadedError) as exc:
+                async with admission.admit("busy"):
+                    pass
+            async with admission.admit("other"):
+                assert admission.stats()["busy_agents"] == 2
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+        assert (exc.value.scope, exc.value.reason, exc.value.retry_after) == ("agent busy", "queue_full", 3)
+        stats = admission.stats()
+        assert stats["admitted"] == 2 and stats["active"] == 0 and stats["busy_agents"] == 0
+        assert stats["rejected"] == {"queue_full": 1, "queue_timeout": 0}
+
+    @pytest.mark.asyncio
+    async def test_zero_queue_and_timeout_mean_unlimited(self):
+        """Testa que A2A_MAX_QUEUE=0 e A2A_QUEUE_TIMEOUT=0 enfileiram sem limite nem prazo."""
+        admission = AdmissionController(
+            max_concurrency=1, max_queue=0, agent_max_concurrency=0, agent_max_queue=0,
+            queue_timeout=0, retry_after=1,
+        )
+        done = []
+
+        async def run(i: int) -> None:
+            async with admission.admit(f"agent-{i}"):
+                await asyncio.sleep(0.01)
+                done.append(i)
+
+        await asyncio.gather(*(run(i) for i in range(20)))
+
+        assert sorted(done) == list(range(20))
+        assert admission.stats()["rejected"] == {"queue_full": 0, "queue_timeout": 0}
+
+    @pytest.mark.asyncio
+    async def test_global_queue_timeout_releases_agent_slot(self):
+        """Testa o prazo esgotado na fila global sem vazar a vaga do agente."""
+        admission = AdmissionController(
+            max_concurrency=1, max_queue=5, agent_max_concurrency=5, agent_max_queue=5,
+            queue_timeout=0.02, retry_after=1,
+        )
+
+        async with admission.admit("a"):
+            with pytest.raises(OverloadedError) as exc:
+                async with admission.admit("b"):
+                    pass
+            assert "b" not in admission._agents
+
+        assert (exc.value.scope, exc.value.reason) == ("global", "queue_timeout")
+        assert admission.stats()["rejected"]["queue_timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_request_is_admitted_when_a_slot_frees(self):
+        """Testa a espera na fila e as métricas de espera."""
+        admission = AdmissionController(
+            max_concurrency=1, max_queue=5, agent_max_concurrency=0, agent_max_queue=0,
+            queue_timeout=1, retry_after=1,
+        )
+
+        async def hold() -> None:
+            async with admission.admit("a"):
+                await asyncio.sleep(0.05)
+
+        first = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        async with admission.admit("a"):
+            pass
+        await first
+
+        stats = admission.stats()
+        assert stats["admitted"] == 2 and stats["queued"] == 1
+        assert stats["wait_ms_max"] >= 30
+
+
+class TestOverloadedResponse:
+    """Teste de ponta a ponta via JSON-RPC message/send."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_gets_retryable_error(self, monkeypatch):
+        """Testa o erro JSON-RPC -32050 com retry_after e as métricas em /agents/admission."""
+        monkeypatch.setattr(a2a_server, "DynamicAgent", SlowAgent)
+        monkeypatch.setattr(settings, "a2a_max_concurrency", 1)
+        monkeypatch.setattr(settings, "a2a_max_queue", 1)
+        monkeypatch.setattr(settings, "a2a_queue_timeout", 0.05)
+        monkeypatch.setattr(settings, "a2a_retry_after", 2.5)
+
+        transport = httpx.ASGITransport(app=a2a_server.build_asgi_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            accepted, rejected = await asyncio.gather(
+                client.post("/a2a", json=send_payload(1)),
+                client.post("/a2a", json=send_payload(2, agent_id="other")),
+            )
+            stats = (await client.get("/agents/admission")).json()
+
+        assert accepted.json()["result"]["status"]["state"] == "completed"
+        error = rejected.json()["error"]
+        assert error["code"] == a2a_server.OVERLOADED_ERROR_CODE
+        assert error["data"] == {"retryable": True, "retry_after": 2.5, "scope": "global", "reason": "queue_timeout"}
+        assert stats["admitted"] == 1 and stats["rejected"]["queue_timeout"] == 1
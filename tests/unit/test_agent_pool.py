@@ -0,0 +1,110 @@
+"""
+Testes unitários para o pool de agentes do DynamicAgentFactory.
+"""
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+from infrastructure.adapters.inbound.a2a_server import DynamicAgent, DynamicAgentFactory, build_asgi_app
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDynamicAgentFactory:
+    """Testes para limite, expiração, coalescência e pré-aquecimento."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_agents(self):
+        """Testa que o mesmo agent_id devolve a mesma instância."""
+        factory = DynamicAgentFactory(max_size=10, idle_ttl=60)
+
+        first = await factory.get_or_create_agent("a")
+        second = await factory.get_or_create_agent("a")
+
+        assert first is second and isinstance(first, DynamicAgent)
+        assert (factory.stats()["hits"], factory.stats()["creations"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_max_size(self):
+        """Testa o descarte do agente menos recentemente usado."""
+        factory = DynamicAgentFactory(max_size=2, idle_ttl=0)
+
+        a = await factory.get_or_create_agent("a")
+        await factory.get_or_create_agent("b")
+        await factory.get_or_create_agent("a")
+        await factory.get_or_create_agent("c")
+
+        assert len(factory) == 2
+        assert await factory.get_or_create_agent("a") is a
+        assert factory.stats()["evictions"] == 1
+        assert factory.stats()["creations"] == 3
+
+    @pytest.mark.asyncio
+    async def test_idle_agents_expire(self):
+        """Testa a expiração por ociosidade, renovada a cada uso."""
+        clock = FakeClock()
+        factory = DynamicAgentFactory(max_size=10, idle_ttl=60, clock=clock)
+        old = await factory.get_or_create_agent("old")
+        active = await factory.get_or_create_agent("active")
+
+        clock.now = 50
+        await factory.get_or_create_agent("active")
+        clock.now = 70
+
+        assert await factory.get_or_create_agent("active") is active
+        assert await factory.get_or_create_agent("old") is not old
+        assert factory.stats()["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_creations_are_coalesced(self):
+        """Testa uma única criação para chamadas concorrentes do mesmo agent_id."""
+        calls = []
+
+        async def builder(agent_id: str) -> DynamicAgent:
+            calls.append(agent_id)
+            await asyncio.sleep(0.01)
+            return DynamicAgent(agent_id)
+
+        factory = DynamicAgentFactory(max_size=10, idle_ttl=60, builder=builder)
+
+        agents = await asyncio.gather(*[factory.get_or_create_agent("slow") for _ in range(10)])
+
+        assert calls == ["slow"]
+        assert all(agent is agents[0] for agent in agents)
+        assert factory.stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_warm_agents_are_pinned(self):
+        """Testa que agentes pré-aquecidos não são descartados."""
+        factory = DynamicAgentFactory(max_size=2, idle_ttl=0)
+        await factory.warmup(["weather"])
+        weather = await factory.get_or_create_agent("weather")
+
+        for agent_id in ("a", "b", "c"):
+            await factory.get_or_create_agent(agent_id)
+
+        assert await factory.get_or_create_agent("weather") is weather
+        assert factory.stats()["pinned"] == 1
+        assert len(factory) == 2
+
+
+class TestAgentPoolRoute:
+    """Testes para a rota de métricas do pool."""
+
+    def test_stats_route_reports_warm_agents(self, monkeypatch):
+        """Testa o pré-aquecimento no lifespan e a rota /agents/pool."""
+        from config.settings import settings
+        monkeypatch.setattr(settings, "agent_pool_warm_agents", "weather, info")
+
+        with TestClient(build_asgi_app()) as client:
+            stats = client.get("/agents/pool").json()
+
+        assert stats["pinned"] == 2
+        assert stats["max_size"] == settings.agent_pool_max_size
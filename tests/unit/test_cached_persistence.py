@@ -0,0 +1,125 @@
+"""
+Testes unitários para o cache L1 sobre PersistencePort.
+"""
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from core.domain.models import AgentType, ConversationContext, Message, Task
+from infrastructure.adapters.outbound.cached_persistence import CachedPersistenceAdapter, LRUTTLCache
+from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Testes para o cache LRU com TTL."""
+
+    def test_evicts_least_recently_used(self):
+        """Testa despejo da entrada menos usada ao exceder o limite."""
+        cache = LRUTTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.evictions == 1
+
+    def test_respects_byte_budget(self):
+        """Testa limite em bytes."""
+        cache = LRUTTLCache(max_entries=100, max_bytes=10)
+        cache.set("a", 1, size=6)
+        cache.set("b", 2, size=6)
+
+        assert len(cache) == 1
+        assert cache.stats()["bytes"] == 6
+
+    def test_entries_expire(self):
+        """Testa expiração por TTL."""
+        clock = FakeClock()
+        cache = LRUTTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 11
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+
+class TestCachedPersistenceAdapter:
+    """Testes para o decorador com cache e invalidação."""
+
+    @pytest.fixture
+    def server(self):
+        return fakeredis.FakeServer()
+
+    def make_adapter(self, server):
+        client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        return CachedPersistenceAdapter(RedisAdapter(client=client), invalidation_client=client)
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self, server):
+        """Testa que leituras repetidas não voltam ao Redis."""
+        adapter = self.make_adapter(server)
+        await adapter.inner.save_task(Task(id="task-001", content="c", agent_type=AgentType.ACTION))
+
+        first = await adapter.get_task("task-001")
+        second = await adapter.get_task("task-001")
+
+        assert first == second
+        assert first is not second
+        assert adapter.stats()["hits"] == 1
+        assert adapter.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_value_is_isolated_from_callers(self, server):
+        """Testa que alterações do chamador não contaminam o cache."""
+        adapter = self.make_adapter(server)
+        await adapter.save_conversation(ConversationContext(id="conv-001"))
+
+        loaded = await adapter.get_conversation("conv-001")
+        loaded.current_agent = "alterado"
+        loaded.messages.append(Message(id="msg-x", content="x", sender="user"))
+        loaded.metadata["chave"] = "valor"
+
+        cached = await adapter.get_conversation("conv-001")
+        assert cached.current_agent is None
+        assert cached.messages == [] and cached.metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_saved_object_is_detached_from_cache(self, server):
+        """Testa que alterar o objeto depois de salvá-lo não contamina o cache."""
+        adapter = self.make_adapter(server)
+        task = Task(id="task-001", content="c", agent_type=AgentType.ACTION)
+        await adapter.save_task(task)
+
+        task.status = "alterado"
+
+        assert (await adapter.get_task("task-001")).status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_write_in_other_process_invalidates(self, server):
+        """Testa invalidação entre processos via pub/sub."""
+        reader, writer = self.make_adapter(server), self.make_adapter(server)
+        await reader.start()
+        task = Task(id="task-001", content="c", agent_type=AgentType.ACTION)
+        await writer.save_task(task)
+        assert (await reader.get_task("task-001")).status == "pending"
+
+        await writer.update_task(task.model_copy(update={"status": "completed"}))
+        for _ in range(50):
+            if reader.stats()["invalidations"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert (await reader.get_task("task-001")).status == "completed"
+        await reader.stop()
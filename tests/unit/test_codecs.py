@@ -0,0 +1,87 @@
+"""
+Testes unitários para os codecs de serialização.
+"""
+import pytest
+
+from core.domain.models import AgentType, ConversationContext, Message, Task
+from infrastructure.adapters.outbound import codecs
+from infrastructure.adapters.outbound.codecs import (
+    MSGPACK_AVAILABLE, JsonCodec, MsgPackCodec, decode_model, get_codec,
+)
+
+requires_msgpack = pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack não instalado")
+
+
+@pytest.fixture
+def conversation():
+    return ConversationContext(
+        id="conv-001",
+        messages=[
+            Message(id=f"msg-{i}", content=f"mensagem {i}", sender="agent", metadata={"i": i})
+            for i in range(5)
+        ],
+        metadata={"tags": ["a", "b"]},
+    )
+
+
+class TestJsonCodec:
+    """Testes para o codec JSON."""
+
+    def test_output_matches_legacy_format(self, conversation):
+        """Testa que o JSON continua sem prefixo, como antes."""
+        assert JsonCodec().encode(conversation) == conversation.model_dump_json().encode()
+
+    def test_decodes_legacy_text(self, conversation):
+        """Testa leitura de valores gravados com decode_responses=True."""
+        assert decode_model(conversation.model_dump_json(), ConversationContext) == conversation
+
+
+@requires_msgpack
+class TestMsgPackCodec:
+    """Testes para o codec msgpack."""
+
+    def test_roundtrip(self, conversation):
+        """Testa ida e volta preservando tipos (datetime, enum)."""
+        task = Task(id="task-001", content="c", agent_type=AgentType.ACTION)
+        codec = MsgPackCodec()
+
+        assert codec.decode(codec.encode(conversation), ConversationContext) == conversation
+        assert codec.decode(codec.encode(task), Task) == task
+
+    def test_is_tagged_and_smaller(self, conversation):
+        """Testa prefixo de formato e tamanho menor que o JSON."""
+        encoded = MsgPackCodec().encode(conversation)
+
+        assert encoded[:2] == b"\xc1\x01"
+        assert len(encoded) < len(JsonCodec().encode(conversation))
+
+    def test_json_codec_reads_msgpack(self, conversation):
+        """Testa que qualquer codec lê dados dos demais formatos."""
+        encoded = MsgPackCodec().encode(conversation, exclude={"messages"})
+
+        decoded = JsonCodec().decode(encoded, ConversationContext)
+
+        assert decoded.messages == []
+        assert decoded.metadata == conversation.metadata
+
+
+def test_unknown_format_version_is_rejected():
+    """Testa erro para versões de formato desconhecidas."""
+    with pytest.raises(ValueError):
+        decode_model(b"\xc1\x09abc", Message)
+
+
+def test_get_codec_by_name():
+    """Testa criação de codecs pelo nome."""
+    assert isinstance(get_codec("json"), JsonCodec)
+    with pytest.raises(ValueError):
+        get_codec("xml")
+
+
+def test_msgpack_codec_without_package_fails_clearly(monkeypatch):
+    """Testa o erro explícito quando REDIS_CODEC=msgpack e o pacote opcional falta."""
+    monkeypatch.setattr(codecs, "MSGPACK_AVAILABLE", False)
+
+    with pytest.raises(RuntimeError, match="REDIS_CODEC=msgpack"):
+        get_codec("msgpack")
+    assert isinstance(get_codec("json"), JsonCodec)
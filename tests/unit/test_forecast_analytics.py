@@ -0,0 +1,113 @@
+"""
+Testes unitários para os resumos vetorizados da previsão horária.
+"""
+import httpx
+import numpy as np
+import pytest
+
+from fastmcp import Client
+
+from infrastructure.adapters.outbound.forecast_cache import ForecastCache
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+from mcp_servers import weather_server
+from mcp_servers.forecast_analytics import rolling_sum, summarize_hourly
+
+
+def hourly_block():
+    """Dois dias de dados horários: manhã fria, tarde quente e chuva no segundo dia."""
+    times = [f"2026-01-0{day}T{hour:02d}:00" for day in (1, 2) for hour in range(24)]
+    temperature = [20.0 + (10.0 if 12 <= hour < 18 else 0.0) for _ in (1, 2) for hour in range(24)]
+    precipitation = [0.0] * 24 + [2.0 if 6 <= hour < 9 else 0.0 for hour in range(24)]
+    codes = [0] * 24 + [63 if 6 <= hour < 9 else 3 for hour in range(24)]
+    temperature[5] = None
+    return {
+        "time": times,
+        "temperature_2m": temperature,
+        "precipitation": precipitation,
+        "weather_code": codes,
+    }
+
+
+class TestSummarizeHourly:
+    """Testes para summarize_hourly."""
+
+    def test_stats_ignore_missing_values(self):
+        """Testa estatísticas e percentis com valores nulos."""
+        summary = summarize_hourly(hourly_block(), weather_server.describe_weather_code)
+
+        stats = summary["stats"]["temperature_2m"]
+        assert summary["hours"] == 48
+        assert (stats["min"], stats["max"], stats["p50"]) == (20.0, 30.0, 20.0)
+        assert summary["period"] == {"start": "2026-01-01T00:00", "end": "2026-01-02T23:00"}
+
+    def test_rolling_windows_and_rain(self):
+        """Testa janelas móveis e contagem de horas de chuva."""
+        summary = summarize_hourly(hourly_block(), weather_server.describe_weather_code, window_hours=3)
+
+        assert summary["windows"]["warmest"] == {"start": "2026-01-01T12:00", "end": "2026-01-01T14:00", "value": 30.0}
+        assert summary["windows"]["wettest"]["start"] == "2026-01-02T06:00"
+        assert summary["windows"]["wettest"]["value"] == 6.0
+        assert summary["rain"] == {"total_mm": 6.0, "rain_hours": 3, "max_hourly_mm": 2.0}
+
+    def test_daily_aggregates_and_conditions(self):
+        """Testa agregados diários e o histograma de códigos WMO decodificados."""
+        summary = summarize_hourly(hourly_block(), weather_server.describe_weather_code)
+
+        assert [d["date"] for d in summary["daily"]] == ["2026-01-01", "2026-01-02"]
+        assert summary["daily"][1]["precipitation_mm"] == 6.0
+        assert summary["daily"][0]["temperature_max"] == 30.0
+        assert summary["conditions"][0] == {"code": 0, "description": "Céu limpo", "hours": 24}
+        assert summary["conditions"][-1]["description"] == "Chuva: Intensidade moderada"
+
+    def test_rolling_sum_matches_naive_window(self):
+        """Testa a soma móvel por soma acumulada contra o cálculo direto."""
+        values = [float(v) for v in range(10)]
+
+        result = rolling_sum(np.array(values), 4)
+
+        assert list(result) == [sum(values[i:i + 4]) for i in range(7)]
+
+    def test_empty_block(self):
+        """Testa previsão sem dados horários."""
+        summary = summarize_hourly({}, weather_server.describe_weather_code)
+
+        assert summary == {"hours": 0, "period": None, "stats": {}, "daily": []}
+
+
+class TestGetWeatherAnalyticsTool:
+    """Testes para a ferramenta MCP get_weather_analytics."""
+
+    @pytest.mark.asyncio
+    async def test_returns_compact_summary(self, monkeypatch):
+        """Testa que a ferramenta pede séries horárias e devolve só o resumo."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "search" in request.url.path:
+                return httpx.Response(200, json={"results": [
+                    {"name": "Recife", "country": "Brasil", "latitude": -8.05, "longitude": -34.9}
+                ]})
+            requests.append(request)
+            return httpx.Response(200, json={"hourly": hourly_block(), "timezone": "America/Recife"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            adapter = OpenMeteoWeatherAdapter(
+                client=http,
+                geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10),
+                forecast_cache=ForecastCache(max_entries=10),
+            )
+            monkeypatch.setattr(weather_server, "weather", adapter)
+            # Versões do fastmcp em que @mcp.tool devolve um objeto Tool, não a função
+            monkeypatch.setattr(weather_server, "decode_weather_code", object())
+            async with Client(weather_server.mcp) as client:
+                result = await client.call_tool("get_weather_analytics", {"location": "Recife", "days": 2})
+
+        payload = result.data
+        assert "hourly" not in payload
+        assert payload["summary"]["rain"]["rain_hours"] == 3
+        assert payload["timezone"] == "America/Recife"
+        assert payload["location"] == {"name": "Recife", "country": "Brasil", "latitude": -8.05, "longitude": -34.9}
+        assert payload["summary"]["conditions"][0]["description"] == "Céu limpo"
+        assert "precipitation" in requests[0].url.params["hourly"]
+        assert requests[0].url.params["forecast_days"] == "2"
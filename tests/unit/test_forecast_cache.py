@@ -0,0 +1,165 @@
+"""
+Testes unitários para o cache de previsões (grade, hora de modelo e SWR).
+"""
+import asyncio
+
+import pytest
+
+from infrastructure.adapters.outbound import forecast_cache
+from infrastructure.adapters.outbound.forecast_cache import ForecastCache
+from mcp_servers import weather_server
+
+PARAMS = {"current": "temperature_2m,wind_speed_10m"}
+HOUR = 3600.0
+
+
+class FakeClock:
+    def __init__(self, now: float = 100 * HOUR) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingFetcher:
+    def __init__(self) -> None:
+        self.calls = []
+        self.fail = False
+        self.gate = None
+
+    async def __call__(self, latitude, longitude, params):
+        self.calls.append((latitude, longitude))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("upstream indisponível")
+        return {"latitude": latitude, "longitude": longitude, "version": len(self.calls)}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ForecastCache(max_entries=100, grid_degrees=0.1, update_interval=HOUR, max_stale=HOUR, clock=clock)
+
+
+class TestGridAndKeys:
+    """Testes para células de grade e chaves."""
+
+    @pytest.mark.asyncio
+    async def test_nearby_points_share_a_cell(self, cache):
+        """Testa que pontos da mesma célula usam uma única consulta no centro."""
+        fetcher = CountingFetcher()
+
+        first = await cache.get_or_fetch(-23.56, -46.63, PARAMS, fetcher)
+        second = await cache.get_or_fetch(-23.58, -46.61, PARAMS, fetcher)
+
+        assert first == second
+        assert fetcher.calls == [(-23.6, -46.6)]
+
+    @pytest.mark.asyncio
+    async def test_variable_order_does_not_matter(self, cache):
+        """Testa chave canônica para a lista de variáveis."""
+        fetcher = CountingFetcher()
+
+        await cache.get_or_fetch(-23.55, -46.63, {"current": "wind_speed_10m,temperature_2m"}, fetcher)
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        await cache.get_or_fetch(-23.55, -46.63, {**PARAMS, "forecast_days": 3}, fetcher)
+
+        assert len(fetcher.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_payload_is_a_copy(self, cache):
+        """Testa que alterar o resultado não altera o cache."""
+        fetcher = CountingFetcher()
+        data = await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        data["version"] = 99
+
+        assert (await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher))["version"] == 1
+
+
+class TestStaleWhileRevalidate:
+    """Testes para frescor por hora de modelo e atualização em segundo plano."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_until_the_model_hour_changes(self, cache, clock):
+        """Testa que a entrada é fresca dentro da mesma hora de modelo."""
+        fetcher = CountingFetcher()
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        clock.now += HOUR - 1
+
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+
+        assert len(fetcher.calls) == 1
+        assert cache.stats()["fresh_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_refreshing(self, cache, clock):
+        """Testa resposta imediata com dados velhos e uma única atualização."""
+        fetcher = CountingFetcher()
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        clock.now += HOUR
+        fetcher.gate = asyncio.Event()
+
+        stale = await asyncio.gather(*[cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher) for _ in range(5)])
+        await asyncio.sleep(0)
+        assert [d["version"] for d in stale] == [1] * 5
+        assert cache.stats()["refreshing"] == 1
+
+        fetcher.gate.set()
+        await asyncio.sleep(0.01)
+        fresh = await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+
+        assert fresh["version"] == 2
+        assert len(fetcher.calls) == 2
+        assert cache.stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self, cache, clock):
+        """Testa que falhas de atualização mantêm os dados velhos."""
+        fetcher = CountingFetcher()
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        clock.now += HOUR
+        fetcher.fail = True
+
+        assert (await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher))["version"] == 1
+        await asyncio.sleep(0.01)
+
+        assert cache.stats()["refresh_errors"] == 1
+        assert (await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher))["version"] == 1
+
+    @pytest.mark.asyncio
+    async def test_too_stale_entry_is_fetched_synchronously(self, cache, clock):
+        """Testa que dados além de max_stale não são servidos."""
+        fetcher = CountingFetcher()
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        clock.now += 2 * HOUR
+
+        data = await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+
+        assert data["version"] == 2
+        assert cache.stats()["stale_hits"] == 0
+
+
+class TestShutdown:
+    """Testes do encerramento das atualizações no lifespan."""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_cancels_background_refresh(self, cache, clock, monkeypatch):
+        """Testa que nenhuma atualização sobrevive ao desligamento do servidor MCP."""
+        monkeypatch.setattr(forecast_cache, "_shared_cache", cache)
+        fetcher = CountingFetcher()
+        await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+        clock.now += HOUR
+        fetcher.gate = asyncio.Event()
+
+        async with weather_server.lifespan(weather_server.mcp):
+            await cache.get_or_fetch(-23.55, -46.63, PARAMS, fetcher)
+            await asyncio.sleep(0)
+            refresh = next(iter(cache._refreshing.values()))
+
+        assert refresh.cancelled()
+        assert cache.stats()["refreshing"] == 0
@@ -0,0 +1,127 @@
+"""
+Testes unitários para o geocodificador offline (gazetteer mapeado em memória).
+"""
+import httpx
+import pytest
+
+from infrastructure.adapters.outbound.gazetteer import Gazetteer, build_gazetteer
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+
+CITIES = [
+    ("São Paulo", "Brasil", "BR", -23.5475, -46.63611, 10021295),
+    ("Paris", "França", "FR", 48.85341, 2.3488, 2138551),
+    ("Paris", "Estados Unidos", "US", 33.66094, -95.55551, 24782),
+    ("Porto Alegre", "Brasil", "BR", -30.03306, -51.23, 1372741),
+    ("Porto", "Portugal", "PT", 41.14961, -8.61099, 249633),
+    ("Florianópolis", "Brasil", "BR", -27.59667, -48.54917, 421240),
+    ("München", "Alemanha", "DE", 48.13743, 11.57549, 1260391),
+]
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = tmp_path / "gazetteer.bin"
+    build_gazetteer(CITIES, str(path), extra_names={6: ["Munich", "Muenchen"]})
+    index = Gazetteer(str(path), min_similarity=0.75)
+    yield index
+    index.close()
+
+
+class TestGazetteerLookup:
+    """Testes para as estratégias de busca."""
+
+    def test_exact_match_is_accent_and_case_insensitive(self, gazetteer):
+        """Testa busca exata com chave normalizada."""
+        location = gazetteer.lookup("  SAO paulo ")
+
+        assert (location.name, location.country) == ("São Paulo", "Brasil")
+        assert location.latitude == pytest.approx(-23.5475, abs=1e-4)
+
+    def test_homonyms_are_ranked_by_population(self, gazetteer):
+        """Testa desempate pela população e restrição por país."""
+        assert gazetteer.lookup("Paris").country == "França"
+        assert gazetteer.lookup("Paris, US").country == "Estados Unidos"
+        assert gazetteer.lookup("Paris, estados unidos").country == "Estados Unidos"
+
+    def test_alternate_names_resolve_to_the_same_place(self, gazetteer):
+        """Testa nomes alternativos indexados como chaves extras."""
+        assert gazetteer.lookup("Munich").name == "München"
+
+    def test_near_misses_do_not_resolve(self, gazetteer):
+        """Testa que prefixos e erros de digitação não resolvem no lookup."""
+        assert gazetteer.lookup("Floria") is None
+        assert gazetteer.lookup("Florianopolos") is None
+
+    def test_closest_requires_high_unambiguous_similarity(self, gazetteer):
+        """Testa a busca aproximada: limiar alto e só candidata única."""
+        assert gazetteer.closest("Florianopolos").name == "Florianópolis"
+        assert gazetteer.closest("Sao Paolo") is None
+        assert gazetteer.closest("Pxrto") is None
+
+    def test_unknown_location_returns_none(self, gazetteer):
+        """Testa ausência de correspondência local."""
+        assert gazetteer.lookup("Atlantis") is None
+        assert gazetteer.lookup("Paris, JP") is None
+
+
+class TestLocalFirstGeocoding:
+    """Testes para o adaptador com gazetteer e fallback remoto."""
+
+    @pytest.mark.asyncio
+    async def test_remote_api_is_used_only_without_local_match(self, gazetteer):
+        """Testa que a API remota só é chamada quando o gazetteer não resolve."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.params["name"])
+            return httpx.Response(200, json={"results": [
+                {"name": "Ushuaia", "country": "Argentina", "latitude": -54.8, "longitude": -68.3}
+            ]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = OpenMeteoWeatherAdapter(
+                client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10), gazetteer=gazetteer
+            )
+            local = await adapter.geocode_location("São Paulo")
+            remote = await adapter.geocode_location("Ushuaia")
+
+        assert local == pytest.approx((-23.5475, -46.63611), abs=1e-4)
+        assert remote == (-54.8, -68.3)
+        assert requests == ["Ushuaia"]
+
+    @pytest.mark.asyncio
+    async def test_near_miss_goes_to_remote_api(self, gazetteer):
+        """Testa que um quase acerto local é resolvido pela API remota."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.params["name"])
+            return httpx.Response(200, json={"results": [
+                {"name": "Portimão", "country": "Portugal", "latitude": 37.14, "longitude": -8.54}
+            ]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = OpenMeteoWeatherAdapter(
+                client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10), gazetteer=gazetteer
+            )
+            location = await adapter.resolve_location("Portimão")
+
+        assert location.name == "Portimão"
+        assert requests == ["Portimão"]
+
+    @pytest.mark.asyncio
+    async def test_closest_local_match_when_remote_api_fails(self, gazetteer):
+        """Testa a busca aproximada local só quando a API remota falha."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("sem rede", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = OpenMeteoWeatherAdapter(
+                client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10), gazetteer=gazetteer
+            )
+            location = await adapter.resolve_location("Florianopolos")
+            with pytest.raises(httpx.ConnectError):
+                await adapter.resolve_location("Atlantis")
+
+        assert location.name == "Florianópolis"
@@ -0,0 +1,153 @@
+"""
+Testes unitários para o cache de geocodificação e o adaptador Open-Meteo.
+"""
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from core.domain.models import GeoLocation
+from infrastructure.adapters.outbound.cached_persistence import LRUTTLCache
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache, normalize_location
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+
+SAO_PAULO = GeoLocation(name="São Paulo", country="Brasil", latitude=-23.55, longitude=-46.63)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self, result=SAO_PAULO) -> None:
+        self.result = result
+        self.calls = []
+
+    async def __call__(self, location: str):
+        self.calls.append(location)
+        return self.result
+
+
+class UnavailableRedis:
+    async def get(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def set(self, key, value, ex=None):
+        raise RedisConnectionError("Connection refused")
+
+
+class TestNormalizeLocation:
+    """Testes para normalização das chaves."""
+
+    def test_ignores_case_accents_and_spacing(self):
+        """Testa que variações da mesma cidade geram a mesma chave."""
+        variants = ["São Paulo", "sao paulo", "  SÃO   PAULO ", "Sao-Paulo"]
+
+        assert {normalize_location(v) for v in variants} == {"sao paulo"}
+
+    def test_keeps_distinct_locations_apart(self):
+        """Testa que o país continua fazendo parte da chave."""
+        assert normalize_location("Paris, FR") != normalize_location("Paris")
+
+
+class TestGeocodingCache:
+    """Testes para o cache em dois níveis."""
+
+    @pytest.mark.asyncio
+    async def test_variants_share_one_upstream_call(self):
+        """Testa acerto no L1 para grafias diferentes."""
+        cache = GeocodingCache(ttl=100, negative_ttl=10)
+        loader = CountingLoader()
+
+        first = await cache.get_or_load("São Paulo", loader)
+        second = await cache.get_or_load("sao paulo", loader)
+
+        assert first == second == SAO_PAULO
+        assert loader.calls == ["São Paulo"]
+
+    @pytest.mark.asyncio
+    async def test_negative_results_use_shorter_ttl(self):
+        """Testa cache negativo com TTL próprio."""
+        clock = FakeClock()
+        cache = GeocodingCache(ttl=100, negative_ttl=10, cache=LRUTTLCache(ttl=100, clock=clock))
+        loader = CountingLoader(result=None)
+
+        assert await cache.get_or_load("Atlantis", loader) is None
+        assert await cache.get_or_load("atlantis", loader) is None
+        clock.now = 11
+        assert await cache.get_or_load("Atlantis", loader) is None
+
+        assert len(loader.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_are_not_cached(self):
+        """Testa que falhas do upstream não viram cache negativo."""
+        cache = GeocodingCache(ttl=100, negative_ttl=10)
+
+        async def failing(location):
+            raise httpx.ConnectError("offline")
+
+        with pytest.raises(httpx.ConnectError):
+            await cache.get_or_load("Recife", failing)
+        assert await cache.get_or_load("Recife", CountingLoader()) == SAO_PAULO
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared_between_instances(self):
+        """Testa que um segundo processo aproveita o L2 no Redis."""
+        client = fakeredis.FakeAsyncRedis()
+        loader = CountingLoader()
+        await GeocodingCache(client=client, ttl=100, negative_ttl=10).get_or_load("São Paulo", loader)
+        await GeocodingCache(client=client, ttl=100, negative_ttl=10).get_or_load("Atlantis", CountingLoader(None))
+
+        other = GeocodingCache(client=client, ttl=100, negative_ttl=10)
+        assert await other.get_or_load("SAO PAULO", loader) == SAO_PAULO
+        assert await other.get_or_load("atlantis", loader) is None
+        assert loader.calls == ["São Paulo"]
+        assert other.stats()["l2_hits"] == 2
+        assert 0 < await client.ttl("geocode:atlantis") <= 10
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_upstream(self):
+        """Testa que o Redis indisponível não impede a geocodificação."""
+        cache = GeocodingCache(client=UnavailableRedis(), ttl=100, negative_ttl=10)
+
+        assert await cache.get_or_load("São Paulo", CountingLoader()) == SAO_PAULO
+        assert cache.stats()["l2_errors"] == 2
+
+
+class TestOpenMeteoWeatherAdapter:
+    """Testes para o adaptador Open-Meteo."""
+
+    @pytest.mark.asyncio
+    async def test_geocode_location_hits_upstream_once(self):
+        """Testa geocodificação repetida com uma única chamada HTTP."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"results": [
+                {"name": "São Paulo", "country": "Brasil", "latitude": -23.55, "longitude": -46.63}
+            ]})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = OpenMeteoWeatherAdapter(client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10))
+            coordinates = [await adapter.geocode_location(name) for name in ["São Paulo", "sao paulo"]]
+
+        assert coordinates == [(-23.55, -46.63)] * 2
+        assert len(requests) == 1
+        assert requests[0].url.params["name"] == "São Paulo"
+
+    @pytest.mark.asyncio
+    async def test_unknown_location_raises(self):
+        """Testa erro para localização inexistente."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            adapter = OpenMeteoWeatherAdapter(client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10))
+            with pytest.raises(ValueError):
+                await adapter.geocode_location("Atlantis")
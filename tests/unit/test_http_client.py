@@ -0,0 +1,96 @@
+"""
+Testes unitários para o cliente HTTP compartilhado.
+"""
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from config.settings import settings
+from infrastructure.adapters.outbound import http_client
+from infrastructure.adapters.outbound.http_client import (
+    build_http_client,
+    close_http_client,
+    get_http_client,
+    http_client_lifespan,
+)
+from infrastructure.adapters.inbound.a2a_server import build_asgi_app
+from infrastructure.adapters.outbound.forecast_cache import ForecastCache
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+
+
+class TestSharedHttpClient:
+    """Testes para o ciclo de vida do cliente compartilhado."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_until_closed(self):
+        """Testa reutilização e recriação após o fechamento."""
+        first = get_http_client()
+        assert get_http_client() is first
+
+        await close_http_client()
+        second = get_http_client()
+
+        assert first.is_closed
+        assert second is not first
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_client(self):
+        """Testa que o lifespan fecha as conexões no desligamento."""
+        async with http_client_lifespan():
+            client = get_http_client()
+            assert not client.is_closed
+
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_limits_and_timeouts_come_from_settings(self, monkeypatch):
+        """Testa timeouts configurados e fallback de HTTP/2 sem h2."""
+        monkeypatch.setattr(settings, "http_timeout", 3.0)
+        monkeypatch.setattr(settings, "http_connect_timeout", 1.5)
+        monkeypatch.setattr(settings, "http2_enabled", True)
+        monkeypatch.setattr(http_client, "HTTP2_AVAILABLE", False)
+
+        client = build_http_client()
+
+        assert client.timeout == httpx.Timeout(3.0, connect=1.5)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_weather_adapter_uses_shared_client(self, monkeypatch):
+        """Testa que o adaptador Open-Meteo usa o cliente do processo por padrão."""
+        calls = []
+        transport = httpx.MockTransport(lambda request: calls.append(request.url.path) or httpx.Response(
+            200, json={"current": {"temperature_2m": 21.0}}
+        ))
+        monkeypatch.setattr(http_client, "_shared_client", build_http_client(transport=transport))
+        adapter = OpenMeteoWeatherAdapter(
+            geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10), forecast_cache=ForecastCache()
+        )
+
+        first = await adapter.fetch_forecast(-23.55, -46.63, current="temperature_2m")
+        await adapter.fetch_forecast(-22.9, -43.2, current="temperature_2m")
+
+        assert adapter.http is get_http_client()
+        assert first["current"]["temperature_2m"] == 21.0
+        assert calls == ["/v1/forecast", "/v1/forecast"]
+        await close_http_client()
+
+
+class TestA2AAppLifespan:
+    """Testes do cliente compartilhado no app A2A."""
+
+    def test_push_sender_gets_open_client_after_lifespan_restart(self):
+        """Testa que o sender de push não fica com o cliente fechado no desligamento."""
+        app = build_asgi_app()
+        sender = app.state.push_sender
+
+        with TestClient(app):
+            first = sender._get_client()
+            assert not first.is_closed
+        assert first.is_closed
+
+        with TestClient(app):
+            second = sender._get_client()
+            assert second is not first and not second.is_closed
@@ -0,0 +1,78 @@
+"""
+Testes unitários para o roteador de intenções do DynamicAgent.
+"""
+import pytest
+
+from infrastructure.adapters.inbound.a2a_server import DynamicAgent, get_intent_router
+from infrastructure.adapters.inbound.intent_router import Intent, IntentRouter
+
+
+class TestIntentRouter:
+    """Testes para IntentRouter.route."""
+
+    def test_prefix_keyword_and_pattern_reasons(self):
+        """Testa o motivo registrado para cada tipo de regra."""
+        router = get_intent_router()
+
+        assert router.route("Clima em Recife").reason == "prefix 'clima'"
+        assert router.route("qual a previsao do tempo?").reason == "keyword 'previsão do tempo'"
+        assert router.route("quanto é 12,5 * 3?").reason == "pattern matched '12,5 * 3'"
+
+    def test_priority_decides_between_intents(self):
+        """Testa que a intenção de maior prioridade vence."""
+        router = get_intent_router()
+
+        assert router.route("calcule a documentação").intent == "info"
+        assert router.route("weather forecast 2+2").intent == "weather"
+
+    def test_hyphens_and_slashes_are_not_arithmetic(self):
+        """Testa textos com "-" e "/" que antes caíam na calculadora."""
+        router = get_intent_router()
+
+        assert router.route("e-mail de/para o time") is None
+        assert router.route("reunião em 18/10/2026 ou 2026-10-19") is None
+        assert router.route("a2a-sdk") is None
+
+    def test_keywords_match_whole_words(self):
+        """Testa que palavras-chave não casam dentro de outras palavras."""
+        router = IntentRouter([Intent(name="weather", keywords=["weather"])])
+
+        assert router.route("weatherproof jacket") is None
+        assert router.route("what's the WEATHER like").intent == "weather"
+
+    def test_register_recompiles(self):
+        """Testa o registro de novas intenções após a criação."""
+        router = IntentRouter()
+        assert router.route("traduza isto") is None
+
+        router.register(
+            Intent(name="translate", prefixes=["tradu"], priority=5),
+            Intent(name="code", patterns=[r"\bdef \w+\("], priority=1),
+        )
+
+        assert router.route("traduza isto").intent == "translate"
+        assert router.route("explique def soma(a, b)").intent == "code"
+        assert [i.name for i in router.intents] == ["translate", "code"]
+
+    def test_many_intents(self):
+        """Testa o roteamento correto com centenas de intenções registradas."""
+        router = IntentRouter(
+            Intent(name=f"intent-{i}", keywords=[f"palavra{i}", f"frase numero {i}"], priority=i % 7)
+            for i in range(500)
+        )
+
+        assert router.route("texto com frase numero 321 no meio").intent == "intent-321"
+        assert router.route("palavra5 e palavra6").intent == "intent-6"
+
+
+class TestDynamicAgent:
+    """Testes para DynamicAgent.handle."""
+
+    @pytest.mark.asyncio
+    async def test_routes_to_intent_response(self):
+        """Testa as respostas por intenção e o eco sem intenção."""
+        agent = DynamicAgent("dynamic")
+
+        assert "clima" in await agent.handle("clima em São Paulo")
+        assert "Cálculo" in await agent.handle("2+2")
+        assert await agent.handle("olá-mundo") == "Agente dynamic respondeu: 'olá-mundo'."
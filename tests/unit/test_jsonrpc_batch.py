@@ -0,0 +1,115 @@
+"""
+Testes unitários para as requisições JSON-RPC em lote no /a2a.
+"""
+import asyncio
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from config.settings import settings
+from infrastructure.adapters.inbound import a2a_server
+from infrastructure.adapters.inbound.jsonrpc_batch import JSONRPCBatchMiddleware
+
+
+def send_payload(request_id, text: str) -> dict:
+    return {
+        "jsonrpc": "2.0", "id": request_id, "method": "message/send",
+        "params": {"message": {
+            "role": "user", "messageId": f"m{request_id}", "kind": "message",
+            "parts": [{"kind": "text", "text": text}],
+        }},
+    }
+
+
+def response_text(response: dict) -> str:
+    return "".join(part["text"] for part in response["result"]["artifacts"][0]["parts"])
+
+
+class CountingAgent:
+    """Agente que registra quantas execuções estão em andamento ao mesmo tempo."""
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, agent_id: str) -> None:
+        pass
+
+    async def handle(self, text: str) -> str:
+        CountingAgent.active += 1
+        CountingAgent.max_active = max(CountingAgent.max_active, CountingAgent.active)
+        try:
+            # O primeiro elemento demora mais: a resposta não pode sair fora de ordem
+            await asyncio.sleep(0.1 if text == "0" else 0.02)
+            return f"eco {text}"
+        finally:
+            CountingAgent.active -= 1
+
+
+class TestBatchEndpoint:
+    """Testes de ponta a ponta via POST /a2a com arrays JSON-RPC."""
+
+    def test_batch_responses_follow_request_order(self):
+        """Testa respostas na ordem do lote, erros por elemento e requisição única."""
+        batch = [
+            send_payload(1, "calcule 2 + 2"),
+            {"jsonrpc": "2.0", "id": 2, "method": "unknown/method", "params": {}},
+            send_payload(3, "info sobre o sistema"),
+            {**send_payload(4, "oi"), "method": "message/stream"},
+            42,
+        ]
+
+        with TestClient(a2a_server.build_asgi_app()) as client:
+            responses = client.post("/a2a", json=batch).json()
+            single = client.post("/a2a", json=send_payload(5, "calcule 1 + 1")).json()
+
+        assert [r["id"] for r in responses] == [1, 2, 3, 4, None]
+        assert response_text(responses[0]) == "Cálculo solicitado. Integre MCP.calculate aqui."
+        assert responses[1]["error"]["code"] == -32601
+        assert "informacional" in response_text(responses[2])
+        assert [r["error"]["code"] for r in responses[3:]] == [-32600, -32600]
+        assert single["id"] == 5 and single["result"]["status"]["state"] == "completed"
+
+    def test_notifications_and_limits(self, monkeypatch):
+        """Testa notificações sem resposta, lote vazio e lote acima do limite."""
+        monkeypatch.setattr(settings, "a2a_batch_max_size", 2)
+        notification = {k: v for k, v in send_payload(1, "oi").items() if k != "id"}
+
+        with TestClient(a2a_server.build_asgi_app()) as client:
+            only_notifications = client.post("/a2a", json=[notification])
+            mixed = client.post("/a2a", json=[notification, send_payload(2, "oi")]).json()
+            empty = client.post("/a2a", json=[]).json()
+            too_large = client.post("/a2a", json=[send_payload(i, "oi") for i in range(3)]).json()
+
+        assert only_notifications.status_code == 204
+        assert [r["id"] for r in mixed] == [2]
+        assert empty["error"]["code"] == too_large["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_concurrently_up_to_the_cap(self, monkeypatch):
+        """Testa a execução em paralelo limitada e a ordem das respostas."""
+        monkeypatch.setattr(a2a_server, "DynamicAgent", CountingAgent)
+        monkeypatch.setattr(settings, "a2a_batch_max_concurrency", 3)
+        CountingAgent.max_active = 0
+
+        transport = httpx.ASGITransport(app=a2a_server.build_asgi_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/a2a", json=[send_payload(i, str(i)) for i in range(8)])
+
+        responses = response.json()
+        assert [response_text(r) for r in responses] == [f"eco {i}" for i in range(8)]
+        assert CountingAgent.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_other_paths_pass_through(self):
+        """Testa que só POST no caminho RPC é tratado como lote."""
+        async def app(scope, receive, send):
+            message = await receive()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": message["body"]})
+
+        transport = httpx.ASGITransport(app=JSONRPCBatchMiddleware(app, rpc_path="/a2a", max_concurrency=2, max_size=10))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/other", content=b"[1, 2]")
+
+        assert response.content == b"[1, 2]"
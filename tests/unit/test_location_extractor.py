@@ -0,0 +1,124 @@
+"""
+Testes unitários para a extração de localizações do WeatherAgent.
+"""
+import pytest
+
+from agents.a2a_weather_agent import WeatherAgent
+from agents.location_extractor import LocationExtractor, fold
+
+
+@pytest.fixture
+def extractor():
+    return LocationExtractor()
+
+
+class TestLocationExtractor:
+    """Testes para LocationExtractor.extract."""
+
+    def test_known_location_anywhere_in_text(self, extractor):
+        """Testa nomes conhecidos no meio da frase, sem depender de "em"."""
+        assert extractor.extract("Vai chover amanhã em São Paulo?") == ["São Paulo"]
+        assert extractor.extract("sao paulo vai chover?") == ["São Paulo"]
+
+    def test_multiple_locations_and_aliases(self, extractor):
+        """Testa várias localizações, grafias PT/EN e ordem de aparição."""
+        assert extractor.extract("weather in New York and Londres today?") == ["New York", "London"]
+        assert extractor.extract("previsão para Nova Iorque, Tóquio e Pequim") == ["New York", "Tokyo", "Beijing"]
+
+    def test_longest_match_wins(self, extractor):
+        """Testa que "Rio de Janeiro" prevalece sobre o apelido "Rio"."""
+        assert extractor.extract("Como está o tempo no Rio de Janeiro?") == ["Rio de Janeiro"]
+
+    def test_whole_words_and_ambiguous_names(self, extractor):
+        """Testa limites de palavra e nomes que também são palavras comuns."""
+        assert extractor.extract("vai chover no natal em Recife?") == ["Recife"]
+        assert extractor.extract("leia o diario do rio") == []
+        assert extractor.extract("clima em Natal, RN") == ["Natal, RN"]
+
+    def test_unknown_proper_nouns_after_prepositions(self, extractor):
+        """Testa nomes próprios desconhecidos após preposições."""
+        assert extractor.extract("clima em Juazeiro do Norte e Crato") == ["Juazeiro do Norte", "Crato"]
+        assert extractor.extract("Como está o tempo no Recife e em Petrolina?") == ["Recife", "Petrolina"]
+
+    def test_only_place_prepositions_introduce_unknown_names(self, extractor):
+        """Testa que "do"/"de"/"para"/"for" não transformam títulos em lugares."""
+        assert extractor.extract("Previsão do Tempo em Lisboa") == ["Lisboa"]
+        assert extractor.extract("Previsão de Chuva para Petrolina") == []
+
+    def test_time_and_weather_words_are_not_places(self, extractor):
+        """Testa as palavras de tempo/clima capitalizadas após preposições."""
+        assert extractor.extract("Previsão de Chuva para Amanhã em Recife") == ["Recife"]
+        assert extractor.extract("What is the weather for Tomorrow in Paris?") == ["Paris"]
+        assert extractor.extract("Chuva no Fim de Semana em Olinda?") == ["Olinda"]
+
+    def test_trailing_comma_qualifies_previous_place(self, extractor):
+        """Testa ", X" desconhecido no fim da lista como qualificador do lugar anterior."""
+        assert extractor.extract("clima em Paris, Texas") == ["Paris, Texas"]
+        assert extractor.extract("weather in Springfield, Missouri") == ["Springfield, Missouri"]
+        assert extractor.extract("clima em Recife, Olinda e Petrolina") == ["Recife", "Olinda", "Petrolina"]
+        assert extractor.extract("clima em Lisboa e Porto, Portugal") == ["Lisboa", "Porto, Portugal"]
+
+    def test_trailing_comma_between_known_places_is_a_list(self, extractor):
+        """Testa que ", X" com X conhecido continua sendo outro lugar da lista."""
+        assert extractor.extract("clima em Recife, Natal") == ["Recife", "Natal"]
+        assert extractor.extract("clima em São Paulo, Rio de Janeiro") == ["São Paulo", "Rio de Janeiro"]
+        assert extractor.extract("weather in London, Paris") == ["London", "Paris"]
+
+    def test_trailing_fallback_and_no_location(self, extractor):
+        """Testa o trecho após "em" como último recurso e texto sem localização."""
+        assert extractor.extract("clima em xique-xique hoje") == ["xique-xique"]
+        assert extractor.extract("como está o tempo?") == []
+
+    def test_fold_keeps_original_positions(self):
+        """Testa a normalização com mapeamento para o texto original."""
+        folded, positions = fold("São  Paulo!")
+
+        assert folded == "sao paulo"
+        assert positions[4] == 5
+
+
+class FakeWeather:
+    """Adaptador que apenas registra as localizações consultadas."""
+
+    def __init__(self) -> None:
+        self.locations = []
+
+    async def resolve_location(self, location):
+        self.locations.append(location)
+        return None
+
+
+class TestWeatherAgentHandle:
+    """Testes para WeatherAgent.handle com o extrator."""
+
+    @pytest.mark.asyncio
+    async def test_queries_every_location(self):
+        """Testa uma consulta por localização extraída."""
+        weather = FakeWeather()
+        agent = WeatherAgent(weather=weather)
+
+        reply = await agent.handle("weather in Recife and Salvador")
+
+        assert weather.locations == ["Recife", "Salvador"]
+        assert len(reply.splitlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_silent_default_location(self):
+        """Testa que, sem localização, nada é geocodificado."""
+        weather = FakeWeather()
+        agent = WeatherAgent(weather=weather)
+
+        reply = await agent.handle("vai chover?")
+
+        assert weather.locations == []
+        assert "localização" in reply
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_one_chunk_per_location(self):
+        """Testa o streaming de uma parte por localização consultada."""
+        agent = WeatherAgent(weather=FakeWeather())
+
+        chunks = [chunk async for chunk in agent.stream("clima em Recife e Natal")]
+
+        assert len(chunks) == 2
+        assert chunks[1].startswith("\n")
@@ -0,0 +1,236 @@
+"""
+Testes unitários para o adaptador de persistência em memória.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.domain.models import AgentType, ConversationContext, Message, PageDirection, Task
+from infrastructure.adapters.outbound.memory_adapter import InMemoryAdapter
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def adapter(clock):
+    return InMemoryAdapter(max_entries=1000, clock=clock)
+
+
+def make_message(index: int) -> Message:
+    return Message(
+        id=f"msg-{index:04d}",
+        content=f"mensagem {index}",
+        sender="agent",
+        metadata={"conversation_id": "conv-001"},
+        timestamp=BASE_TIME + timedelta(minutes=index),
+    )
+
+
+def make_task(index: int) -> Task:
+    return Task(
+        id=f"task-{index:03d}",
+        content="c",
+        agent_type=AgentType.ACTION,
+        created_at=BASE_TIME + timedelta(minutes=index),
+    )
+
+
+class TestMessages:
+    """Testes para mensagens e paginação."""
+
+    @pytest.mark.asyncio
+    async def test_messages_are_chronological(self, adapter):
+        """Testa ordem cronológica das mensagens."""
+        for i in range(3):
+            await adapter.save_message(make_message(i))
+
+        assert [m.id for m in await adapter.get_messages("conv-001")] == [
+            "msg-0000", "msg-0001", "msg-0002"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pagination_matches_redis_semantics(self, adapter):
+        """Testa paginação para trás e para frente."""
+        for i in range(10):
+            await adapter.save_message(make_message(i))
+
+        last = await adapter.get_messages_page("conv-001", limit=3)
+        before = await adapter.get_messages_page("conv-001", limit=3, cursor=last.next_cursor)
+        window = await adapter.get_messages_page(
+            "conv-001", limit=2, direction=PageDirection.FORWARD, since=BASE_TIME + timedelta(minutes=6)
+        )
+
+        assert [m.id for m in last.messages] == ["msg-0007", "msg-0008", "msg-0009"]
+        assert [m.id for m in before.messages] == ["msg-0004", "msg-0005", "msg-0006"]
+        assert [m.id for m in window.messages] == ["msg-0006", "msg-0007"]
+
+
+class TestTasks:
+    """Testes para tarefas e índice de status."""
+
+    @pytest.mark.asyncio
+    async def test_pending_tasks_are_oldest_first(self, adapter):
+        """Testa ordenação por created_at e transição de status."""
+        for index in [3, 1, 4, 2, 0]:
+            await adapter.save_task(make_task(index))
+        await adapter.update_task_status("task-002", "running", "ok")
+
+        pending = await adapter.get_pending_tasks(limit=3)
+        running = await adapter.get_tasks_by_status("running")
+
+        assert [t.id for t in pending] == ["task-000", "task-001", "task-003"]
+        assert [(t.id, t.result) for t in running] == [("task-002", "ok")]
+
+    @pytest.mark.asyncio
+    async def test_expired_tasks_leave_the_index(self, adapter, clock):
+        """Testa expiração de tarefas pelo heap de prazos."""
+        await adapter.save_task(make_task(1))
+        clock.now = 1800
+        await adapter.save_task(make_task(2))
+        clock.now = 3601
+
+        assert [t.id for t in await adapter.get_pending_tasks()] == ["task-002"]
+        assert await adapter.get_task("task-001") is None
+        assert adapter.stats()["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_updates_keep_index_consistent(self, adapter):
+        """Testa consistência do índice sob concorrência asyncio."""
+        await adapter.save_task(make_task(1))
+        statuses = ["running", "completed", "failed", "pending", "running"]
+
+        await asyncio.gather(*[adapter.update_task_status("task-001", s) for s in statuses])
+
+        final = (await adapter.get_task("task-001")).status
+        for status in set(statuses):
+            ids = [t.id for t in await adapter.get_tasks_by_status(status)]
+            assert ids == (["task-001"] if status == final else [])
+
+
+class TestBoundsAndIsolation:
+    """Testes para limite de memória e isolamento dos objetos."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, clock):
+        """Testa despejo LRU ao atingir o limite de entradas."""
+        adapter = InMemoryAdapter(max_entries=2, clock=clock)
+        await adapter.set("a", "1")
+        await adapter.set("b", "2")
+        await adapter.get("a")
+        await adapter.set("c", "3")
+
+        assert await adapter.exists("b") is False
+        assert (await adapter.get("a"), await adapter.get("c")) == ("1", "3")
+        assert adapter.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_estimated_size(self, clock):
+        """Testa o limite em bytes: valores grandes e listas de mensagens contam pelo tamanho."""
+        adapter = InMemoryAdapter(max_entries=1000, max_bytes=100, clock=clock)
+        await adapter.set("pequeno", "x" * 10)
+        await adapter.set("grande", "x" * 80)
+        assert adapter.stats()["bytes"] == 90
+
+        await adapter.set("outro", "x" * 20)
+
+        assert await adapter.exists("pequeno") is False
+        assert adapter.stats()["bytes"] == 100
+        assert adapter.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_message_list_size_grows_with_each_id(self, clock):
+        """Testa que a lista de IDs de uma conversação soma o tamanho de cada ID."""
+        adapter = InMemoryAdapter(max_entries=1000, max_bytes=0, clock=clock)
+        for index in range(3):
+            await adapter.save_message(make_message(index))
+        messages = sum(len(make_message(i).model_dump_json()) for i in range(3))
+
+        assert adapter.stats()["bytes"] == messages + 3 * (len("msg-0000") + 1)
+
+        adapter._delete("conversation_messages:conv-001")
+        assert adapter.stats()["bytes"] == messages
+
+    @pytest.mark.asyncio
+    async def test_evicted_task_leaves_the_index(self, clock):
+        """Testa que o despejo também limpa o índice de status."""
+        adapter = InMemoryAdapter(max_entries=2, clock=clock)
+        for index in range(3):
+            await adapter.save_task(make_task(index))
+
+        assert [t.id for t in await adapter.get_pending_tasks()] == ["task-001", "task-002"]
+
+    @pytest.mark.asyncio
+    async def test_cache_values_expire(self, adapter, clock):
+        """Testa TTL das chaves de cache."""
+        await adapter.set("k", "v", expire=10)
+        clock.now = 11
+
+        assert await adapter.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_returned_objects_are_copies(self, adapter):
+        """Testa que alterações do chamador não afetam o armazenamento."""
+        await adapter.save_conversation(ConversationContext(id="conv-001"))
+        loaded = await adapter.get_conversation("conv-001")
+        loaded.current_agent = "alterado"
+
+        assert (await adapter.get_conversation("conv-001")).current_agent is None
+        await adapter.delete_conversation("conv-001")
+        assert await adapter.get_conversation("conv-001") is None
+
+
+class TestBackendParity:
+    """Testes de comportamento igual entre os backends em memória e Redis."""
+
+    @pytest.fixture(params=["memory", "redis"])
+    def backend(self, request):
+        if request.param == "memory":
+            return InMemoryAdapter(max_entries=1000)
+        fakeredis = pytest.importorskip("fakeredis")
+        from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+        return RedisAdapter(client=fakeredis.FakeAsyncRedis(decode_responses=True))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", ["abc", "-1", "1.5"])
+    @pytest.mark.parametrize("direction", [PageDirection.BACKWARD, PageDirection.FORWARD])
+    async def test_invalid_cursor_raises(self, backend, cursor, direction):
+        """Testa que um cursor inválido levanta ValueError nos dois backends."""
+        await backend.save_message(make_message(1))
+
+        with pytest.raises(ValueError):
+            await backend.get_messages_page("conv-001", limit=2, cursor=cursor, direction=direction)
+
+    @pytest.mark.asyncio
+    async def test_cursor_past_the_end_is_an_empty_page(self, backend):
+        """Testa que um cursor além do fim devolve página vazia nos dois backends."""
+        for index in range(3):
+            await backend.save_message(make_message(index))
+
+        page = await backend.get_messages_page("conv-001", limit=2, cursor="10", direction=PageDirection.FORWARD)
+
+        assert page.messages == [] and page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_backward_cursor_past_the_end_starts_at_the_newest(self, backend):
+        """Testa que um cursor BACKWARD além do fim não pula mensagens nos dois backends."""
+        for index in range(10):
+            await backend.save_message(make_message(index))
+
+        page = await backend.get_messages_page("conv-001", limit=3, cursor="12", direction=PageDirection.BACKWARD)
+
+        assert [m.content for m in page.messages] == ["mensagem 7", "mensagem 8", "mensagem 9"]
+        assert page.next_cursor == "7"
@@ -0,0 +1,230 @@
+"""
+Testes unitários para a entrega assíncrona de notificações push.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from a2a.server.tasks import InMemoryPushNotificationConfigStore
+from a2a.types import PushNotificationConfig, Task, TaskState, TaskStatus
+from starlette.testclient import TestClient
+
+from infrastructure.adapters.inbound.a2a_server import build_asgi_app
+from infrastructure.adapters.outbound.push_delivery import QueuedPushNotificationSender
+
+
+def make_task(state: TaskState, task_id: str = "t1") -> Task:
+    return Task(id=task_id, context_id="ctx-1", status=TaskStatus(state=state))
+
+
+class Receiver:
+    """Webhook em memória (httpx.MockTransport) que registra os estados recebidos."""
+
+    def __init__(self, statuses=(), gate: asyncio.Event = None) -> None:
+        self.statuses = list(statuses)
+        self.gate = gate
+        self.received = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            await asyncio.sleep(0)
+            body = json.loads(request.content)
+            self.received.append((str(request.url), body["status"]["state"], request.headers.get("x-a2a-notification-token")))
+            status = self.statuses.pop(0) if self.statuses else 200
+            headers = {"Retry-After": "7"} if status == 429 else {}
+            return httpx.Response(status, headers=headers)
+        finally:
+            self.active -= 1
+
+
+async def make_sender(receiver: Receiver, urls=("http://hook/a",), task_ids=("t1",), sleep=None, **options):
+    store = InMemoryPushNotificationConfigStore()
+    for task_id in task_ids:
+        for i, url in enumerate(urls):
+            await store.set_info(task_id, PushNotificationConfig(id=str(i), url=url, token="secret"))
+    delays = []
+
+    async def recorded_sleep(delay: float) -> None:
+        delays.append(delay)
+        if sleep is not None:
+            await sleep(delay)
+
+    options = {"workers": 2, "max_attempts": 3, "backoff_base": 0.5, "backoff_max": 30, "rand": lambda: 1.0, **options}
+    sender = QueuedPushNotificationSender(
+        config_store=store, client=httpx.AsyncClient(transport=httpx.MockTransport(receiver)), sleep=recorded_sleep, **options
+    )
+    return sender, delays
+
+
+class TestQueuedPushNotificationSender:
+    """Testes para QueuedPushNotificationSender."""
+
+    @pytest.mark.asyncio
+    async def test_send_does_not_wait_for_slow_receiver(self):
+        """Testa que send_notification volta antes de o webhook responder."""
+        gate = asyncio.Event()
+        receiver = Receiver(gate=gate)
+        sender, _ = await make_sender(receiver)
+
+        await asyncio.wait_for(sender.send_notification(make_task(TaskState.completed)), timeout=0.1)
+        assert receiver.received == []
+
+        gate.set()
+        await sender.close()
+        assert receiver.received == [("http://hook/a", "completed", "secret")]
+        assert sender.stats()["delivered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced_in_order(self):
+        """Testa a coalescência e a ordem das entregas de uma mesma tarefa."""
+        gate = asyncio.Event()
+        receiver = Receiver(gate=gate)
+        sender, _ = await make_sender(receiver)
+
+        await sender.send_notification(make_task(TaskState.submitted))
+        await asyncio.sleep(0.01)
+        for state in (TaskState.working, TaskState.working, TaskState.completed):
+            await sender.send_notification(make_task(state))
+        gate.set()
+        await sender.close()
+
+        assert [state for _, state, _ in receiver.received] == ["submitted", "completed"]
+        stats = sender.stats()
+        assert (stats["enqueued"], stats["coalesced"], stats["delivered"]) == (2, 2, 2)
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_and_retry_after(self):
+        """Testa as retentativas em 5xx/429 com backoff exponencial e Retry-After."""
+        receiver = Receiver(statuses=[503, 429, 200])
+        sender, delays = await make_sender(receiver, max_attempts=4)
+
+        await sender.send_notification(make_task(TaskState.completed))
+        await sender.close()
+
+        assert delays == [0.5, 7.0]
+        stats = sender.stats()
+        assert (stats["retries"], stats["delivered"], stats["failed"]) == (2, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_dead_lettered(self):
+        """Testa dead letters para erro 4xx e tentativas esgotadas."""
+        receiver = Receiver(statuses=[404, 500, 500, 500])
+        sender, delays = await make_sender(receiver, task_ids=("t1", "t2"), workers=1)
+
+        await sender.send_notification(make_task(TaskState.completed, "t1"))
+        await sender.send_notification(make_task(TaskState.failed, "t2"))
+        await sender.close()
+
+        letters = sender.dead_letters()
+        assert [(d.task_id, d.reason, d.attempts) for d in letters] == [("t1", "http_404", 1), ("t2", "http_500", 3)]
+        assert letters[1].state == "failed" and letters[1].url == "http://hook/a"
+        assert delays == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_does_not_block_other_deliveries(self):
+        """Testa que a espera do backoff de um webhook fora do ar não ocupa o worker."""
+        received = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request.url.host)
+            return httpx.Response(503 if request.url.host == "dead" else 200)
+
+        store = InMemoryPushNotificationConfigStore()
+        await store.set_info("t1", PushNotificationConfig(id="0", url="http://dead/hook"))
+        await store.set_info("t2", PushNotificationConfig(id="0", url="http://alive/hook"))
+        backoff = asyncio.Event()
+
+        async def sleep(_delay: float) -> None:
+            await backoff.wait()
+
+        sender = QueuedPushNotificationSender(
+            config_store=store,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            workers=1,
+            max_attempts=2,
+            sleep=sleep,
+        )
+        await sender.send_notification(make_task(TaskState.completed, "t1"))
+        await sender.send_notification(make_task(TaskState.completed, "t2"))
+        for _ in range(50):
+            if sender.stats()["delivered"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == ["dead", "alive"]
+        assert sender.stats()["retries_scheduled"] == 1
+
+        backoff.set()
+        await sender.close()
+        assert received == ["dead", "alive", "dead"]
+        assert [(d.task_id, d.reason, d.attempts) for d in sender.dead_letters()] == [("t1", "http_503", 2)]
+
+    @pytest.mark.asyncio
+    async def test_newer_state_waits_for_scheduled_retry(self):
+        """Testa que um estado novo não passa à frente de uma retentativa agendada."""
+        backoff = asyncio.Event()
+        receiver = Receiver(statuses=[503])
+
+        async def sleep(_delay: float) -> None:
+            await backoff.wait()
+
+        sender, delays = await make_sender(receiver, sleep=sleep)
+        await sender.send_notification(make_task(TaskState.working))
+        for _ in range(50):
+            if delays:
+                break
+            await asyncio.sleep(0.01)
+        await sender.send_notification(make_task(TaskState.completed))
+        await asyncio.sleep(0.01)
+        assert [state for _, state, _ in receiver.received] == ["working"]
+
+        backoff.set()
+        await sender.close()
+        assert [state for _, state, _ in receiver.received] == ["working", "completed"]
+        assert (sender.stats()["superseded"], sender.stats()["delivered"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_dead_letters_without_blocking(self):
+        """Testa o descarte com a fila cheia."""
+        sender, _ = await make_sender(Receiver(), task_ids=("t1", "t2"), queue_size=1)
+
+        await sender.send_notification(make_task(TaskState.completed, "t1"))
+        await sender.send_notification(make_task(TaskState.completed, "t2"))
+        await sender.close()
+
+        assert sender.stats()["dropped"] == 1
+        assert [(d.task_id, d.reason) for d in sender.dead_letters()] == [("t2", "queue_full")]
+
+    @pytest.mark.asyncio
+    async def test_connections_are_limited_per_endpoint(self):
+        """Testa o limite de entregas simultâneas para o mesmo host."""
+        receiver = Receiver()
+        task_ids = [f"t{i}" for i in range(6)]
+        sender, _ = await make_sender(
+            receiver, urls=("http://hook/a", "http://hook/b"), task_ids=task_ids, workers=6, max_per_endpoint=2
+        )
+
+        for task_id in task_ids:
+            await sender.send_notification(make_task(TaskState.completed, task_id))
+        await sender.close()
+
+        assert len(receiver.received) == 12
+        assert receiver.max_active == 2
+
+
+class TestPushDeliveryEndpoint:
+    """Teste do app montado com o sender em fila."""
+
+    def test_push_deliveries_stats(self):
+        """Testa a exposição das métricas de entrega em /push/deliveries."""
+        with TestClient(build_asgi_app()) as client:
+            stats = client.get("/push/deliveries").json()
+
+        assert stats["queue_depth"] == 0 and stats["dead_letters"] == []
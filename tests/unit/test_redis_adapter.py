@@ -0,0 +1,370 @@
+"""
+Testes unitários para o adaptador Redis (usando fakeredis).
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from config.settings import ConversationStorageMode
+from core.domain.models import AgentType, ConversationContext, Message, PageDirection, Task
+from infrastructure.adapters.outbound import redis_adapter
+from infrastructure.adapters.outbound.codecs import MSGPACK_AVAILABLE, MsgPackCodec
+from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+
+
+@pytest.fixture
+def client():
+    """Cliente Redis em memória."""
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def adapter(client):
+    """Adaptador Redis usando o cliente em memória."""
+    return RedisAdapter(client=client)
+
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_message(index: int, conversation_id: str = "conv-001") -> Message:
+    return Message(
+        id=f"msg-{index:04d}",
+        content=f"mensagem {index}",
+        sender="agent",
+        metadata={"conversation_id": conversation_id},
+        timestamp=BASE_TIME + timedelta(minutes=index),
+    )
+
+
+class TestGetMessages:
+    """Testes para leitura em lote de mensagens."""
+
+    @pytest.mark.asyncio
+    async def test_returns_messages_in_chronological_order(self, adapter):
+        """Testa que as mensagens retornam em ordem cronológica."""
+        for i in range(5):
+            await adapter.save_message(make_message(i))
+
+        messages = await adapter.get_messages("conv-001")
+
+        assert [m.id for m in messages] == [f"msg-{i:04d}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_skips_expired_messages(self, adapter, client):
+        """Testa que IDs de mensagens expiradas são ignorados."""
+        for i in range(3):
+            await adapter.save_message(make_message(i))
+        await client.delete("message:msg-0001")
+
+        messages = await adapter.get_messages("conv-001")
+
+        assert [m.id for m in messages] == ["msg-0000", "msg-0002"]
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_conversations(self, adapter, monkeypatch):
+        """Testa leitura em vários blocos de MGET."""
+        monkeypatch.setattr(redis_adapter, "MGET_CHUNK_SIZE", 3)
+        for i in range(10):
+            await adapter.save_message(make_message(i))
+
+        messages = await adapter.get_messages("conv-001")
+
+        assert [m.id for m in messages] == [f"msg-{i:04d}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_unknown_conversation_returns_empty(self, adapter):
+        """Testa conversação inexistente."""
+        assert await adapter.get_messages("missing") == []
+
+
+class TestMessagePagination:
+    """Testes para leitura paginada de mensagens."""
+
+    @pytest_asyncio.fixture
+    async def conversation(self, adapter):
+        for i in range(10):
+            await adapter.save_message(make_message(i))
+
+    @staticmethod
+    def ids(page):
+        return [int(m.id.split("-")[1]) for m in page.messages]
+
+    @pytest.mark.asyncio
+    async def test_backward_returns_last_turns(self, adapter, conversation):
+        """Testa que a primeira página traz as últimas N mensagens."""
+        page = await adapter.get_messages_page("conv-001", limit=3)
+
+        assert self.ids(page) == [7, 8, 9]
+        assert page.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_backward_cursor_is_stable_under_new_messages(self, adapter, conversation):
+        """Testa que o cursor não se desloca quando chegam mensagens novas."""
+        first = await adapter.get_messages_page("conv-001", limit=3)
+        await adapter.save_message(make_message(10))
+
+        second = await adapter.get_messages_page("conv-001", limit=3, cursor=first.next_cursor)
+
+        assert self.ids(second) == [4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_forward_pages_cover_history(self, adapter, conversation):
+        """Testa paginação do início para o fim."""
+        pages = [
+            page async for page in adapter.iter_messages(
+                "conv-001", page_size=4, direction=PageDirection.FORWARD
+            )
+        ]
+
+        assert [self.ids(p) for p in pages] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert pages[-1].next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_backward_iteration_stops_at_since(self, adapter, conversation):
+        """Testa que a iteração para na primeira mensagem anterior a since."""
+        since = BASE_TIME + timedelta(minutes=4)
+
+        pages = [
+            page async for page in adapter.iter_messages("conv-001", page_size=3, since=since)
+        ]
+
+        assert [self.ids(p) for p in pages] == [[7, 8, 9], [4, 5, 6]]
+
+    @pytest.mark.asyncio
+    async def test_forward_since_starts_at_window(self, adapter, conversation):
+        """Testa paginação para frente a partir de since."""
+        since = BASE_TIME + timedelta(minutes=6)
+
+        page = await adapter.get_messages_page(
+            "conv-001", limit=2, direction=PageDirection.FORWARD, since=since
+        )
+
+        assert self.ids(page) == [6, 7]
+        assert page.next_cursor == "8"
+
+
+class TestSaveMessage:
+    """Testes para gravação de mensagens."""
+
+    @pytest.mark.asyncio
+    async def test_save_message_sets_ttl_on_body_and_index(self, adapter, client):
+        """Testa que corpo e índice da conversação recebem TTL."""
+        await adapter.save_message(make_message(1))
+
+        assert 0 < await client.ttl("message:msg-0001") <= 86400
+        assert 0 < await client.ttl("conversation_messages:conv-001") <= 86400
+
+
+class TestTasks:
+    """Testes para gravação, índice por status e transições de tarefas."""
+
+    @staticmethod
+    def make_task(index: int, **kwargs) -> Task:
+        return Task(
+            id=f"task-{index:03d}",
+            content="c",
+            agent_type=AgentType.ACTION,
+            created_at=BASE_TIME + timedelta(minutes=index),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_task_indexes_by_status(self, adapter, client):
+        """Testa indexação da tarefa pelo status."""
+        await adapter.save_task(self.make_task(1))
+
+        assert await client.zrange("tasks_by_status:pending", 0, -1) == ["task-001"]
+        assert (await adapter.get_task("task-001")).status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_index_keys_do_not_expire(self, adapter, client):
+        """Testa que as chaves do índice não têm TTL próprio."""
+        await adapter.save_task(self.make_task(1))
+
+        assert await client.ttl("tasks_by_status:pending") == -1
+        assert 0 < await client.ttl("task:task-001") <= 3600
+
+    @pytest.mark.asyncio
+    async def test_update_task_moves_between_status_indexes(self, adapter, client):
+        """Testa que a atualização remove o ID do índice do status anterior."""
+        task = self.make_task(1)
+        await adapter.save_task(task)
+
+        await adapter.update_task(task.model_copy(update={"status": "completed", "result": "ok"}))
+
+        assert await client.zrange("tasks_by_status:pending", 0, -1) == []
+        assert await client.zrange("tasks_by_status:completed", 0, -1) == ["task-001"]
+        assert (await adapter.get_task("task-001")).result == "ok"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_keep_single_status(self, adapter, client):
+        """Testa que atualizações concorrentes deixam o ID em um único índice."""
+        task = self.make_task(1)
+        await adapter.save_task(task)
+        statuses = ["running", "completed", "failed", "running", "completed"]
+
+        await asyncio.gather(*[
+            adapter.update_task(task.model_copy(update={"status": status}))
+            for status in statuses
+        ])
+
+        final = (await adapter.get_task("task-001")).status
+        memberships = {
+            status: await client.zscore(f"tasks_by_status:{status}", "task-001")
+            for status in set(statuses) | {"pending"}
+        }
+        assert [s for s, score in memberships.items() if score is not None] == [final]
+
+    @pytest.mark.asyncio
+    async def test_update_task_status(self, adapter, client):
+        """Testa atualização de status por ID."""
+        await adapter.save_task(self.make_task(1))
+
+        await adapter.update_task_status("task-001", "completed", "feito")
+
+        task = await adapter.get_task("task-001")
+        assert (task.status, task.result) == ("completed", "feito")
+        assert task.updated_at is not None
+        assert await client.hget("task_status", "task-001") == "completed"
+
+    @pytest.mark.asyncio
+    async def test_get_pending_tasks_returns_oldest_first(self, adapter):
+        """Testa que as pendentes vêm ordenadas por created_at."""
+        for index in [3, 1, 4, 2, 0]:
+            await adapter.save_task(self.make_task(index))
+        await adapter.update_task_status("task-002", "running")
+
+        pending = await adapter.get_pending_tasks(limit=3)
+
+        assert [t.id for t in pending] == ["task-000", "task-001", "task-003"]
+
+    @pytest.mark.asyncio
+    async def test_expired_tasks_leave_the_index(self, adapter, client):
+        """Testa limpeza de tarefas expiradas do índice."""
+        await adapter.save_task(self.make_task(1))
+        await adapter.save_task(self.make_task(2))
+        # Simula a expiração de task-001
+        await client.delete("task:task-001")
+        await client.zadd("tasks_expiry", {"task-001": 0})
+
+        pending = await adapter.get_pending_tasks()
+
+        assert [t.id for t in pending] == ["task-002"]
+        assert await client.zrange("tasks_by_status:pending", 0, -1) == ["task-002"]
+        assert await client.hget("task_status", "task-001") is None
+
+
+class TestAppendOnlyConversation:
+    """Testes para o armazenamento de conversações em modo append."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, adapter):
+        """Testa gravação e reconstrução da conversação."""
+        conversation = ConversationContext(
+            id="conv-001",
+            messages=[make_message(i) for i in range(3)],
+            current_agent="weather",
+        )
+
+        await adapter.save_conversation(conversation)
+        loaded = await adapter.get_conversation("conv-001")
+
+        assert loaded == conversation
+
+    @pytest.mark.asyncio
+    async def test_new_turn_appends_only_delta(self, adapter, client):
+        """Testa que um novo turno não regrava mensagens anteriores."""
+        conversation = ConversationContext(id="conv-001", messages=[make_message(0)])
+        await adapter.save_conversation(conversation)
+
+        # Alterações em mensagens já gravadas não são reenviadas
+        conversation.messages[0].content = "alterada localmente"
+        conversation.messages.append(make_message(1))
+        await adapter.save_conversation(conversation)
+
+        log = await client.lrange("conversation_log:conv-001", 0, -1)
+        assert len(log) == 2
+        assert Message.model_validate_json(log[0]).content == "mensagem 0"
+
+    @pytest.mark.asyncio
+    async def test_fresh_adapter_resumes_from_stored_length(self, adapter, client):
+        """Testa continuação por outra instância do adaptador."""
+        conversation = ConversationContext(id="conv-001", messages=[make_message(0)])
+        await adapter.save_conversation(conversation)
+
+        other = RedisAdapter(client=client)
+        conversation.messages.append(make_message(1))
+        await other.save_conversation(conversation)
+
+        assert await client.llen("conversation_log:conv-001") == 2
+
+    @pytest.mark.asyncio
+    async def test_shortened_conversation_is_rewritten(self, adapter, client):
+        """Testa regravação quando a conversação perde mensagens."""
+        conversation = ConversationContext(
+            id="conv-001", messages=[make_message(i) for i in range(3)]
+        )
+        await adapter.save_conversation(conversation)
+
+        conversation.messages = conversation.messages[1:]
+        await adapter.save_conversation(conversation)
+
+        loaded = await adapter.get_conversation("conv-001")
+        assert [m.id for m in loaded.messages] == ["msg-0001", "msg-0002"]
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_blob(self, client):
+        """Testa leitura de conversações gravadas no modo blob."""
+        conversation = ConversationContext(id="conv-001", messages=[make_message(0)])
+        await RedisAdapter(client, ConversationStorageMode.BLOB).save_conversation(conversation)
+
+        loaded = await RedisAdapter(client, ConversationStorageMode.APPEND).get_conversation("conv-001")
+
+        assert loaded == conversation
+
+
+@pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack não instalado")
+class TestMsgPackStorage:
+    """Testes do adaptador com codec binário e respostas em bytes."""
+
+    @pytest.fixture
+    def binary_adapter(self):
+        client = fakeredis.FakeAsyncRedis(decode_responses=False)
+        return RedisAdapter(client=client, codec=MsgPackCodec())
+
+    @pytest.mark.asyncio
+    async def test_messages_and_pages(self, binary_adapter):
+        """Testa mensagens e paginação com msgpack."""
+        for i in range(5):
+            await binary_adapter.save_message(make_message(i))
+
+        messages = await binary_adapter.get_messages("conv-001")
+        page = await binary_adapter.get_messages_page("conv-001", limit=2)
+
+        assert [m.id for m in messages] == [f"msg-{i:04d}" for i in range(5)]
+        assert [m.id for m in page.messages] == ["msg-0003", "msg-0004"]
+
+    @pytest.mark.asyncio
+    async def test_conversation_and_tasks(self, binary_adapter):
+        """Testa conversações e tarefas com msgpack."""
+        conversation = ConversationContext(id="conv-001", messages=[make_message(0)])
+        await binary_adapter.save_conversation(conversation)
+        await binary_adapter.save_task(Task(id="task-001", content="c", agent_type=AgentType.ACTION))
+        await binary_adapter.update_task_status("task-001", "running")
+
+        assert await binary_adapter.get_conversation("conv-001") == conversation
+        assert (await binary_adapter.get_task("task-001")).status == "running"
+        assert await binary_adapter.get_tasks_by_status("running") != []
+
+    @pytest.mark.asyncio
+    async def test_reads_keys_written_as_json(self, binary_adapter):
+        """Testa leitura de chaves antigas gravadas em JSON."""
+        legacy = RedisAdapter(client=binary_adapter.redis_client)
+        await legacy.save_task(Task(id="task-001", content="c", agent_type=AgentType.ACTION))
+
+        assert (await binary_adapter.get_task("task-001")).id == "task-001"
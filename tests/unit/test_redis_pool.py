@@ -0,0 +1,112 @@
+"""
+Testes unitários para o pool de conexões Redis compartilhado.
+"""
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from starlette.testclient import TestClient
+
+from a2a_main import build_main_app
+from infrastructure.adapters.inbound.a2a_server import build_asgi_app
+from infrastructure.adapters.outbound import redis_pool
+from infrastructure.adapters.outbound.redis_adapter import RedisAdapter
+from infrastructure.adapters.outbound.redis_pool import InstrumentedConnectionPool
+
+
+@pytest.fixture
+def pool():
+    """Pool instrumentado sobre conexões fakeredis."""
+    from fakeredis.aioredis import FakeConnection
+    return InstrumentedConnectionPool(
+        connection_class=FakeConnection,
+        server=fakeredis.FakeServer(),
+        max_connections=2,
+        timeout=0.05,
+        decode_responses=True,
+    )
+
+
+class TestInstrumentedConnectionPool:
+    """Testes para métricas do pool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_connections_under_concurrency(self, pool):
+        """Testa que o pool não abre mais conexões que o limite."""
+        # Timeout folgado: aqui só interessa o reuso, não estourar a espera
+        pool.timeout = 5.0
+        client = redis.Redis(connection_pool=pool)
+        await client.set("key", "value")
+
+        results = await asyncio.gather(*[client.get("key") for _ in range(20)])
+
+        stats = pool.stats()
+        assert results == ["value"] * 20
+        assert stats["open"] <= 2
+        assert stats["connects"] == stats["open"]
+        assert stats["acquisitions"] == 21
+        assert stats["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_acquire_timeouts(self, pool):
+        """Testa contagem de esperas que estouram o timeout."""
+        held = [await pool.get_connection(), await pool.get_connection()]
+
+        with pytest.raises(RedisConnectionError):
+            await pool.get_connection()
+
+        stats = pool.stats()
+        assert stats["in_use"] == 2
+        assert stats["acquire_timeouts"] == 1
+        assert stats["wait_ms_max"] >= 50
+        for connection in held:
+            await pool.release(connection)
+
+
+class TestSharedPool:
+    """Testes para o compartilhamento do pool entre adaptadores."""
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_one_pool(self):
+        """Testa que adaptadores distintos usam o mesmo pool."""
+        first, second = RedisAdapter(), RedisAdapter()
+
+        first_client = await first._get_client()
+        second_client = await second._get_client()
+
+        assert first_client.connection_pool is second_client.connection_pool
+        assert [s["target"] for s in redis_pool.get_pool_stats()] == ["localhost:6379/0"]
+
+        await first.close()
+        assert redis_pool.get_shared_pool() is second_client.connection_pool
+        await redis_pool.close_shared_pools()
+        assert redis_pool.get_pool_stats() == []
+
+
+class TestPoolLifespan:
+    """Testes do fechamento dos pools no desligamento dos apps."""
+
+    def test_a2a_app_exposes_stats_and_closes_pools(self):
+        """Testa a rota /redis/pool e o fechamento dos pools no lifespan do A2A."""
+        app = build_asgi_app()
+
+        with TestClient(app) as client:
+            redis_pool.get_shared_pool()
+            response = client.get("/redis/pool")
+            assert response.status_code == 200
+            assert [s["target"] for s in response.json()] == ["localhost:6379/0"]
+            assert response.json()[0]["in_use"] == 0
+
+        assert redis_pool.get_pool_stats() == []
+
+    def test_main_app_closes_pools(self):
+        """Testa que o lifespan da API principal também fecha os pools."""
+        with TestClient(build_main_app()):
+            redis_pool.get_shared_pool()
+            assert len(redis_pool.get_pool_stats()) == 1
+
+        assert redis_pool.get_pool_stats() == []
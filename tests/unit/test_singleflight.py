@@ -0,0 +1,172 @@
+"""
+Testes unitários para a coalescência de chamadas (single-flight).
+"""
+import asyncio
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from core.domain.models import GeoLocation
+from infrastructure.adapters.inbound.a2a_server import build_asgi_app
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+from infrastructure.adapters.outbound import singleflight
+from infrastructure.adapters.outbound.singleflight import SingleFlight, get_single_flight
+
+
+class GatedCall:
+    def __init__(self, result="ok", error=None) -> None:
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.gate.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    """Testes para o grupo single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Testa que chamadas concorrentes com a mesma chave executam uma vez."""
+        flight = SingleFlight()
+        call = GatedCall()
+
+        waiters = [asyncio.create_task(flight.do("k", call)) for _ in range(10)]
+        await asyncio.sleep(0)
+        call.gate.set()
+
+        assert await asyncio.gather(*waiters) == ["ok"] * 10
+        assert call.calls == 1
+        assert flight.stats()["deduplicated"] == 9
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter_and_are_not_kept(self):
+        """Testa propagação de erros e nova execução após a falha."""
+        flight = SingleFlight()
+        failing = GatedCall(error=RuntimeError("upstream"))
+
+        waiters = [asyncio.create_task(flight.do("k", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        failing.gate.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats()["errors"] == 1
+
+        retry = GatedCall()
+        retry.gate.set()
+        assert await flight.do("k", retry) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Testa que cancelar um chamador mantém a chamada compartilhada."""
+        flight = SingleFlight()
+        call = GatedCall()
+        first = asyncio.create_task(flight.do("k", call))
+        second = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        call.gate.set()
+
+        assert await second == "ok"
+        assert first.cancelled()
+        assert call.cancelled is False
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancellation_cancels_call(self):
+        """Testa que a chamada é cancelada quando ninguém mais aguarda."""
+        flight = SingleFlight()
+        call = GatedCall()
+        waiter = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert call.cancelled is True
+        assert flight.in_flight() == 0
+
+
+class TestWeatherCoalescing:
+    """Testes para coalescência nas consultas meteorológicas."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_geocoding_misses_share_one_lookup(self):
+        """Testa uma única consulta para grafias diferentes ao mesmo tempo."""
+        calls = []
+
+        async def loader(location):
+            calls.append(location)
+            await asyncio.sleep(0.01)
+            return GeoLocation(name="Recife", country="Brasil", latitude=-8.05, longitude=-34.9)
+
+        cache = GeocodingCache(ttl=100, negative_ttl=10, flight=SingleFlight())
+        results = await asyncio.gather(*[cache.get_or_load(name, loader) for name in ["Recife", "recife ", "RECIFE"]])
+
+        assert len(calls) == 1
+        assert {r.name for r in results} == {"Recife"}
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_forecasts_share_one_request(self):
+        """Testa uma única requisição de previsão para pedidos idênticos."""
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"current": {"temperature_2m": 28.0}})
+
+        flight = SingleFlight()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = OpenMeteoWeatherAdapter(
+                client=client, geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10), flight=flight
+            )
+            adapter.forecast_cache = None
+            results = await asyncio.gather(*[
+                adapter.fetch_forecast(-8.05, -34.9, current=variables)
+                for variables in ["temperature_2m,weather_code", "weather_code,temperature_2m"] * 3
+            ])
+
+        assert len(requests) == 1
+        assert all(r["current"]["temperature_2m"] == 28.0 for r in results)
+        assert flight.stats()["deduplicated"] == 5
+
+
+class TestSingleFlightEndpoint:
+    """Teste da exposição das métricas de coalescência no app A2A."""
+
+    def test_stats_are_exposed(self, monkeypatch):
+        """Testa que /singleflight mostra execuções e chamadas deduplicadas."""
+        monkeypatch.setattr(singleflight, "_shared_flights", {})
+        flight = get_single_flight("geocoding")
+
+        async def burst():
+            call = GatedCall()
+            waiters = [asyncio.ensure_future(flight.do("recife", call)) for _ in range(3)]
+            await asyncio.sleep(0)
+            call.gate.set()
+            await asyncio.gather(*waiters)
+
+        asyncio.run(burst())
+        with TestClient(build_asgi_app()) as client:
+            stats = client.get("/singleflight").json()
+
+        assert [(s["name"], s["executions"], s["deduplicated"]) for s in stats] == [("geocoding", 1, 2)]
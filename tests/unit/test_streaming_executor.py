@@ -0,0 +1,147 @@
+"""
+Testes unitários para o streaming incremental do DynamicAgentExecutor.
+"""
+import asyncio
+import json
+
+import pytest
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import (
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from starlette.testclient import TestClient
+
+from infrastructure.adapters.inbound.a2a_server import DynamicAgentExecutor, DynamicAgentFactory, build_asgi_app
+
+
+class GatedAgent:
+    """Agente que só termina a resposta depois que o teste recebe a primeira parte."""
+
+    def __init__(self, agent_id: str) -> None:
+        self.release = asyncio.Event()
+
+    async def stream(self, text: str):
+        yield "primeira "
+        await self.release.wait()
+        yield "segunda"
+
+
+class FailingAgent:
+    def __init__(self, agent_id: str) -> None:
+        pass
+
+    async def handle(self, text: str) -> str:
+        raise RuntimeError("upstream indisponível")
+
+
+def request_context(text: str, agent_id: str = "dynamic") -> RequestContext:
+    message = Message(
+        role=Role.user, message_id="m1", parts=[Part(root=TextPart(text=text))], metadata={"agent_id": agent_id}
+    )
+    return RequestContext(request=MessageSendParams(message=message))
+
+
+async def next_event(queue: EventQueue, kind):
+    while True:
+        event = await asyncio.wait_for(queue.dequeue_event(), timeout=1)
+        if isinstance(event, kind):
+            return event
+
+
+class TestDynamicAgentExecutor:
+    """Testes para a publicação de eventos na fila."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_published_before_the_agent_finishes(self):
+        """Testa que a primeira parte chega antes de o agente concluir."""
+        factory = DynamicAgentFactory(max_size=10, idle_ttl=60, builder=GatedAgent)
+        executor = DynamicAgentExecutor(factory)
+        queue = EventQueue()
+
+        running = asyncio.create_task(executor.execute(request_context("oi"), queue))
+        first = await next_event(queue, TaskArtifactUpdateEvent)
+        assert first.artifact.parts[0].root.text == "primeira "
+        assert not first.append and not running.done()
+
+        (await factory.get_or_create_agent("dynamic")).release.set()
+        second = await next_event(queue, TaskArtifactUpdateEvent)
+        closing = await next_event(queue, TaskArtifactUpdateEvent)
+        status = await next_event(queue, TaskStatusUpdateEvent)
+        await running
+
+        assert second.append and second.artifact.artifact_id == first.artifact.artifact_id
+        assert closing.last_chunk and closing.artifact.parts == []
+        assert status.status.state == TaskState.completed and status.final
+
+    @pytest.mark.asyncio
+    async def test_agents_without_stream_send_one_chunk(self):
+        """Testa agentes só com handle e a falha publicada como status."""
+        executor = DynamicAgentExecutor(DynamicAgentFactory(max_size=10, idle_ttl=60, builder=FailingAgent))
+        queue = EventQueue()
+
+        await executor.execute(request_context("oi"), queue)
+        status = await next_event(queue, TaskStatusUpdateEvent)
+        while status.status.state == TaskState.working:
+            status = await next_event(queue, TaskStatusUpdateEvent)
+
+        assert status.status.state == TaskState.failed
+        assert "upstream indisponível" in status.status.message.parts[0].root.text
+
+
+class TestMessageStreamEndpoint:
+    """Testes de ponta a ponta via JSON-RPC message/stream."""
+
+    def test_sse_events_carry_the_response(self):
+        """Testa os eventos SSE de status e artifact até a conclusão."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "message/stream",
+            "params": {"message": {
+                "role": "user", "messageId": "m1", "kind": "message",
+                "parts": [{"kind": "text", "text": "calcule 2 + 2"}],
+            }},
+        }
+
+        with TestClient(build_asgi_app()) as client:
+            with client.stream("POST", "/a2a", json=payload) as response:
+                events = [
+                    json.loads(line[len("data:"):])["result"]
+                    for line in response.iter_lines() if line.startswith("data:")
+                ]
+
+        kinds = [event["kind"] for event in events]
+        assert kinds[0] == "task" and "artifact-update" in kinds
+        text = "".join(
+            part["text"] for event in events if event["kind"] == "artifact-update"
+            for part in event["artifact"]["parts"]
+        )
+        assert text == "Cálculo solicitado. Integre MCP.calculate aqui."
+        assert events[-1]["status"]["state"] == "completed"
+
+    def test_send_returns_only_real_parts(self):
+        """Testa que message/send não devolve partes vazias no artifact."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "message/send",
+            "params": {"message": {
+                "role": "user", "messageId": "m1", "kind": "message",
+                "parts": [{"kind": "text", "text": "calc 1+1"}],
+            }},
+        }
+
+        with TestClient(build_asgi_app()) as client:
+            task = client.post("/a2a", json=payload).json()["result"]
+
+        assert task["artifacts"][0]["parts"] == [
+            {"kind": "text", "text": "Cálculo solicitado. Integre MCP.calculate aqui."}
+        ]
@@ -0,0 +1,122 @@
+"""
+Testes unitários para previsões em lote (adaptador e ferramenta MCP).
+"""
+import httpx
+import pytest
+import pytest_asyncio
+
+from fastmcp import Client
+
+from config.settings import settings
+from infrastructure.adapters.outbound.forecast_cache import ForecastCache
+from infrastructure.adapters.outbound.geocoding_cache import GeocodingCache
+from infrastructure.adapters.outbound.open_meteo_adapter import OpenMeteoWeatherAdapter
+from mcp_servers import weather_server
+
+CITIES = {
+    "recife": (-8.05, -34.9),
+    "natal": (-5.79, -35.21),
+    "salvador": (-12.97, -38.5),
+}
+
+
+class FakeOpenMeteo:
+    """Transporte que responde geocodificação e previsões com várias coordenadas."""
+
+    def __init__(self, fail_forecast: bool = False) -> None:
+        self.forecast_requests = []
+        self.geocoding_requests = []
+        self.fail_forecast = fail_forecast
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if "search" in request.url.path:
+            self.geocoding_requests.append(request.url.params["name"])
+            coordinates = CITIES.get(request.url.params["name"].lower())
+            if coordinates is None:
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json={"results": [
+                {"name": request.url.params["name"], "country": "Brasil",
+                 "latitude": coordinates[0], "longitude": coordinates[1]}
+            ]})
+        self.forecast_requests.append(request)
+        if self.fail_forecast:
+            return httpx.Response(503)
+        latitudes = request.url.params["latitude"].split(",")
+        longitudes = request.url.params["longitude"].split(",")
+        items = [
+            {"latitude": float(lat), "longitude": float(lon), "current": {"temperature_2m": float(lat)}}
+            for lat, lon in zip(latitudes, longitudes)
+        ]
+        return httpx.Response(200, json=items if len(items) > 1 else items[0])
+
+
+@pytest.fixture
+def upstream():
+    return FakeOpenMeteo()
+
+
+@pytest_asyncio.fixture
+async def adapter(upstream):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream)) as client:
+        yield OpenMeteoWeatherAdapter(
+            client=client,
+            geocoding_cache=GeocodingCache(ttl=100, negative_ttl=10),
+            forecast_cache=ForecastCache(max_entries=100),
+        )
+
+
+class TestFetchForecastBatch:
+    """Testes para previsões de várias coordenadas."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_all_coordinates(self, adapter, upstream):
+        """Testa uma única requisição para várias coordenadas, na ordem da entrada."""
+        results = await adapter.fetch_forecast_batch(list(CITIES.values()), current="temperature_2m")
+
+        assert len(upstream.forecast_requests) == 1
+        assert [r["current"]["temperature_2m"] for r in results] == [-8.0, -5.8, -13.0]
+
+    @pytest.mark.asyncio
+    async def test_cached_and_duplicate_cells_are_not_refetched(self, adapter, upstream):
+        """Testa que células em cache ou repetidas não voltam ao upstream."""
+        await adapter.fetch_forecast(-8.05, -34.9, current="temperature_2m")
+
+        results = await adapter.fetch_forecast_batch(
+            [(-8.05, -34.9), (-5.79, -35.21), (-5.8, -35.2)], current="temperature_2m"
+        )
+
+        assert len(upstream.forecast_requests) == 2
+        assert upstream.forecast_requests[1].url.params["latitude"] == "-5.8"
+        assert results[1] == results[2] and results[1] is not results[2]
+
+    @pytest.mark.asyncio
+    async def test_chunks_respect_max_locations(self, adapter, upstream, monkeypatch):
+        """Testa divisão em lotes e erro por coordenada quando um lote falha."""
+        monkeypatch.setattr(settings, "weather_batch_max_locations", 2)
+        upstream.fail_forecast = True
+
+        results = await adapter.fetch_forecast_batch(list(CITIES.values()), current="temperature_2m")
+
+        assert len(upstream.forecast_requests) == 2
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+class TestGetWeatherBatchTool:
+    """Testes para a ferramenta MCP get_weather_batch."""
+
+    @pytest.mark.asyncio
+    async def test_reports_errors_per_location(self, adapter, upstream, monkeypatch):
+        """Testa resultados por localização, com erro apenas na inexistente."""
+        monkeypatch.setattr(weather_server, "weather", adapter)
+
+        async with Client(weather_server.mcp) as client:
+            result = await client.call_tool(
+                "get_weather_batch", {"locations": ["Recife", "Atlantis", "Natal", "Salvador"]}
+            )
+
+        payload = result.data
+        assert [r["query"] for r in payload["results"]] == ["Recife", "Atlantis", "Natal", "Salvador"]
+        assert payload["errors"] == 1
+        assert "error" in payload["results"][1]
+        assert payload["results"][2]["location"]["name"] == "Natal"
+        assert len(upstream.forecast_requests) == 1